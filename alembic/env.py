@@ -0,0 +1,84 @@
+"""
+Alembic 마이그레이션 환경
+애플리케이션(init_db)에서 실행하면 전달받은 커넥션을 사용하고,
+alembic CLI에서 실행하면 비동기 엔진으로 접속해 마이그레이션을 실행합니다.
+"""
+import asyncio
+from logging.config import fileConfig
+
+from alembic import context
+from sqlalchemy.engine import Connection
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.pool import NullPool
+
+from app.core.database import Base, get_async_database_url
+from app.models import project, team, job, blob  # noqa: F401 (메타데이터 등록)
+from config import settings
+
+config = context.config
+target_metadata = Base.metadata
+
+
+def include_name(name, type_, parent_names) -> bool:
+    """autogenerate 비교 대상 (트리거로 관리되는 전문 검색 인덱스 테이블 제외)"""
+    if type_ == "table":
+        return not name.startswith("search_index")
+    return True
+
+
+def _database_url() -> str:
+    """마이그레이션 대상 URL (sqlalchemy.url 지정이 없으면 Settings 사용)"""
+    return config.get_main_option("sqlalchemy.url") or settings.database_url
+
+
+def run_migrations_offline() -> None:
+    """SQL 스크립트 생성 (--sql)"""
+    context.configure(
+        url=_database_url(),
+        target_metadata=target_metadata,
+        literal_binds=True,
+        dialect_opts={"paramstyle": "named"},
+        include_name=include_name,
+        render_as_batch=True
+    )
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+def do_run_migrations(connection: Connection) -> None:
+    """주어진 동기 커넥션으로 마이그레이션 실행"""
+    context.configure(
+        connection=connection,
+        target_metadata=target_metadata,
+        include_name=include_name,
+        render_as_batch=True
+    )
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+async def run_async_migrations() -> None:
+    """비동기 엔진으로 접속해 마이그레이션 실행"""
+    url = settings.async_database_url or get_async_database_url(_database_url())
+    engine = create_async_engine(url, poolclass=NullPool)
+    async with engine.connect() as connection:
+        await connection.run_sync(do_run_migrations)
+    await engine.dispose()
+
+
+def run_migrations_online() -> None:
+    """온라인 마이그레이션 (애플리케이션 커넥션 또는 CLI)"""
+    connection = config.attributes.get("connection")
+    if connection is not None:
+        do_run_migrations(connection)
+        return
+
+    if config.config_file_name is not None:
+        fileConfig(config.config_file_name)
+    asyncio.run(run_async_migrations())
+
+
+if context.is_offline_mode():
+    run_migrations_offline()
+else:
+    run_migrations_online()
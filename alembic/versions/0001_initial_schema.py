@@ -0,0 +1,165 @@
+"""initial schema
+
+기존 Base.metadata.create_all로 만들어진 스키마를 기준으로 합니다.
+create_all로 생성된 기존 데이터베이스에서도 실행할 수 있도록 없는 테이블만 생성합니다.
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-17
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "0001"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def _create_table(name: str, *columns, indexes=()) -> None:
+    """테이블이 없을 때만 생성"""
+    if sa.inspect(op.get_bind()).has_table(name):
+        return
+    op.create_table(name, *columns)
+    for column, unique in indexes:
+        op.create_index(f"ix_{name}_{column}", name, [column], unique=unique)
+
+
+def upgrade() -> None:
+    _create_table(
+        "projects",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("name", sa.String(255), nullable=False),
+        sa.Column("description", sa.Text()),
+        sa.Column("status", sa.String(50)),
+        sa.Column("start_date", sa.DateTime(), nullable=True),
+        sa.Column("end_date", sa.DateTime(), nullable=True),
+        sa.Column("created_at", sa.DateTime()),
+        sa.Column("updated_at", sa.DateTime()),
+        indexes=[("id", False)]
+    )
+    _create_table(
+        "wbs_items",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("project_id", sa.Integer(), sa.ForeignKey("projects.id")),
+        sa.Column("parent_id", sa.Integer(), sa.ForeignKey("wbs_items.id"), nullable=True),
+        sa.Column("title", sa.String(255), nullable=False),
+        sa.Column("description", sa.Text()),
+        sa.Column("level", sa.Integer()),
+        sa.Column("order", sa.Integer()),
+        sa.Column("estimated_hours", sa.Integer()),
+        sa.Column("assigned_to", sa.String(100)),
+        sa.Column("skill_level_required", sa.String(50)),
+        sa.Column("status", sa.String(50)),
+        sa.Column("created_at", sa.DateTime()),
+        indexes=[("id", False)]
+    )
+    _create_table(
+        "meetings",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("project_id", sa.Integer(), sa.ForeignKey("projects.id")),
+        sa.Column("title", sa.String(255), nullable=False),
+        sa.Column("description", sa.Text()),
+        sa.Column("meeting_date", sa.DateTime()),
+        sa.Column("participants", sa.JSON()),
+        sa.Column("audio_file_path", sa.String(500)),
+        sa.Column("transcript", sa.Text()),
+        sa.Column("summary", sa.Text()),
+        sa.Column("action_items", sa.JSON()),
+        sa.Column("created_at", sa.DateTime()),
+        indexes=[("id", False)]
+    )
+    _create_table(
+        "documents",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("project_id", sa.Integer(), sa.ForeignKey("projects.id"), nullable=True),
+        sa.Column("project_name", sa.String(255), nullable=True),
+        sa.Column("title", sa.String(255), nullable=False),
+        sa.Column("document_type", sa.String(100)),
+        sa.Column("description", sa.Text()),
+        sa.Column("content", sa.Text()),
+        sa.Column("file_path", sa.String(500)),
+        sa.Column("status", sa.String(50)),
+        sa.Column("created_at", sa.DateTime()),
+        sa.Column("updated_at", sa.DateTime()),
+        indexes=[("id", False)]
+    )
+    _create_table(
+        "team_members",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("name", sa.String(100), nullable=False),
+        sa.Column("email", sa.String(255), nullable=False),
+        sa.Column("position", sa.String(100), nullable=False),
+        sa.Column("department", sa.String(100), nullable=True),
+        sa.Column("experience_years", sa.Integer()),
+        sa.Column("skills", sa.Text(), nullable=True),
+        sa.Column("skill_level", sa.String(20)),
+        sa.Column("availability", sa.Boolean()),
+        sa.Column("hourly_rate", sa.Integer(), nullable=True),
+        sa.Column("notes", sa.Text(), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+        sa.Column("updated_at", sa.DateTime(timezone=True)),
+        indexes=[("id", False), ("name", False), ("email", True)]
+    )
+    _create_table(
+        "project_members",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("project_id", sa.Integer(), sa.ForeignKey("projects.id"), nullable=False),
+        sa.Column("team_member_id", sa.Integer(), sa.ForeignKey("team_members.id"), nullable=False),
+        sa.Column("role", sa.String(100), nullable=False),
+        sa.Column("responsibility", sa.Text(), nullable=True),
+        sa.Column("allocation_percentage", sa.Integer()),
+        sa.Column("start_date", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("end_date", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("is_active", sa.Boolean()),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+        sa.Column("updated_at", sa.DateTime(timezone=True)),
+        indexes=[("id", False)]
+    )
+    _create_table(
+        "project_templates",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("name", sa.String(200), nullable=False),
+        sa.Column("description", sa.Text(), nullable=True),
+        sa.Column("category", sa.String(100), nullable=False),
+        sa.Column("estimated_duration", sa.Integer(), nullable=True),
+        sa.Column("required_skills", sa.Text(), nullable=True),
+        sa.Column("team_size", sa.Integer()),
+        sa.Column("template_data", sa.Text(), nullable=True),
+        sa.Column("is_active", sa.Boolean()),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+        sa.Column("updated_at", sa.DateTime(timezone=True)),
+        indexes=[("id", False)]
+    )
+    _create_table(
+        "wbs_generation_jobs",
+        sa.Column("id", sa.String(32), primary_key=True),
+        sa.Column("project_id", sa.Integer()),
+        sa.Column("status", sa.String(50)),
+        sa.Column("backend", sa.String(20)),
+        sa.Column("stages", sa.JSON()),
+        sa.Column("request_payload", sa.JSON()),
+        sa.Column("result", sa.JSON()),
+        sa.Column("error", sa.Text()),
+        sa.Column("created_at", sa.DateTime()),
+        sa.Column("started_at", sa.DateTime(), nullable=True),
+        sa.Column("finished_at", sa.DateTime(), nullable=True),
+        sa.Column("updated_at", sa.DateTime()),
+        indexes=[("project_id", False)]
+    )
+
+
+def downgrade() -> None:
+    for name in (
+        "wbs_generation_jobs",
+        "project_templates",
+        "project_members",
+        "team_members",
+        "documents",
+        "meetings",
+        "wbs_items",
+        "projects",
+    ):
+        op.drop_table(name)
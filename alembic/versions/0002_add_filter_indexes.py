@@ -0,0 +1,70 @@
+"""add foreign-key and filter indexes
+
+프로젝트 화면의 조회 조건(project_id, parent_id, is_active 등)에 인덱스를 추가하고
+프로젝트별 활성 멤버십을 팀원당 하나로 제한하는 부분 유니크 인덱스를 생성합니다.
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-17
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "0002"
+down_revision = "0001"
+branch_labels = None
+depends_on = None
+
+# (인덱스명, 테이블, 컬럼)
+INDEXES = [
+    ("ix_wbs_items_project_id", "wbs_items", ["project_id"]),
+    ("ix_wbs_items_parent_id", "wbs_items", ["parent_id"]),
+    ("ix_meetings_project_id", "meetings", ["project_id"]),
+    ("ix_documents_project_id", "documents", ["project_id"]),
+    ("ix_project_members_project_active", "project_members", ["project_id", "is_active"]),
+    ("ix_project_members_member_active", "project_members", ["team_member_id", "is_active"]),
+    ("ix_team_members_department", "team_members", ["department"]),
+    ("ix_team_members_skill_level", "team_members", ["skill_level"]),
+    ("ix_team_members_availability", "team_members", ["availability"]),
+    ("ix_project_templates_active_category", "project_templates", ["is_active", "category"]),
+]
+
+ACTIVE_MEMBER_INDEX = "uq_project_members_active_member"
+
+
+def _existing_indexes(table: str) -> set:
+    """테이블의 기존 인덱스명 (create_all로 이미 생성된 경우 건너뛰기 위함)"""
+    return {index["name"] for index in sa.inspect(op.get_bind()).get_indexes(table)}
+
+
+def upgrade() -> None:
+    for name, table, columns in INDEXES:
+        if name not in _existing_indexes(table):
+            op.create_index(name, table, columns)
+
+    if ACTIVE_MEMBER_INDEX not in _existing_indexes("project_members"):
+        # 중복된 활성 멤버십은 가장 최근 것만 남기고 비활성화
+        op.execute(
+            sa.text(
+                "UPDATE project_members SET is_active = :inactive "
+                "WHERE is_active = :active AND id NOT IN ("
+                "SELECT MAX(id) FROM project_members WHERE is_active = :active "
+                "GROUP BY project_id, team_member_id)"
+            ).bindparams(active=True, inactive=False)
+        )
+        op.create_index(
+            ACTIVE_MEMBER_INDEX,
+            "project_members",
+            ["project_id", "team_member_id"],
+            unique=True,
+            sqlite_where=sa.text("is_active = 1"),
+            postgresql_where=sa.text("is_active = true")
+        )
+
+
+def downgrade() -> None:
+    op.drop_index(ACTIVE_MEMBER_INDEX, table_name="project_members")
+    for name, table, _ in reversed(INDEXES):
+        op.drop_index(name, table_name=table)
@@ -0,0 +1,57 @@
+"""add content-addressed blob store
+
+업로드 파일을 SHA-256 기준으로 한 벌만 저장하기 위한 blobs(참조 카운트) 테이블과
+문서/회의 녹음 파일의 내용 해시 컬럼을 추가합니다.
+기존 uploads/documents, uploads/meetings 파일은 경로를 그대로 유지합니다(content_hash 없음).
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-17
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "0003"
+down_revision = "0002"
+branch_labels = None
+depends_on = None
+
+# (테이블, 컬럼, 인덱스명)
+COLUMNS = [
+    ("documents", sa.Column("file_name", sa.String(255), nullable=True), None),
+    ("documents", sa.Column("content_hash", sa.String(64), nullable=True), "ix_documents_content_hash"),
+    ("meetings", sa.Column("audio_content_hash", sa.String(64), nullable=True), "ix_meetings_audio_content_hash"),
+]
+
+
+def upgrade() -> None:
+    inspector = sa.inspect(op.get_bind())
+    if not inspector.has_table("blobs"):
+        op.create_table(
+            "blobs",
+            sa.Column("sha256", sa.String(64), primary_key=True),
+            sa.Column("size", sa.BigInteger(), nullable=False),
+            sa.Column("ref_count", sa.Integer(), nullable=False),
+            sa.Column("created_at", sa.DateTime()),
+            sa.Column("updated_at", sa.DateTime()),
+        )
+        op.create_index("ix_blobs_updated_at", "blobs", ["updated_at"])
+
+    for table, column, index in COLUMNS:
+        existing = {c["name"] for c in inspector.get_columns(table)}
+        if column.name not in existing:
+            op.add_column(table, column)
+        if index and index not in {i["name"] for i in inspector.get_indexes(table)}:
+            op.create_index(index, table, [column.name])
+
+
+def downgrade() -> None:
+    for table, column, index in reversed(COLUMNS):
+        with op.batch_alter_table(table) as batch_op:
+            if index:
+                batch_op.drop_index(index)
+            batch_op.drop_column(column.name)
+    op.drop_index("ix_blobs_updated_at", table_name="blobs")
+    op.drop_table("blobs")
@@ -0,0 +1,40 @@
+"""add extracted text cache
+
+첨부파일에서 추출한 평문을 내용 해시(SHA-256) 기준으로 저장하는 extracted_texts 테이블과
+문서별 텍스트 추출 상태 컬럼을 추가합니다.
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-17
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "0004"
+down_revision = "0003"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    inspector = sa.inspect(op.get_bind())
+    if not inspector.has_table("extracted_texts"):
+        op.create_table(
+            "extracted_texts",
+            sa.Column("content_hash", sa.String(64), primary_key=True),
+            sa.Column("extractor", sa.String(20)),
+            sa.Column("text", sa.Text(), nullable=True),
+            sa.Column("char_count", sa.Integer()),
+            sa.Column("error", sa.Text(), nullable=True),
+            sa.Column("created_at", sa.DateTime()),
+        )
+    if "text_status" not in {c["name"] for c in inspector.get_columns("documents")}:
+        op.add_column("documents", sa.Column("text_status", sa.String(20), nullable=True))
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("documents") as batch_op:
+        batch_op.drop_column("text_status")
+    op.drop_table("extracted_texts")
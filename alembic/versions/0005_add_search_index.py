@@ -0,0 +1,131 @@
+"""add full-text search index
+
+문서(title, description, content, 추출 텍스트), 회의(title, description, transcript, summary),
+WBS 아이템(title, description)을 하나의 전문 검색 인덱스로 관리합니다.
+
+- SQLite: FTS5 가상 테이블 (trigram 토크나이저, 한국어 조사/어미가 붙은 단어도 부분 일치)
+- PostgreSQL: tsvector 생성 컬럼 + GIN 인덱스 ('simple' 구성, 접두 일치)
+
+원본 테이블의 INSERT/UPDATE/DELETE 트리거로 인덱스를 갱신하므로
+ORM을 거치지 않는 대량 INSERT도 인덱스에 반영됩니다.
+search_index.id(rowid)는 entity_id * 4 + 유형 코드입니다.
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-17
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "0005"
+down_revision = "0004"
+branch_labels = None
+depends_on = None
+
+# (원본 테이블, 유형, 유형 코드, 본문 SQL 식, 인덱스 갱신 대상 컬럼)
+SOURCES = [
+    (
+        "documents", "document", 1,
+        "coalesce({row}.description, '') || ' ' || coalesce({row}.content, '') || ' ' || "
+        "coalesce((SELECT text FROM extracted_texts WHERE content_hash = {row}.content_hash), '')",
+        ["project_id", "title", "description", "content", "content_hash", "text_status"],
+    ),
+    (
+        "meetings", "meeting", 2,
+        "coalesce({row}.description, '') || ' ' || coalesce({row}.transcript, '') || ' ' || "
+        "coalesce({row}.summary, '')",
+        ["project_id", "title", "description", "transcript", "summary"],
+    ),
+    (
+        "wbs_items", "wbs_item", 3,
+        "coalesce({row}.description, '')",
+        ["project_id", "title", "description"],
+    ),
+]
+
+
+def _values(entity_type: str, code: int, body: str, row: str) -> str:
+    return (
+        f"{row}.id * 4 + {code}, '{entity_type}', {row}.id, {row}.project_id, "
+        f"coalesce({row}.title, ''), trim({body.format(row=row)})"
+    )
+
+
+def _upgrade_sqlite() -> None:
+    op.execute(
+        "CREATE VIRTUAL TABLE IF NOT EXISTS search_index USING fts5("
+        "entity_type UNINDEXED, entity_id UNINDEXED, project_id UNINDEXED, title, body, "
+        "tokenize = 'trigram')"
+    )
+    for table, entity_type, code, body, columns in SOURCES:
+        insert = (
+            "INSERT INTO search_index(rowid, entity_type, entity_id, project_id, title, body) "
+            f"VALUES ({_values(entity_type, code, body, 'NEW')});"
+        )
+        delete = f"DELETE FROM search_index WHERE rowid = OLD.id * 4 + {code};"
+        op.execute(f"CREATE TRIGGER search_{table}_ai AFTER INSERT ON {table} BEGIN {insert} END")
+        op.execute(
+            f"CREATE TRIGGER search_{table}_au AFTER UPDATE OF {', '.join(columns)} ON {table} "
+            f"BEGIN {delete} {insert} END"
+        )
+        op.execute(f"CREATE TRIGGER search_{table}_ad AFTER DELETE ON {table} BEGIN {delete} END")
+        # 기존 데이터 색인
+        op.execute(
+            "INSERT INTO search_index(rowid, entity_type, entity_id, project_id, title, body) "
+            f"SELECT {_values(entity_type, code, body, table)} FROM {table}"
+        )
+
+
+def _upgrade_postgresql() -> None:
+    op.execute(
+        "CREATE TABLE IF NOT EXISTS search_index ("
+        "id BIGINT PRIMARY KEY, entity_type VARCHAR(20) NOT NULL, entity_id INTEGER NOT NULL, "
+        "project_id INTEGER, title TEXT, body TEXT, "
+        "tsv tsvector GENERATED ALWAYS AS ("
+        "setweight(to_tsvector('simple', coalesce(title, '')), 'A') || "
+        "setweight(to_tsvector('simple', coalesce(body, '')), 'B')) STORED)"
+    )
+    op.execute("CREATE INDEX IF NOT EXISTS ix_search_index_tsv ON search_index USING GIN (tsv)")
+    for table, entity_type, code, body, columns in SOURCES:
+        op.execute(
+            f"CREATE OR REPLACE FUNCTION search_index_{table}() RETURNS trigger AS $$ "
+            "BEGIN "
+            "IF TG_OP = 'DELETE' THEN "
+            f"DELETE FROM search_index WHERE id = OLD.id * 4 + {code}; RETURN OLD; "
+            "END IF; "
+            "INSERT INTO search_index(id, entity_type, entity_id, project_id, title, body) "
+            f"VALUES ({_values(entity_type, code, body, 'NEW')}) "
+            "ON CONFLICT (id) DO UPDATE SET project_id = EXCLUDED.project_id, "
+            "title = EXCLUDED.title, body = EXCLUDED.body; "
+            "RETURN NEW; "
+            "END $$ LANGUAGE plpgsql"
+        )
+        op.execute(
+            f"CREATE TRIGGER search_{table} AFTER INSERT OR UPDATE OF {', '.join(columns)} OR DELETE "
+            f"ON {table} FOR EACH ROW EXECUTE FUNCTION search_index_{table}()"
+        )
+        op.execute(
+            "INSERT INTO search_index(id, entity_type, entity_id, project_id, title, body) "
+            f"SELECT {_values(entity_type, code, body, table)} FROM {table} "
+            "ON CONFLICT (id) DO NOTHING"
+        )
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name == "postgresql":
+        _upgrade_postgresql()
+    else:
+        _upgrade_sqlite()
+
+
+def downgrade() -> None:
+    postgresql = op.get_bind().dialect.name == "postgresql"
+    for table, _, _, _, _ in SOURCES:
+        if postgresql:
+            op.execute(f"DROP TRIGGER IF EXISTS search_{table} ON {table}")
+            op.execute(f"DROP FUNCTION IF EXISTS search_index_{table}()")
+        else:
+            for suffix in ("ai", "au", "ad"):
+                op.execute(f"DROP TRIGGER IF EXISTS search_{table}_{suffix}")
+    op.execute("DROP TABLE IF EXISTS search_index")
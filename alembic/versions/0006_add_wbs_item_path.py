@@ -0,0 +1,85 @@
+"""add materialized path to wbs items
+
+WBS 아이템에 조상 ID 경로(path, 예: "/1/5/") 컬럼과 인덱스를 추가하고 기존 트리를 채웁니다.
+하위 트리, 조상, 집계를 재귀 조회 없이 인덱스 범위 조회 한 번으로 처리하기 위한 컬럼입니다.
+
+wbs_items에는 전문 검색 트리거가 걸려 있으므로 테이블을 재생성하는 batch 모드 대신
+ALTER TABLE ADD/DROP COLUMN을 사용합니다.
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-17
+"""
+from typing import Dict, Optional
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "0006"
+down_revision = "0005"
+branch_labels = None
+depends_on = None
+
+BATCH_SIZE = 5000
+
+
+def _backfill_paths() -> None:
+    """parent_id로 각 아이템의 조상 경로와 레벨 계산 (부모가 없는 아이템은 루트로 취급)
+
+    레벨은 경로로 정해지는 값(조상 수 + 1, wbs_tree.path_level)으로 함께 맞춥니다.
+    """
+    bind = op.get_bind()
+    parents: Dict[int, Optional[int]] = dict(
+        bind.execute(sa.text("SELECT id, parent_id FROM wbs_items")).all()
+    )
+    paths: Dict[int, str] = {}
+
+    def resolve(item_id: int) -> str:
+        # 깊이와 무관하게 동작하도록 반복문으로 조상을 거슬러 올라감 (순환 참조는 끊음)
+        chain = []
+        current = item_id
+        while current not in paths:
+            chain.append(current)
+            parent_id = parents.get(current)
+            if parent_id is None or parent_id not in parents or parent_id in chain:
+                paths[current] = "/"
+                chain.pop()
+                break
+            current = parent_id
+        for node in reversed(chain):
+            parent_id = parents[node]
+            paths[node] = f"{paths[parent_id]}{parent_id}/"
+        return paths[item_id]
+
+    levels: Dict[int, Optional[int]] = dict(
+        bind.execute(sa.text("SELECT id, level FROM wbs_items")).all()
+    )
+    updates = []
+    for item_id in parents:
+        path = resolve(item_id)
+        level = path.count("/")
+        if path != "/" or levels.get(item_id) != level:
+            updates.append({"id": item_id, "path": path, "level": level})
+    statement = sa.text("UPDATE wbs_items SET path = :path, level = :level WHERE id = :id")
+    for start in range(0, len(updates), BATCH_SIZE):
+        bind.execute(statement, updates[start:start + BATCH_SIZE])
+
+
+def upgrade() -> None:
+    inspector = sa.inspect(op.get_bind())
+    if "path" not in {c["name"] for c in inspector.get_columns("wbs_items")}:
+        path_type = sa.String(500).with_variant(sa.String(500, collation="C"), "postgresql")
+        op.add_column(
+            "wbs_items",
+            sa.Column("path", path_type, nullable=False, server_default="/")
+        )
+        _backfill_paths()
+    if "ix_wbs_items_path" not in {i["name"] for i in inspector.get_indexes("wbs_items")}:
+        op.create_index("ix_wbs_items_path", "wbs_items", ["path"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_wbs_items_path", table_name="wbs_items")
+    op.execute("ALTER TABLE wbs_items DROP COLUMN path")
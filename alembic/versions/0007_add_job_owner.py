@@ -0,0 +1,29 @@
+"""add owner to wbs generation jobs
+
+프로세스 내(inprocess) 작업을 실행하는 프로세스("호스트:PID")를 기록하는 owner 컬럼을 추가합니다.
+재시작 시 소유 프로세스가 종료된 작업만 실패로 표시하기 위한 컬럼입니다.
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-17
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "0007"
+down_revision = "0006"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    inspector = sa.inspect(op.get_bind())
+    if "owner" not in {c["name"] for c in inspector.get_columns("wbs_generation_jobs")}:
+        op.add_column("wbs_generation_jobs", sa.Column("owner", sa.String(100), nullable=True))
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("wbs_generation_jobs") as batch_op:
+        batch_op.drop_column("owner")
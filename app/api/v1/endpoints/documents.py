@@ -1,17 +1,23 @@
 """
 문서 관련 API 엔드포인트
 """
-from fastapi import APIRouter, HTTPException, Depends, UploadFile, File
-from fastapi.responses import FileResponse
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, BackgroundTasks, HTTPException, Depends, UploadFile, File, Request, Response
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List, Optional
 from pydantic import BaseModel
 import os
-import uuid
 from datetime import datetime
 
 from app.core.database import get_db
+from app.core.pagination import PageParams, paginate
+from app.core.blob_store import blob_store
+from app.core.file_responses import file_download_response
+from app.core.uploads import UploadTooLargeError, safe_filename
 from app.models.project import Document
+from app.services.blob_service import store_upload, acquire_blob
+from app.services.document_text_service import ensure_document_text, extract_document_text_task
+from config import settings
 
 router = APIRouter()
 
@@ -23,6 +29,7 @@ class DocumentCreate(BaseModel):
     type: str
     description: str = ""
     file_path: Optional[str] = None
+    file_name: Optional[str] = None
 
 class DocumentResponse(BaseModel):
     id: int
@@ -33,6 +40,9 @@ class DocumentResponse(BaseModel):
     description: str = ""
     content: Optional[str] = None
     file_path: Optional[str] = None
+    file_name: Optional[str] = None
+    content_hash: Optional[str] = None
+    text_status: Optional[str] = None
     status: str
     created_at: Optional[str] = None
     
@@ -50,6 +60,9 @@ class DocumentResponse(BaseModel):
             'description': obj.description or "",
             'content': obj.content,
             'file_path': obj.file_path,
+            'file_name': obj.file_name,
+            'content_hash': obj.content_hash,
+            'text_status': obj.text_status,
             'status': obj.status,
             'created_at': obj.created_at.isoformat() if obj.created_at else None
         }
@@ -59,9 +72,11 @@ class FileUploadResponse(BaseModel):
     file_path: str
     file_name: str
     file_size: int
+    sha256: str
+    deduplicated: bool = False
 
 @router.post("/upload", response_model=FileUploadResponse)
-async def upload_file(file: UploadFile = File(...)):
+async def upload_file(file: UploadFile = File(...), db: AsyncSession = Depends(get_db)):
     """파일 업로드"""
     # 파일 확장자 검증
     allowed_extensions = {'.pdf', '.doc', '.docx', '.txt', '.md', '.xlsx', '.xls'}
@@ -73,35 +88,28 @@ async def upload_file(file: UploadFile = File(...)):
             detail=f"지원하지 않는 파일 형식입니다. 지원 형식: {', '.join(allowed_extensions)}"
         )
     
-    # 파일 크기 제한 (10MB)
-    if file.size > 10 * 1024 * 1024:
-        raise HTTPException(status_code=400, detail="파일 크기는 10MB를 초과할 수 없습니다.")
-    
-    # 업로드 디렉토리 생성
-    upload_dir = "uploads/documents"
-    os.makedirs(upload_dir, exist_ok=True)
-    
-    # 고유한 파일명 생성
-    file_id = str(uuid.uuid4())
-    file_name = f"{file_id}_{file.filename}"
-    file_path = os.path.join(upload_dir, file_name)
-    
-    # 파일 저장
+    # 청크 단위 스트리밍 저장 후 SHA-256 기준 저장소에 보관 (같은 내용은 한 벌만 저장)
     try:
-        with open(file_path, "wb") as buffer:
-            content = await file.read()
-            buffer.write(content)
-        
-        return FileUploadResponse(
-            file_path=file_path,
-            file_name=file.filename,
-            file_size=len(content)
-        )
+        stored = await store_upload(db, file, settings.document_max_upload_bytes)
+    except UploadTooLargeError as e:
+        raise HTTPException(status_code=413, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"파일 업로드 실패: {str(e)}")
+    
+    return FileUploadResponse(
+        file_path=stored.path,
+        file_name=safe_filename(file.filename),
+        file_size=stored.size,
+        sha256=stored.sha256,
+        deduplicated=stored.deduplicated
+    )
 
 @router.post("/", response_model=DocumentResponse)
-async def create_document(document: DocumentCreate, db: Session = Depends(get_db)):
+async def create_document(
+    document: DocumentCreate,
+    background_tasks: BackgroundTasks,
+    db: AsyncSession = Depends(get_db)
+):
     """새 문서 생성"""
     try:
         db_document = Document(
@@ -111,40 +119,80 @@ async def create_document(document: DocumentCreate, db: Session = Depends(get_db
             document_type=document.type,
             description=document.description,
             file_path=document.file_path,
+            file_name=document.file_name,
             status="draft" if not document.file_path else "completed"
         )
+        # 저장소 파일이면 참조 카운트 증가 (문서 생성과 같은 트랜잭션)
+        content_hash = blob_store.hash_for_path(document.file_path)
+        if await acquire_blob(db, content_hash):
+            db_document.content_hash = content_hash
+        if document.file_path:
+            db_document.text_status = "pending"
         db.add(db_document)
-        db.commit()
-        db.refresh(db_document)
+        await db.commit()
+        await db.refresh(db_document)
+        
+        # 첨부파일 텍스트는 응답 후 프로세스 풀에서 추출 (같은 내용은 캐시 재사용)
+        if document.file_path:
+            background_tasks.add_task(extract_document_text_task, db_document.id)
         return DocumentResponse.from_orm(db_document)
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(status_code=500, detail=f"문서 생성 실패: {str(e)}")
 
+def _filter_documents(query, document_type: Optional[str], status: Optional[str]):
+    """문서 목록 공통 필터"""
+    if document_type:
+        query = query.where(Document.document_type == document_type)
+    if status:
+        query = query.where(Document.status == status)
+    return query
+
 @router.get("/", response_model=List[DocumentResponse])
-async def get_documents(db: Session = Depends(get_db)):
-    """문서 목록 조회"""
-    documents = db.query(Document).all()
+async def get_documents(
+    request: Request,
+    response: Response,
+    project_id: Optional[int] = None,
+    document_type: Optional[str] = None,
+    status: Optional[str] = None,
+    page: PageParams = Depends(),
+    db: AsyncSession = Depends(get_db)
+):
+    """문서 목록 조회 (키셋 페이지네이션)"""
+    query = select(Document)
+    if project_id is not None:
+        query = query.where(Document.project_id == project_id)
+    query = _filter_documents(query, document_type, status)
+    documents = await paginate(db, query, Document.id, page, request, response)
     return [DocumentResponse.from_orm(doc) for doc in documents]
 
 @router.get("/{document_id}", response_model=DocumentResponse)
-async def get_document(document_id: int, db: Session = Depends(get_db)):
+async def get_document(document_id: int, db: AsyncSession = Depends(get_db)):
     """특정 문서 조회"""
-    document = db.query(Document).filter(Document.id == document_id).first()
+    document = await db.get(Document, document_id)
     if not document:
         raise HTTPException(status_code=404, detail="문서를 찾을 수 없습니다")
     return DocumentResponse.from_orm(document)
 
 @router.get("/project/{project_id}", response_model=List[DocumentResponse])
-async def get_project_documents(project_id: int, db: Session = Depends(get_db)):
-    """특정 프로젝트의 문서 목록 조회"""
-    documents = db.query(Document).filter(Document.project_id == project_id).all()
+async def get_project_documents(
+    project_id: int,
+    request: Request,
+    response: Response,
+    document_type: Optional[str] = None,
+    status: Optional[str] = None,
+    page: PageParams = Depends(),
+    db: AsyncSession = Depends(get_db)
+):
+    """특정 프로젝트의 문서 목록 조회 (키셋 페이지네이션)"""
+    query = _filter_documents(select(Document).where(Document.project_id == project_id), document_type, status)
+    documents = await paginate(db, query, Document.id, page, request, response)
     return [DocumentResponse.from_orm(doc) for doc in documents]
 
 @router.get("/{document_id}/content")
-async def get_document_content(document_id: int, db: Session = Depends(get_db)):
+async def get_document_content(document_id: int, db: AsyncSession = Depends(get_db)):
     """문서 내용 조회"""
-    document = db.query(Document).filter(Document.id == document_id).first()
+    document = await db.get(Document, document_id)
     if not document:
         raise HTTPException(status_code=404, detail="문서를 찾을 수 없습니다.")
     
@@ -152,38 +200,37 @@ async def get_document_content(document_id: int, db: Session = Depends(get_db)):
     if document.content:
         return {"content": document.content}
     
-    # 파일이 첨부된 경우 파일 내용 읽기
+    # 파일이 첨부된 경우 추출된 텍스트 사용 (없으면 추출 후 내용 해시 기준으로 저장)
     if document.file_path and os.path.exists(document.file_path):
         try:
-            with open(document.file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            return {"content": content}
-        except UnicodeDecodeError:
-            # 바이너리 파일인 경우
-            return {"content": f"파일 경로: {document.file_path}\n\n이 파일은 바이너리 파일로 내용을 직접 표시할 수 없습니다."}
+            extracted = await ensure_document_text(db, document)
         except Exception as e:
             return {"content": f"파일을 읽는 중 오류가 발생했습니다: {str(e)}"}
+        if extracted.text is not None:
+            return {"content": extracted.text}
+        return {"content": f"파일 경로: {document.file_path}\n\n{extracted.error}"}
     
     # 내용이 없는 경우
     return {"content": "문서 내용이 없습니다."}
 
-@router.get("/{document_id}/download")
-async def download_document_file(document_id: int, db: Session = Depends(get_db)):
-    """문서 첨부파일 다운로드"""
-    document = db.query(Document).filter(Document.id == document_id).first()
+@router.api_route("/{document_id}/download", methods=["GET", "HEAD"])
+async def download_document_file(document_id: int, request: Request, db: AsyncSession = Depends(get_db)):
+    """문서 첨부파일 다운로드 (Range, ETag/Last-Modified 조건부 요청 지원)"""
+    document = await db.get(Document, document_id)
     if not document:
         raise HTTPException(status_code=404, detail="문서를 찾을 수 없습니다.")
     
     if not document.file_path or not os.path.exists(document.file_path):
         raise HTTPException(status_code=404, detail="첨부파일을 찾을 수 없습니다.")
     
-    # 파일명 추출
-    filename = os.path.basename(document.file_path)
+    # 파일명 추출 (저장소 경로는 해시이므로 업로드 원본 파일명 우선)
+    filename = document.file_name or os.path.basename(document.file_path)
     
-    return FileResponse(
-        path=document.file_path,
-        filename=filename,
-        media_type='application/octet-stream'
+    return await file_download_response(
+        request,
+        document.file_path,
+        filename,
+        content_hash=document.content_hash
     )
 
 @router.post("/generate")
@@ -0,0 +1,29 @@
+"""
+비동기 작업 관련 API 엔드포인트
+"""
+from fastapi import APIRouter, HTTPException
+import asyncio
+
+from app.services import wbs_job_service
+
+router = APIRouter()
+
+@router.get("/{job_id}")
+async def get_job_status(job_id: str):
+    """작업 상태 및 단계별 진행 상황 조회"""
+    job = await asyncio.to_thread(wbs_job_service.get_job, job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="작업을 찾을 수 없습니다")
+    return wbs_job_service.serialize_job(job)
+
+@router.get("/{job_id}/result")
+async def get_job_result(job_id: str):
+    """작업 결과 조회"""
+    job = await asyncio.to_thread(wbs_job_service.get_job, job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="작업을 찾을 수 없습니다")
+    
+    if job.status not in ("completed", "failed"):
+        raise HTTPException(status_code=409, detail=f"작업이 아직 완료되지 않았습니다 (상태: {job.status})")
+    
+    return wbs_job_service.serialize_job(job, include_result=True)
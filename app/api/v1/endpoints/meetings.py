@@ -1,14 +1,23 @@
 """
 회의 관련 API 엔드포인트
 """
-from fastapi import APIRouter, HTTPException, Depends, UploadFile, File
-from sqlalchemy.orm import Session
-from typing import List
+import mimetypes
+import os
+
+from fastapi import APIRouter, HTTPException, Depends, UploadFile, File, Request, Response
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Optional
 from pydantic import BaseModel
 from datetime import datetime
 
 from app.core.database import get_db
+from app.core.pagination import PageParams, paginate
+from app.core.file_responses import detect_media_type, file_download_response
+from app.core.uploads import UploadTooLargeError
 from app.models.project import Meeting
+from app.services.blob_service import store_upload, acquire_blob, release_blob
+from config import settings
 # from app.services.meeting_processor import MeetingProcessor
 
 router = APIRouter()
@@ -28,8 +37,8 @@ class MeetingResponse(BaseModel):
     description: str
     meeting_date: datetime
     participants: List[str]
-    transcript: str = None
-    summary: str = None
+    transcript: Optional[str] = None
+    summary: Optional[str] = None
     
     class Config:
         from_attributes = True
@@ -41,7 +50,7 @@ class MeetingProcessingRequest(BaseModel):
     pm_email: str
 
 @router.post("/", response_model=MeetingResponse)
-async def create_meeting(meeting: MeetingCreate, db: Session = Depends(get_db)):
+async def create_meeting(meeting: MeetingCreate, db: AsyncSession = Depends(get_db)):
     """새 회의 생성"""
     db_meeting = Meeting(
         project_id=meeting.project_id,
@@ -51,20 +60,34 @@ async def create_meeting(meeting: MeetingCreate, db: Session = Depends(get_db)):
         participants=meeting.participants
     )
     db.add(db_meeting)
-    db.commit()
-    db.refresh(db_meeting)
+    await db.commit()
+    await db.refresh(db_meeting)
     return db_meeting
 
 @router.get("/", response_model=List[MeetingResponse])
-async def get_meetings(db: Session = Depends(get_db)):
-    """회의 목록 조회"""
-    meetings = db.query(Meeting).all()
-    return meetings
+async def get_meetings(
+    request: Request,
+    response: Response,
+    project_id: Optional[int] = None,
+    date_from: Optional[datetime] = None,
+    date_to: Optional[datetime] = None,
+    page: PageParams = Depends(),
+    db: AsyncSession = Depends(get_db)
+):
+    """회의 목록 조회 (키셋 페이지네이션)"""
+    query = select(Meeting)
+    if project_id is not None:
+        query = query.where(Meeting.project_id == project_id)
+    if date_from:
+        query = query.where(Meeting.meeting_date >= date_from)
+    if date_to:
+        query = query.where(Meeting.meeting_date < date_to)
+    return await paginate(db, query, Meeting.id, page, request, response)
 
 @router.get("/{meeting_id}", response_model=MeetingResponse)
-async def get_meeting(meeting_id: int, db: Session = Depends(get_db)):
+async def get_meeting(meeting_id: int, db: AsyncSession = Depends(get_db)):
     """특정 회의 조회"""
-    meeting = db.query(Meeting).filter(Meeting.id == meeting_id).first()
+    meeting = await db.get(Meeting, meeting_id)
     if not meeting:
         raise HTTPException(status_code=404, detail="회의를 찾을 수 없습니다")
     return meeting
@@ -73,39 +96,67 @@ async def get_meeting(meeting_id: int, db: Session = Depends(get_db)):
 async def upload_meeting_audio(
     meeting_id: int,
     audio_file: UploadFile = File(...),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """회의 녹음 파일 업로드"""
+    meeting = await db.get(Meeting, meeting_id)
+    if not meeting:
+        raise HTTPException(status_code=404, detail="회의를 찾을 수 없습니다")
+    
     try:
-        # 파일 저장 경로 설정
-        file_path = f"uploads/meetings/{meeting_id}_{audio_file.filename}"
-        
-        # 파일 저장
-        with open(file_path, "wb") as buffer:
-            content = await audio_file.read()
-            buffer.write(content)
+        # 청크 단위 스트리밍 저장 후 SHA-256 기준 저장소에 보관 (같은 내용은 한 벌만 저장)
+        stored = await store_upload(db, audio_file, settings.meeting_audio_max_upload_bytes)
         
-        # 데이터베이스 업데이트
-        meeting = db.query(Meeting).filter(Meeting.id == meeting_id).first()
-        if meeting:
-            meeting.audio_file_path = file_path
-            db.commit()
+        # 데이터베이스 업데이트 (이전 녹음 파일 참조 해제)
+        if meeting.audio_content_hash != stored.sha256:
+            await release_blob(db, meeting.audio_content_hash)
+            await acquire_blob(db, stored.sha256)
+        meeting.audio_file_path = stored.path
+        meeting.audio_content_hash = stored.sha256
+        await db.commit()
         
-        return {"message": "파일이 성공적으로 업로드되었습니다", "file_path": file_path}
+        return {
+            "message": "파일이 성공적으로 업로드되었습니다",
+            "file_path": stored.path,
+            "file_size": stored.size,
+            "sha256": stored.sha256,
+            "deduplicated": stored.deduplicated
+        }
         
+    except UploadTooLargeError as e:
+        raise HTTPException(status_code=413, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"파일 업로드 실패: {str(e)}")
 
+@router.api_route("/{meeting_id}/audio", methods=["GET", "HEAD"])
+async def download_meeting_audio(meeting_id: int, request: Request, db: AsyncSession = Depends(get_db)):
+    """회의 녹음 파일 다운로드/재생 (Range, ETag/Last-Modified 조건부 요청 지원)"""
+    meeting = await db.get(Meeting, meeting_id)
+    if not meeting:
+        raise HTTPException(status_code=404, detail="회의를 찾을 수 없습니다")
+    if not meeting.audio_file_path or not os.path.exists(meeting.audio_file_path):
+        raise HTTPException(status_code=404, detail="회의 녹음 파일이 없습니다")
+    
+    media_type = await detect_media_type(meeting.audio_file_path)
+    extension = mimetypes.guess_extension(media_type) or ""
+    return await file_download_response(
+        request,
+        meeting.audio_file_path,
+        f"meeting_{meeting_id}_audio{extension}",
+        content_hash=meeting.audio_content_hash,
+        media_type=media_type
+    )
+
 @router.post("/process/{meeting_id}")
 async def process_meeting(
     meeting_id: int,
     request: MeetingProcessingRequest,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """회의 녹음 처리"""
     try:
         # 회의 정보 조회
-        meeting = db.query(Meeting).filter(Meeting.id == meeting_id).first()
+        meeting = await db.get(Meeting, meeting_id)
         if not meeting:
             raise HTTPException(status_code=404, detail="회의를 찾을 수 없습니다")
         
@@ -131,7 +182,7 @@ async def process_meeting(
         meeting.transcript = result.get("transcript", "")
         meeting.summary = result.get("summary", {}).get("summary", "")
         meeting.action_items = result.get("summary", {}).get("action_items", [])
-        db.commit()
+        await db.commit()
         
         return result
         
@@ -1,15 +1,29 @@
 """
 프로젝트 관련 API 엔드포인트
 """
-from fastapi import APIRouter, HTTPException, Depends
-from sqlalchemy.orm import Session
-from typing import List
-from pydantic import BaseModel
+from fastapi import APIRouter, HTTPException, Depends, Request, Response
+from fastapi.responses import StreamingResponse
+import asyncio
+import json
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Optional
+from datetime import datetime
+from pydantic import BaseModel, Field
 
 from app.core.database import get_db
+from app.core.pagination import PageParams, paginate
 from app.models.project import Project
 from app.services.n8n_mcp_service import N8nMCPService
 from app.services.enhanced_wbs_service import EnhancedWBSService
+from app.services import wbs_job_service
+from app.services.wbs_persistence import save_generated_wbs
+from app.services.document_text_service import load_document_files
+from app.services.team_projection import project_members_query, project_team_member_to_dict
+from app.services.schedule_engine import ScheduleEngine, ScheduleCycleError
+from app.services.resource_leveling import (
+    ResourceLevelingScheduler, tasks_from_wbs, load_member_capacities
+)
 
 router = APIRouter()
 
@@ -23,8 +37,8 @@ class ProjectResponse(BaseModel):
     name: str
     description: str
     status: str
-    start_date: str = None
-    end_date: str = None
+    start_date: Optional[datetime] = None
+    end_date: Optional[datetime] = None
     
     class Config:
         from_attributes = True
@@ -55,6 +69,29 @@ class N8nMCPWBSRequest(BaseModel):
     project_goals: str
     team_members: List[dict]
 
+class TaskAssignmentRequest(BaseModel):
+    wbs_data: dict
+    team_members: List[dict]
+    duration_weeks: float = None
+
+class ScheduleRequest(BaseModel):
+    wbs_data: dict
+    hours_per_week: float = Field(40.0, gt=0)
+
+class ResourceLevelingRequest(BaseModel):
+    wbs_data: dict
+    start_date: Optional[datetime] = None
+    hours_per_week: float = Field(40.0, gt=0)
+
+class PortfolioProjectWBS(BaseModel):
+    project_id: int
+    wbs_data: dict
+
+class PortfolioLevelingRequest(BaseModel):
+    projects: List[PortfolioProjectWBS]
+    start_date: Optional[datetime] = None
+    hours_per_week: float = Field(40.0, gt=0)
+
 class EnhancedWBSRequest(BaseModel):
     project_id: int
     proposal_content: str
@@ -62,26 +99,44 @@ class EnhancedWBSRequest(BaseModel):
     project_goals: str
     team_members: List[dict]
     additional_files: List[dict] = None
+    document_ids: Optional[List[int]] = None  # 업로드된 문서 ID (추출된 텍스트를 additional_files로 사용)
+    assignment_mode: str = "llm"  # llm: GPT-4 할당, optimizer: 로컬 할당 엔진 (두 번째 LLM 호출 생략)
+    persist: bool = False  # 생성된 단계/Task를 WBS 아이템으로 저장 (스트리밍 제외)
+    replace_existing: bool = False  # 저장 전 프로젝트의 기존 WBS 아이템 삭제
 
 @router.post("/", response_model=ProjectResponse)
-async def create_project(project: ProjectCreate, db: Session = Depends(get_db)):
+async def create_project(project: ProjectCreate, db: AsyncSession = Depends(get_db)):
     """새 프로젝트 생성"""
     db_project = Project(name=project.name, description=project.description)
     db.add(db_project)
-    db.commit()
-    db.refresh(db_project)
+    await db.commit()
+    await db.refresh(db_project)
     return db_project
 
 @router.get("/")
-async def get_projects(db: Session = Depends(get_db)):
-    """프로젝트 목록 조회"""
+async def get_projects(
+    request: Request,
+    response: Response,
+    status: Optional[str] = None,
+    name: Optional[str] = None,
+    created_from: Optional[datetime] = None,
+    created_to: Optional[datetime] = None,
+    page: PageParams = Depends(),
+    db: AsyncSession = Depends(get_db)
+):
+    """프로젝트 목록 조회 (키셋 페이지네이션)"""
     try:
-        print("🔍 프로젝트 조회 시작...")
-        projects = db.query(Project).all()
-        print(f"📊 프로젝트 목록 조회: {len(projects)}개")
-        for project in projects:
-            print(f"  - {project.id}: {project.name}")
-        return projects
+        query = select(Project)
+        if status:
+            query = query.where(Project.status == status)
+        if name:
+            query = query.where(Project.name.contains(name, autoescape=True))
+        if created_from:
+            query = query.where(Project.created_at >= created_from)
+        if created_to:
+            query = query.where(Project.created_at < created_to)
+        
+        return await paginate(db, query, Project.id, page, request, response)
     except Exception as e:
         print(f"❌ 프로젝트 목록 조회 실패: {e}")
         import traceback
@@ -89,37 +144,15 @@ async def get_projects(db: Session = Depends(get_db)):
         return []
 
 @router.get("/{project_id}/team-members")
-async def get_project_team_members(project_id: int, db: Session = Depends(get_db)):
+async def get_project_team_members(project_id: int, db: AsyncSession = Depends(get_db)):
     """프로젝트에 투입된 팀원 정보 조회"""
     try:
-        from app.models.team import ProjectMember, TeamMember
-        
-        # 프로젝트 멤버 조회
-        project_members = db.query(ProjectMember).filter(ProjectMember.project_id == project_id).all()
-        
-        team_members = []
-        for pm in project_members:
-            member = db.query(TeamMember).filter(TeamMember.id == pm.team_member_id).first()
-            if member:
-                # skills를 JSON 문자열에서 리스트로 변환
-                import json
-                try:
-                    skills_list = json.loads(member.skills) if member.skills else []
-                except:
-                    skills_list = []
-                
-                team_members.append({
-                    "id": member.id,
-                    "name": member.name,
-                    "email": member.email,
-                    "role": member.position,
-                    "skills": skills_list,
-                    "experience_years": member.experience_years,
-                    "skill_level": member.skill_level,
-                    "availability": member.availability,
-                    "project_role": pm.role,
-                    "allocation": pm.allocation_percentage
-                })
+        # 멤버십과 팀원 정보를 한 번의 조인 쿼리로 조회
+        result = await db.execute(project_members_query(project_id))
+        team_members = [
+            project_team_member_to_dict(membership, member)
+            for membership, member in result.all()
+        ]
         
         print(f"👥 프로젝트 {project_id} 팀원 정보: {len(team_members)}명")
         return {"team_members": team_members}
@@ -128,9 +161,9 @@ async def get_project_team_members(project_id: int, db: Session = Depends(get_db
         return {"team_members": []}
 
 @router.get("/{project_id}", response_model=ProjectResponse)
-async def get_project(project_id: int, db: Session = Depends(get_db)):
+async def get_project(project_id: int, db: AsyncSession = Depends(get_db)):
     """특정 프로젝트 조회"""
-    project = db.query(Project).filter(Project.id == project_id).first()
+    project = await db.get(Project, project_id)
     if not project:
         raise HTTPException(status_code=404, detail="프로젝트를 찾을 수 없습니다")
     return project
@@ -199,10 +232,24 @@ async def generate_mcp_wbs(request: N8nMCPWBSRequest):
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+async def _resolve_additional_files(request: EnhancedWBSRequest, db: AsyncSession) -> Optional[List[dict]]:
+    """직접 전달된 추가 파일과 document_ids 문서의 추출 텍스트 병합"""
+    document_files = await load_document_files(db, request.document_ids or [])
+    if not document_files:
+        return request.additional_files
+    return (request.additional_files or []) + document_files
+
+async def _check_persist_target(request: EnhancedWBSRequest, db: AsyncSession):
+    """persist 요청이면 저장 대상 프로젝트가 있는지 생성 전에 확인"""
+    if request.persist and await db.get(Project, request.project_id) is None:
+        raise HTTPException(status_code=404, detail="프로젝트를 찾을 수 없습니다")
+
 @router.post("/generate-enhanced-wbs")
-async def generate_enhanced_wbs(request: EnhancedWBSRequest):
+async def generate_enhanced_wbs(request: EnhancedWBSRequest, db: AsyncSession = Depends(get_db)):
     """고도화된 WBS 생성 (요건 추출, Task 분배, 기간 추정)"""
+    await _check_persist_target(request, db)
     try:
+        additional_files = await _resolve_additional_files(request, db)
         enhanced_service = EnhancedWBSService()
         result = await enhanced_service.generate_enhanced_wbs(
             project_id=request.project_id,
@@ -210,12 +257,127 @@ async def generate_enhanced_wbs(request: EnhancedWBSRequest):
             rfp_content=request.rfp_content,
             project_goals=request.project_goals,
             team_members=request.team_members,
-            additional_files=request.additional_files
+            additional_files=additional_files,
+            assignment_mode=request.assignment_mode
         )
+        if request.persist and result.get("status") == "success":
+            result["persisted_items"] = await db.run_sync(
+                save_generated_wbs, request.project_id, result["wbs_data"], request.replace_existing
+            )
+            await db.commit()
         return result
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+@router.post("/generate-enhanced-wbs/stream")
+async def stream_enhanced_wbs(request: EnhancedWBSRequest, db: AsyncSession = Depends(get_db)):
+    """고도화된 WBS 생성 (Server-Sent Events 스트리밍)
+
+    단계 시작/완료(stage), 요구사항 분석 결과(requirements),
+    완성된 단계별 WBS(phase), 최종 결과(result) 이벤트를 순서대로 전송합니다.
+    """
+    enhanced_service = EnhancedWBSService()
+    additional_files = await _resolve_additional_files(request, db)
+    
+    async def event_stream():
+        async for event, data in enhanced_service.stream_enhanced_wbs(
+            project_id=request.project_id,
+            proposal_content=request.proposal_content,
+            rfp_content=request.rfp_content,
+            project_goals=request.project_goals,
+            team_members=request.team_members,
+            additional_files=additional_files,
+            assignment_mode=request.assignment_mode
+        ):
+            yield f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+    
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+@router.post("/generate-enhanced-wbs/jobs", status_code=202)
+async def submit_enhanced_wbs_job(request: EnhancedWBSRequest, db: AsyncSession = Depends(get_db)):
+    """고도화된 WBS 생성 작업 제출 (작업 ID 즉시 반환)"""
+    await _check_persist_target(request, db)
+    try:
+        payload = request.dict()
+        payload["additional_files"] = await _resolve_additional_files(request, db)
+        job = await asyncio.to_thread(
+            wbs_job_service.create_job, request.project_id, payload
+        )
+        wbs_job_service.submit_job(job.id)
+        return {
+            "job_id": job.id,
+            "status": job.status,
+            "status_url": f"/api/v1/jobs/{job.id}",
+            "result_url": f"/api/v1/jobs/{job.id}/result"
+        }
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+@router.post("/assign-tasks")
+async def assign_tasks(request: TaskAssignmentRequest):
+    """할당 엔진으로 WBS Task 담당자 재배정 (LLM 호출 없음)"""
+    try:
+        service = EnhancedWBSService()
+        team = service._structure_team_members(request.team_members)
+        duration_weeks = (
+            request.duration_weeks
+            or request.wbs_data.get("project_timeline", {}).get("total_duration_weeks")
+            or 12
+        )
+        return service.assign_tasks(request.wbs_data, team, duration_weeks)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+@router.post("/schedule")
+async def compute_schedule(request: ScheduleRequest):
+    """WBS 데이터로 일정 재계산 (크리티컬 패스, 여유 시간, 간트 차트)"""
+    try:
+        engine = ScheduleEngine(hours_per_week=request.hours_per_week)
+        return engine.build_timeline(request.wbs_data)
+    except ScheduleCycleError as e:
+        raise HTTPException(status_code=400, detail={"message": str(e), "cycle": e.cycle})
+
+@router.post("/level-portfolio")
+async def level_portfolio_resources(request: PortfolioLevelingRequest, db: AsyncSession = Depends(get_db)):
+    """여러 프로젝트의 WBS를 함께 자원 평준화 (팀원 중복 배정 방지)"""
+    project_ids = [project.project_id for project in request.projects]
+    tasks = []
+    for project in request.projects:
+        tasks.extend(tasks_from_wbs(project.wbs_data, project.project_id))
+    
+    try:
+        capacities = await load_member_capacities(db, project_ids, request.hours_per_week)
+        scheduler = ResourceLevelingScheduler(hours_per_week=request.hours_per_week)
+        return scheduler.level(tasks, capacities, request.start_date or datetime.utcnow())
+    except ScheduleCycleError as e:
+        raise HTTPException(status_code=400, detail={"message": str(e), "cycle": e.cycle})
+
+@router.post("/{project_id}/level-resources")
+async def level_project_resources(
+    project_id: int,
+    request: ResourceLevelingRequest,
+    db: AsyncSession = Depends(get_db)
+):
+    """프로젝트 WBS 자원 평준화 (다른 활성 프로젝트 할당을 고려한 일정 배정)"""
+    project = await db.get(Project, project_id)
+    if not project:
+        raise HTTPException(status_code=404, detail="프로젝트를 찾을 수 없습니다")
+    
+    try:
+        capacities = await load_member_capacities(db, [project_id], request.hours_per_week)
+        scheduler = ResourceLevelingScheduler(hours_per_week=request.hours_per_week)
+        return scheduler.level(
+            tasks_from_wbs(request.wbs_data, project_id),
+            capacities,
+            request.start_date or project.start_date or datetime.utcnow()
+        )
+    except ScheduleCycleError as e:
+        raise HTTPException(status_code=400, detail={"message": str(e), "cycle": e.cycle})
+
 # 외부 플랫폼 연동 엔드포인트들
 @router.post("/{project_id}/export/jira")
 async def export_to_jira(project_id: int, wbs_data: dict):
@@ -0,0 +1,62 @@
+"""
+검색 API 엔드포인트
+"""
+from fastapi import APIRouter, HTTPException, Depends, Query, Request, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Optional
+from pydantic import BaseModel
+
+from app.core.database import get_db
+from app.core.pagination import decode_offset_cursor, encode_offset_cursor, set_page_headers
+from app.services.search_service import ENTITY_TYPES, search
+from config import settings
+
+router = APIRouter()
+
+# Pydantic 모델들
+class SearchResult(BaseModel):
+    entity_type: str  # document, meeting, wbs_item
+    entity_id: int
+    project_id: Optional[int] = None
+    title: str
+    snippet: Optional[str] = None  # 일치 부분 <mark> 강조
+    score: Optional[float] = None  # 관련도 (높을수록 관련)
+
+@router.get("/", response_model=List[SearchResult])
+async def search_all(
+    request: Request,
+    response: Response,
+    q: str = Query(..., min_length=1, max_length=200, description="검색어 (공백 구분 단어 AND)"),
+    types: Optional[str] = Query(None, description="검색 대상 (쉼표 구분: document, meeting, wbs_item)"),
+    project_id: Optional[int] = None,
+    cursor: Optional[str] = Query(None, description="이전 응답의 X-Next-Cursor 값"),
+    limit: Optional[int] = Query(None, ge=1, description="페이지 크기 (서버 최대값으로 제한)"),
+    db: AsyncSession = Depends(get_db)
+):
+    """문서/회의/WBS 아이템 전문 검색 (관련도 순)"""
+    entity_types = [t.strip() for t in types.split(",") if t.strip()] if types else list(ENTITY_TYPES)
+    unknown = set(entity_types) - set(ENTITY_TYPES)
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"지원하지 않는 검색 대상입니다: {', '.join(sorted(unknown))}")
+
+    offset = 0
+    if cursor:
+        try:
+            offset = decode_offset_cursor(cursor)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+    limit = min(limit or settings.pagination_default_limit, settings.pagination_max_limit)
+    # 순위 정렬은 OFFSET으로 넘기므로 깊은 페이지는 제한
+    limit = max(0, min(limit, settings.search_max_results - offset))
+    if limit == 0:
+        set_page_headers(request, response, 0, None)
+        return []
+
+    results = await search(db, q, entity_types, project_id, limit + 1, offset)
+    next_cursor = None
+    if len(results) > limit:
+        results = results[:limit]
+        if offset + limit < settings.search_max_results:
+            next_cursor = encode_offset_cursor(offset + limit)
+    set_page_headers(request, response, limit, next_cursor)
+    return results
@@ -3,6 +3,7 @@
 """
 from fastapi import APIRouter, HTTPException
 from typing import Dict, Any
+import asyncio
 import requests
 import os
 
@@ -92,6 +93,21 @@ async def test_n8n_connection():
             "service": "n8n"
         }
 
+@router.get("/llm-cache")
+async def get_llm_cache_stats():
+    """LLM 응답 캐시 통계 조회"""
+    from app.core.llm_cache import llm_cache
+    
+    return await asyncio.to_thread(llm_cache.stats)
+
+@router.delete("/llm-cache")
+async def clear_llm_cache():
+    """LLM 응답 캐시 비우기"""
+    from app.core.llm_cache import llm_cache
+    
+    await asyncio.to_thread(llm_cache.clear)
+    return {"status": "success", "message": "LLM 응답 캐시를 비웠습니다."}
+
 @router.get("/")
 async def get_settings():
     """설정 정보 조회"""
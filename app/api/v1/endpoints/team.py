@@ -1,16 +1,20 @@
 """
 팀원 관리 API 엔드포인트
 """
-from fastapi import APIRouter, HTTPException, Depends
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, HTTPException, Depends, Query, Request, Response
+from sqlalchemy import select, func
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List, Optional
 from pydantic import BaseModel, EmailStr
 from datetime import datetime
 import json
 
 from app.core.database import get_db
+from app.core.pagination import PageParams, paginate
 from app.models.team import TeamMember, ProjectMember, ProjectTemplate
 from app.models.project import Project
+from app.services.team_projection import project_members_query, project_member_to_dict
 
 router = APIRouter()
 
@@ -109,24 +113,29 @@ class ProjectTemplateResponse(BaseModel):
 # 팀원 관리 엔드포인트
 @router.get("/team-members", response_model=List[TeamMemberResponse])
 async def get_team_members(
-    skip: int = 0,
-    limit: int = 100,
+    request: Request,
+    response: Response,
+    skip: int = Query(0, ge=0, deprecated=True, description="cursor 사용 권장"),
     department: Optional[str] = None,
     skill_level: Optional[str] = None,
     availability: Optional[bool] = None,
-    db: Session = Depends(get_db)
+    page: PageParams = Depends(),
+    db: AsyncSession = Depends(get_db)
 ):
-    """팀원 목록 조회"""
-    query = db.query(TeamMember)
+    """팀원 목록 조회 (키셋 페이지네이션)"""
+    query = select(TeamMember)
     
     if department:
-        query = query.filter(TeamMember.department == department)
+        query = query.where(TeamMember.department == department)
     if skill_level:
-        query = query.filter(TeamMember.skill_level == skill_level)
+        query = query.where(TeamMember.skill_level == skill_level)
     if availability is not None:
-        query = query.filter(TeamMember.availability == availability)
+        query = query.where(TeamMember.availability == availability)
+    if skip:
+        # 이전 클라이언트 호환용 (깊은 페이지일수록 느려지므로 cursor 사용 권장)
+        query = query.offset(skip)
     
-    team_members = query.offset(skip).limit(limit).all()
+    team_members = await paginate(db, query, TeamMember.id, page, request, response)
     
     # skills를 JSON 문자열에서 리스트로 변환
     for member in team_members:
@@ -143,11 +152,11 @@ async def get_team_members(
 @router.post("/team-members", response_model=TeamMemberResponse)
 async def create_team_member(
     team_member: TeamMemberCreate,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """새 팀원 추가"""
     # 이메일 중복 확인
-    existing_member = db.query(TeamMember).filter(TeamMember.email == team_member.email).first()
+    existing_member = await db.scalar(select(TeamMember).where(TeamMember.email == team_member.email))
     if existing_member:
         raise HTTPException(status_code=400, detail="이미 존재하는 이메일입니다")
     
@@ -168,8 +177,8 @@ async def create_team_member(
     )
     
     db.add(db_member)
-    db.commit()
-    db.refresh(db_member)
+    await db.commit()
+    await db.refresh(db_member)
     
     # skills를 리스트로 변환하여 반환
     if db_member.skills:
@@ -180,9 +189,9 @@ async def create_team_member(
     return db_member
 
 @router.get("/team-members/{member_id}", response_model=TeamMemberResponse)
-async def get_team_member(member_id: int, db: Session = Depends(get_db)):
+async def get_team_member(member_id: int, db: AsyncSession = Depends(get_db)):
     """특정 팀원 조회"""
-    member = db.query(TeamMember).filter(TeamMember.id == member_id).first()
+    member = await db.get(TeamMember, member_id)
     if not member:
         raise HTTPException(status_code=404, detail="팀원을 찾을 수 없습니다")
     
@@ -198,19 +207,19 @@ async def get_team_member(member_id: int, db: Session = Depends(get_db)):
 async def update_team_member(
     member_id: int,
     team_member: TeamMemberUpdate,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """팀원 정보 수정"""
-    db_member = db.query(TeamMember).filter(TeamMember.id == member_id).first()
+    db_member = await db.get(TeamMember, member_id)
     if not db_member:
         raise HTTPException(status_code=404, detail="팀원을 찾을 수 없습니다")
     
     # 이메일 중복 확인 (자신 제외)
     if team_member.email:
-        existing_member = db.query(TeamMember).filter(
+        existing_member = await db.scalar(select(TeamMember).where(
             TeamMember.email == team_member.email,
             TeamMember.id != member_id
-        ).first()
+        ))
         if existing_member:
             raise HTTPException(status_code=400, detail="이미 존재하는 이메일입니다")
     
@@ -224,8 +233,8 @@ async def update_team_member(
     for field, value in update_data.items():
         setattr(db_member, field, value)
     
-    db.commit()
-    db.refresh(db_member)
+    await db.commit()
+    await db.refresh(db_member)
     
     # skills를 리스트로 변환하여 반환
     if db_member.skills:
@@ -236,17 +245,19 @@ async def update_team_member(
     return db_member
 
 @router.delete("/team-members/{member_id}")
-async def delete_team_member(member_id: int, db: Session = Depends(get_db)):
+async def delete_team_member(member_id: int, db: AsyncSession = Depends(get_db)):
     """팀원 삭제"""
-    member = db.query(TeamMember).filter(TeamMember.id == member_id).first()
+    member = await db.get(TeamMember, member_id)
     if not member:
         raise HTTPException(status_code=404, detail="팀원을 찾을 수 없습니다")
     
     # 프로젝트 멤버십이 있는지 확인
-    project_memberships = db.query(ProjectMember).filter(
-        ProjectMember.team_member_id == member_id,
-        ProjectMember.is_active == True
-    ).count()
+    project_memberships = await db.scalar(
+        select(func.count()).select_from(ProjectMember).where(
+            ProjectMember.team_member_id == member_id,
+            ProjectMember.is_active == True
+        )
+    )
     
     if project_memberships > 0:
         raise HTTPException(
@@ -254,56 +265,46 @@ async def delete_team_member(member_id: int, db: Session = Depends(get_db)):
             detail=f"활성 프로젝트 멤버십이 {project_memberships}개 있습니다. 먼저 프로젝트에서 제거해주세요."
         )
     
-    db.delete(member)
-    db.commit()
+    await db.delete(member)
+    await db.commit()
     
     return {"message": "팀원이 삭제되었습니다"}
 
 # 프로젝트 멤버 관리 엔드포인트
 @router.get("/projects/{project_id}/members", response_model=List[ProjectMemberResponse])
-async def get_project_members(project_id: int, db: Session = Depends(get_db)):
+async def get_project_members(project_id: int, db: AsyncSession = Depends(get_db)):
     """프로젝트 멤버 목록 조회"""
-    project = db.query(Project).filter(Project.id == project_id).first()
+    project = await db.get(Project, project_id)
     if not project:
         raise HTTPException(status_code=404, detail="프로젝트를 찾을 수 없습니다")
     
-    members = db.query(ProjectMember).filter(
-        ProjectMember.project_id == project_id,
-        ProjectMember.is_active == True
-    ).all()
-    
-    # 각 멤버의 skills를 리스트로 변환
-    for member in members:
-        if member.team_member.skills:
-            member.team_member.skills = json.loads(member.team_member.skills)
-        else:
-            member.team_member.skills = []
-    
-    return members
+    # 멤버십과 팀원 정보를 한 번의 조인 쿼리로 조회
+    result = await db.execute(project_members_query(project_id, active_only=True))
+    return [project_member_to_dict(membership, member) for membership, member in result.all()]
 
 @router.post("/projects/{project_id}/members", response_model=ProjectMemberResponse)
 async def add_project_member(
     project_id: int,
     project_member: ProjectMemberCreate,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """프로젝트에 멤버 추가"""
     # 프로젝트 존재 확인
-    project = db.query(Project).filter(Project.id == project_id).first()
+    project = await db.get(Project, project_id)
     if not project:
         raise HTTPException(status_code=404, detail="프로젝트를 찾을 수 없습니다")
     
     # 팀원 존재 확인
-    team_member = db.query(TeamMember).filter(TeamMember.id == project_member.team_member_id).first()
+    team_member = await db.get(TeamMember, project_member.team_member_id)
     if not team_member:
         raise HTTPException(status_code=404, detail="팀원을 찾을 수 없습니다")
     
     # 이미 프로젝트 멤버인지 확인
-    existing_member = db.query(ProjectMember).filter(
+    existing_member = await db.scalar(select(ProjectMember).where(
         ProjectMember.project_id == project_id,
         ProjectMember.team_member_id == project_member.team_member_id,
         ProjectMember.is_active == True
-    ).first()
+    ))
     
     if existing_member:
         raise HTTPException(status_code=400, detail="이미 프로젝트 멤버입니다")
@@ -319,29 +320,28 @@ async def add_project_member(
     )
     
     db.add(db_member)
-    db.commit()
-    db.refresh(db_member)
-    
-    # skills를 리스트로 변환
-    if db_member.team_member.skills:
-        db_member.team_member.skills = json.loads(db_member.team_member.skills)
-    else:
-        db_member.team_member.skills = []
+    try:
+        await db.commit()
+    except IntegrityError:
+        # 동시 요청으로 활성 멤버십이 먼저 생성된 경우 (부분 유니크 인덱스)
+        await db.rollback()
+        raise HTTPException(status_code=400, detail="이미 프로젝트 멤버입니다")
+    await db.refresh(db_member)
     
-    return db_member
+    return project_member_to_dict(db_member, team_member)
 
 @router.put("/projects/{project_id}/members/{member_id}")
 async def update_project_member(
     project_id: int,
     member_id: int,
     project_member: ProjectMemberCreate,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """프로젝트 멤버 정보 수정"""
-    db_member = db.query(ProjectMember).filter(
+    db_member = await db.scalar(select(ProjectMember).where(
         ProjectMember.project_id == project_id,
         ProjectMember.id == member_id
-    ).first()
+    ))
     
     if not db_member:
         raise HTTPException(status_code=404, detail="프로젝트 멤버를 찾을 수 없습니다")
@@ -352,50 +352,48 @@ async def update_project_member(
     for field, value in update_data.items():
         setattr(db_member, field, value)
     
-    db.commit()
-    db.refresh(db_member)
+    await db.commit()
+    await db.refresh(db_member)
+    team_member = await db.get(TeamMember, db_member.team_member_id)
     
-    # skills를 리스트로 변환
-    if db_member.team_member.skills:
-        db_member.team_member.skills = json.loads(db_member.team_member.skills)
-    else:
-        db_member.team_member.skills = []
-    
-    return db_member
+    return project_member_to_dict(db_member, team_member)
 
 @router.delete("/projects/{project_id}/members/{member_id}")
 async def remove_project_member(
     project_id: int,
     member_id: int,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """프로젝트에서 멤버 제거"""
-    project_member = db.query(ProjectMember).filter(
+    project_member = await db.scalar(select(ProjectMember).where(
         ProjectMember.project_id == project_id,
         ProjectMember.id == member_id
-    ).first()
+    ))
     
     if not project_member:
         raise HTTPException(status_code=404, detail="프로젝트 멤버를 찾을 수 없습니다")
     
     project_member.is_active = False
-    db.commit()
+    await db.commit()
     
     return {"message": "프로젝트에서 멤버가 제거되었습니다"}
 
 # 프로젝트 템플릿 관리 엔드포인트
 @router.get("/project-templates", response_model=List[ProjectTemplateResponse])
 async def get_project_templates(
+    request: Request,
+    response: Response,
     category: Optional[str] = None,
-    db: Session = Depends(get_db)
+    page: PageParams = Depends(),
+    db: AsyncSession = Depends(get_db)
 ):
-    """프로젝트 템플릿 목록 조회"""
-    query = db.query(ProjectTemplate).filter(ProjectTemplate.is_active == True)
+    """프로젝트 템플릿 목록 조회 (키셋 페이지네이션)"""
+    query = select(ProjectTemplate).where(ProjectTemplate.is_active == True)
     
     if category:
-        query = query.filter(ProjectTemplate.category == category)
+        query = query.where(ProjectTemplate.category == category)
     
-    templates = query.all()
+    templates = await paginate(db, query, ProjectTemplate.id, page, request, response)
     
     # 각 템플릿의 데이터를 파싱
     for template in templates:
@@ -414,7 +412,7 @@ async def get_project_templates(
 @router.post("/project-templates", response_model=ProjectTemplateResponse)
 async def create_project_template(
     template: ProjectTemplateCreate,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """새 프로젝트 템플릿 생성"""
     db_template = ProjectTemplate(
@@ -428,8 +426,8 @@ async def create_project_template(
     )
     
     db.add(db_template)
-    db.commit()
-    db.refresh(db_template)
+    await db.commit()
+    await db.refresh(db_template)
     
     # 데이터를 파싱하여 반환
     if db_template.required_skills:
@@ -450,10 +448,10 @@ async def quick_create_project(
     template_id: int,
     project_name: str,
     description: Optional[str] = None,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """템플릿을 사용한 빠른 프로젝트 생성"""
-    template = db.query(ProjectTemplate).filter(ProjectTemplate.id == template_id).first()
+    template = await db.get(ProjectTemplate, template_id)
     if not template:
         raise HTTPException(status_code=404, detail="템플릿을 찾을 수 없습니다")
     
@@ -465,8 +463,8 @@ async def quick_create_project(
     )
     
     db.add(project)
-    db.commit()
-    db.refresh(project)
+    await db.commit()
+    await db.refresh(project)
     
     return {
         "message": "프로젝트가 생성되었습니다",
@@ -1,24 +1,28 @@
 """
 WBS 관련 API 엔드포인트
 """
-from fastapi import APIRouter, HTTPException, Depends
-from sqlalchemy.orm import Session
-from typing import List
+from fastapi import APIRouter, HTTPException, Depends, Query, Request, Response
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Any, Dict, List, Optional
 from pydantic import BaseModel
 
 from app.core.database import get_db
-from app.models.project import WBSItem
+from app.core.pagination import PageParams, paginate
+from app.models.project import Project, WBSItem
 from app.models.team import TeamMember
+from app.services import wbs_tree
+from app.services.wbs_persistence import bulk_create_items, bulk_update_items, save_generated_wbs
+from app.services.wbs_tree import WBSTreeError
 
 router = APIRouter()
 
 # Pydantic 모델들
 class WBSItemCreate(BaseModel):
     project_id: int
-    parent_id: int = None
+    parent_id: Optional[int] = None
     title: str
     description: str = None
-    level: int = 1
     order: int = 0
     estimated_hours: int = None
     assigned_to: str = None
@@ -27,19 +31,55 @@ class WBSItemCreate(BaseModel):
 class WBSItemResponse(BaseModel):
     id: int
     project_id: int
-    parent_id: int = None
+    parent_id: Optional[int] = None
     title: str
-    description: str = None
+    description: Optional[str] = None
+    path: str
     level: int
     order: int
-    estimated_hours: int = None
-    assigned_to: str = None
-    skill_level_required: str = None
+    estimated_hours: Optional[int] = None
+    assigned_to: Optional[str] = None
+    skill_level_required: Optional[str] = None
     status: str
     
     class Config:
         from_attributes = True
 
+class WBSItemMove(BaseModel):
+    parent_id: Optional[int] = None  # None이면 루트로 이동
+    order: Optional[int] = None
+
+class WBSRollupResponse(BaseModel):
+    project_id: int
+    item_id: Optional[int] = None
+    item_count: int
+    estimated_hours: int
+    completed_hours: int
+    progress: float
+    status_counts: Dict[str, int]
+    status_hours: Dict[str, int]
+
+class WBSItemBulkEntry(BaseModel):
+    id: Optional[int] = None  # 지정하면 수정, 없으면 생성
+    client_id: Optional[str] = None  # 같은 요청 안에서 parent_client_id로 참조할 임시 ID
+    parent_id: Optional[int] = None
+    parent_client_id: Optional[str] = None
+    project_id: Optional[int] = None
+    title: Optional[str] = None
+    description: Optional[str] = None
+    order: Optional[int] = None
+    estimated_hours: Optional[int] = None
+    assigned_to: Optional[str] = None
+    skill_level_required: Optional[str] = None
+    status: Optional[str] = None
+
+class WBSItemBulkRequest(BaseModel):
+    items: List[WBSItemBulkEntry]
+
+class GeneratedWBSSaveRequest(BaseModel):
+    wbs_data: Dict[str, Any]  # generate-enhanced-wbs 결과의 wbs_data (project_phases/tasks)
+    replace: bool = False  # 프로젝트의 기존 WBS 아이템 삭제 후 저장
+
 class TeamMemberCreate(BaseModel):
     name: str
     email: str
@@ -67,39 +107,194 @@ class WBSGenerationRequest(BaseModel):
     project_goals: str
     team_members: List[dict]
 
+async def _get_item_or_404(db: AsyncSession, item_id: int, detail: str = "WBS 아이템을 찾을 수 없습니다") -> WBSItem:
+    item = await db.get(WBSItem, item_id)
+    if item is None:
+        raise HTTPException(status_code=404, detail=detail)
+    return item
+
 @router.post("/items", response_model=WBSItemResponse)
-async def create_wbs_item(item: WBSItemCreate, db: Session = Depends(get_db)):
+async def create_wbs_item(item: WBSItemCreate, db: AsyncSession = Depends(get_db)):
     """새 WBS 아이템 생성"""
+    parent = None
+    if item.parent_id is not None:
+        parent = await _get_item_or_404(db, item.parent_id, "상위 WBS 아이템을 찾을 수 없습니다")
+        if parent.project_id != item.project_id:
+            raise HTTPException(status_code=400, detail="상위 WBS 아이템이 다른 프로젝트에 속해 있습니다")
+    try:
+        path = wbs_tree.child_path(parent)
+    except WBSTreeError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     db_item = WBSItem(
         project_id=item.project_id,
         parent_id=item.parent_id,
+        path=path,
         title=item.title,
         description=item.description,
-        level=item.level,
+        level=wbs_tree.path_level(path),
         order=item.order,
         estimated_hours=item.estimated_hours,
         assigned_to=item.assigned_to,
         skill_level_required=item.skill_level_required
     )
     db.add(db_item)
-    db.commit()
-    db.refresh(db_item)
+    await db.commit()
+    await db.refresh(db_item)
     return db_item
 
+def _filter_wbs_items(
+    query,
+    parent_id: Optional[int],
+    level: Optional[int],
+    status: Optional[str],
+    assigned_to: Optional[str]
+):
+    """WBS 아이템 목록 공통 필터"""
+    if parent_id is not None:
+        query = query.where(WBSItem.parent_id == parent_id)
+    if level is not None:
+        query = query.where(WBSItem.level == level)
+    if status:
+        query = query.where(WBSItem.status == status)
+    if assigned_to:
+        query = query.where(WBSItem.assigned_to == assigned_to)
+    return query
+
 @router.get("/items", response_model=List[WBSItemResponse])
-async def get_wbs_items(db: Session = Depends(get_db)):
-    """WBS 아이템 목록 조회"""
-    items = db.query(WBSItem).all()
-    return items
+async def get_wbs_items(
+    request: Request,
+    response: Response,
+    project_id: Optional[int] = None,
+    parent_id: Optional[int] = None,
+    level: Optional[int] = None,
+    status: Optional[str] = None,
+    assigned_to: Optional[str] = None,
+    page: PageParams = Depends(),
+    db: AsyncSession = Depends(get_db)
+):
+    """WBS 아이템 목록 조회 (키셋 페이지네이션)"""
+    query = select(WBSItem)
+    if project_id is not None:
+        query = query.where(WBSItem.project_id == project_id)
+    query = _filter_wbs_items(query, parent_id, level, status, assigned_to)
+    return await paginate(db, query, WBSItem.id, page, request, response)
 
 @router.get("/items/project/{project_id}", response_model=List[WBSItemResponse])
-async def get_project_wbs_items(project_id: int, db: Session = Depends(get_db)):
-    """특정 프로젝트의 WBS 아이템 목록 조회"""
-    items = db.query(WBSItem).filter(WBSItem.project_id == project_id).all()
-    return items
+async def get_project_wbs_items(
+    project_id: int,
+    request: Request,
+    response: Response,
+    parent_id: Optional[int] = None,
+    level: Optional[int] = None,
+    status: Optional[str] = None,
+    assigned_to: Optional[str] = None,
+    page: PageParams = Depends(),
+    db: AsyncSession = Depends(get_db)
+):
+    """특정 프로젝트의 WBS 아이템 목록 조회 (키셋 페이지네이션)"""
+    query = select(WBSItem).where(WBSItem.project_id == project_id)
+    query = _filter_wbs_items(query, parent_id, level, status, assigned_to)
+    return await paginate(db, query, WBSItem.id, page, request, response)
+
+@router.post("/items/bulk")
+async def bulk_save_wbs_items(request: WBSItemBulkRequest, db: AsyncSession = Depends(get_db)):
+    """WBS 아이템 일괄 생성/수정 (하나의 트랜잭션, 요청 순서대로 ID 반환)"""
+    creates, updates, positions = [], [], []
+    for entry in request.items:
+        data = entry.dict(exclude_unset=True)
+        if entry.id is not None:
+            if entry.parent_id is not None or entry.parent_client_id is not None:
+                raise HTTPException(
+                    status_code=400,
+                    detail="기존 아이템의 상위 아이템 변경은 /items/{id}/move를 사용하세요"
+                )
+            positions.append(("update", len(updates)))
+            updates.append(data)
+        else:
+            positions.append(("create", len(creates)))
+            creates.append(data)
+
+    def save(session):
+        return bulk_create_items(session, creates), bulk_update_items(session, updates)
+
+    try:
+        created_ids, updated = await db.run_sync(save)
+    except WBSTreeError as e:
+        await db.rollback()
+        raise HTTPException(status_code=400, detail=str(e))
+    await db.commit()
+    ids = [created_ids[i] if kind == "create" else updates[i]["id"] for kind, i in positions]
+    return {"ids": ids, "created": len(created_ids), "updated": updated}
+
+@router.post("/items/project/{project_id}/generated")
+async def save_generated_wbs_items(
+    project_id: int,
+    request: GeneratedWBSSaveRequest,
+    db: AsyncSession = Depends(get_db)
+):
+    """생성된 WBS(단계 → 레벨 1, Task → 하위 아이템)를 WBS 아이템으로 일괄 저장"""
+    if await db.get(Project, project_id) is None:
+        raise HTTPException(status_code=404, detail="프로젝트를 찾을 수 없습니다")
+    try:
+        result = await db.run_sync(save_generated_wbs, project_id, request.wbs_data, request.replace)
+    except WBSTreeError as e:
+        await db.rollback()
+        raise HTTPException(status_code=400, detail=str(e))
+    await db.commit()
+    return result
+
+@router.get("/items/project/{project_id}/rollup", response_model=WBSRollupResponse)
+async def get_project_wbs_rollup(project_id: int, db: AsyncSession = Depends(get_db)):
+    """프로젝트 전체 WBS 예상 공수/상태별 집계"""
+    return await wbs_tree.get_rollup(db, project_id)
+
+@router.get("/items/{item_id}/subtree", response_model=List[WBSItemResponse])
+async def get_wbs_subtree(
+    item_id: int,
+    max_depth: Optional[int] = Query(None, ge=0),
+    db: AsyncSession = Depends(get_db)
+):
+    """WBS 아이템과 모든 하위 아이템 조회 (max_depth: 아이템 기준 상대 깊이)"""
+    item = await _get_item_or_404(db, item_id)
+    return await wbs_tree.get_subtree(db, item, max_depth)
+
+@router.get("/items/{item_id}/ancestors", response_model=List[WBSItemResponse])
+async def get_wbs_ancestors(item_id: int, db: AsyncSession = Depends(get_db)):
+    """WBS 아이템의 상위 아이템 목록 (루트부터 부모까지)"""
+    item = await _get_item_or_404(db, item_id)
+    return await wbs_tree.get_ancestors(db, item)
+
+@router.get("/items/{item_id}/rollup", response_model=WBSRollupResponse)
+async def get_wbs_rollup(item_id: int, db: AsyncSession = Depends(get_db)):
+    """WBS 아이템 하위 트리의 예상 공수/상태별 집계 (아이템 자신 포함)"""
+    item = await _get_item_or_404(db, item_id)
+    return await wbs_tree.get_rollup(db, item.project_id, item)
+
+@router.post("/items/{item_id}/move", response_model=WBSItemResponse)
+async def move_wbs_item(item_id: int, move: WBSItemMove, db: AsyncSession = Depends(get_db)):
+    """WBS 아이템을 하위 트리와 함께 다른 상위 아이템 아래(또는 루트)로 이동"""
+    item = await _get_item_or_404(db, item_id)
+    new_parent = None
+    if move.parent_id is not None:
+        new_parent = await _get_item_or_404(db, move.parent_id, "상위 WBS 아이템을 찾을 수 없습니다")
+    try:
+        await wbs_tree.move_subtree(db, item, new_parent, move.order)
+    except WBSTreeError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    await db.commit()
+    await db.refresh(item)
+    return item
+
+@router.delete("/items/{item_id}")
+async def delete_wbs_item(item_id: int, db: AsyncSession = Depends(get_db)):
+    """WBS 아이템과 모든 하위 아이템 삭제"""
+    item = await _get_item_or_404(db, item_id)
+    deleted = await wbs_tree.delete_subtree(db, item)
+    await db.commit()
+    return {"message": "WBS 아이템이 삭제되었습니다", "deleted": deleted}
 
 @router.post("/team-members", response_model=TeamMemberResponse)
-async def create_team_member(member: TeamMemberCreate, db: Session = Depends(get_db)):
+async def create_team_member(member: TeamMemberCreate, db: AsyncSession = Depends(get_db)):
     """새 팀 멤버 생성"""
     db_member = TeamMember(
         name=member.name,
@@ -110,15 +305,26 @@ async def create_team_member(member: TeamMemberCreate, db: Session = Depends(get
         availability=member.availability
     )
     db.add(db_member)
-    db.commit()
-    db.refresh(db_member)
+    await db.commit()
+    await db.refresh(db_member)
     return db_member
 
 @router.get("/team-members", response_model=List[TeamMemberResponse])
-async def get_team_members(db: Session = Depends(get_db)):
-    """팀 멤버 목록 조회"""
-    members = db.query(TeamMember).all()
-    return members
+async def get_team_members(
+    request: Request,
+    response: Response,
+    skill_level: Optional[str] = None,
+    availability: Optional[bool] = None,
+    page: PageParams = Depends(),
+    db: AsyncSession = Depends(get_db)
+):
+    """팀 멤버 목록 조회 (키셋 페이지네이션)"""
+    query = select(TeamMember)
+    if skill_level:
+        query = query.where(TeamMember.skill_level == skill_level)
+    if availability is not None:
+        query = query.where(TeamMember.availability == availability)
+    return await paginate(db, query, TeamMember.id, page, request, response)
 
 @router.post("/generate")
 async def generate_wbs(request: WBSGenerationRequest):
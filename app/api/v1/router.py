@@ -2,7 +2,7 @@
 API v1 라우터
 """
 from fastapi import APIRouter
-from app.api.v1.endpoints import projects, meetings, documents, wbs, team, settings
+from app.api.v1.endpoints import projects, meetings, documents, wbs, team, settings, jobs, search
 
 router = APIRouter()
 
@@ -13,3 +13,5 @@ router.include_router(documents.router, prefix="/documents", tags=["documents"])
 router.include_router(wbs.router, prefix="/wbs", tags=["wbs"])
 router.include_router(team.router, prefix="/team", tags=["team"])
 router.include_router(settings.router, prefix="/settings", tags=["settings"])
+router.include_router(jobs.router, prefix="/jobs", tags=["jobs"])
+router.include_router(search.router, prefix="/search", tags=["search"])
@@ -0,0 +1,108 @@
+"""
+내용 주소 기반(content-addressed) 파일 저장소
+파일을 SHA-256 해시로 식별해 {root}/ab/cd/{sha256} 경로에 한 번만 저장하는 모듈
+(같은 내용의 업로드는 해시 계산 비용만 들고 디스크에는 한 벌만 남습니다)
+"""
+import asyncio
+import os
+import re
+import uuid
+from typing import Optional, Tuple
+
+from config import settings
+
+SHA256_PATTERN = re.compile(r"^[0-9a-f]{64}$")
+
+
+class BlobStore:
+    """SHA-256 샤딩 디렉토리 파일 저장소"""
+
+    def __init__(self, root: str):
+        self.root = root
+
+    def path_for(self, sha256: str) -> str:
+        """해시에 해당하는 저장 경로 (앞 4자리로 2단계 샤딩)"""
+        if not SHA256_PATTERN.match(sha256):
+            raise ValueError(f"올바르지 않은 SHA-256 해시: {sha256}")
+        return os.path.join(self.root, sha256[:2], sha256[2:4], sha256)
+
+    def hash_for_path(self, path: Optional[str]) -> Optional[str]:
+        """저장소 경로에서 해시 추출 (저장소 밖의 경로면 None)"""
+        if not path:
+            return None
+        sha256 = os.path.basename(path)
+        if SHA256_PATTERN.match(sha256) and os.path.normpath(path) == os.path.normpath(self.path_for(sha256)):
+            return sha256
+        return None
+
+    def staging_path(self) -> str:
+        """업로드를 해시 계산 전까지 임시로 기록할 경로"""
+        return os.path.join(self.root, ".staging", uuid.uuid4().hex)
+
+    def exists(self, sha256: str) -> bool:
+        return os.path.exists(self.path_for(sha256))
+
+    def _ingest(self, staged_path: str, sha256: str) -> Tuple[str, bool]:
+        path = self.path_for(sha256)
+        if os.path.exists(path):
+            os.remove(staged_path)
+            return path, False
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        os.replace(staged_path, path)
+        return path, True
+
+    async def ingest(self, staged_path: str, sha256: str) -> Tuple[str, bool]:
+        """임시 파일을 저장소로 이동 (이미 같은 내용이 있으면 임시 파일 삭제)
+
+        Returns:
+            (저장 경로, 새로 저장되었는지 여부)
+        """
+        return await asyncio.to_thread(self._ingest, staged_path, sha256)
+
+    def _remove(self, sha256: str) -> bool:
+        try:
+            os.remove(self.path_for(sha256))
+            return True
+        except FileNotFoundError:
+            return False
+
+    async def remove(self, sha256: str) -> bool:
+        """저장된 파일 삭제"""
+        return await asyncio.to_thread(self._remove, sha256)
+
+    def _detach(self, sha256: str) -> Optional[str]:
+        detached = os.path.join(self.root, ".trash", uuid.uuid4().hex)
+        os.makedirs(os.path.dirname(detached), exist_ok=True)
+        try:
+            os.replace(self.path_for(sha256), detached)
+        except FileNotFoundError:
+            return None
+        return detached
+
+    async def detach(self, sha256: str) -> Optional[str]:
+        """저장된 파일을 휴지통 경로로 원자적으로 옮김 (파일이 없으면 None)
+
+        삭제 직전에 다시 참조가 생겼는지 확인하고 restore()로 되돌릴 수 있도록
+        저장 경로에서만 먼저 빼냅니다. 이후 같은 내용의 업로드는 새 파일로 저장됩니다.
+        """
+        return await asyncio.to_thread(self._detach, sha256)
+
+    def _restore(self, sha256: str, detached: str) -> bool:
+        path = self.path_for(sha256)
+        if os.path.exists(path):
+            # 그 사이 같은 내용이 다시 업로드되어 저장됨
+            os.remove(detached)
+            return False
+        os.replace(detached, path)
+        return True
+
+    async def restore(self, sha256: str, detached: str) -> bool:
+        """detach()한 파일을 저장 경로로 되돌림 (이미 다시 저장되어 있으면 휴지통 파일 삭제)"""
+        return await asyncio.to_thread(self._restore, sha256, detached)
+
+    async def discard(self, detached: str) -> None:
+        """detach()한 파일 삭제"""
+        await asyncio.to_thread(os.remove, detached)
+
+
+blob_store = BlobStore(os.path.join(settings.upload_dir, "blobs"))
@@ -0,0 +1,43 @@
+"""
+Celery 애플리케이션
+WBS 생성 작업을 Redis 브로커를 통해 별도 워커 프로세스에서 실행하기 위한 설정
+
+워커 실행:
+    celery -A app.core.celery_app worker --loglevel=info
+"""
+import asyncio
+
+from celery import Celery
+
+from config import settings
+
+celery_app = Celery(
+    "tasktory",
+    broker=settings.redis_url,
+    backend=settings.redis_url
+)
+
+celery_app.conf.update(
+    task_serializer="json",
+    accept_content=["json"],
+    result_serializer="json",
+    # 작업 동시 실행 수는 API 서버의 요청 동시성과 별도로 제한
+    worker_concurrency=settings.wbs_job_max_concurrency,
+    worker_prefetch_multiplier=1,
+    task_acks_late=True
+)
+
+@celery_app.task(name="tasktory.run_wbs_generation_job")
+def run_wbs_generation_job(job_id: str):
+    """WBS 생성 작업 실행"""
+    from app.services.wbs_job_service import run_job
+    from app.core.n8n_client import close_n8n_client
+
+    async def _run():
+        try:
+            await run_job(job_id)
+        finally:
+            # 공유 httpx 클라이언트는 이벤트 루프에 묶이므로 작업마다 정리
+            await close_n8n_client()
+
+    asyncio.run(_run())
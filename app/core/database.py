@@ -1,36 +1,161 @@
 """
 데이터베이스 설정 및 연결 관리
+API 요청은 비동기 엔진(AsyncSession)을 사용하고,
+스크립트와 Celery 워커 등 이벤트 루프 밖의 코드는 동기 엔진(SessionLocal)을 사용합니다.
+두 엔진 모두 데이터베이스 프로필(sqlite, postgresql)에 따른 풀 설정과
+SQLite PRAGMA(WAL, synchronous=NORMAL 등)를 적용합니다.
 """
-from sqlalchemy import create_engine, MetaData
+from pathlib import Path
+from typing import AsyncIterator, Dict, Any, List
+
+from sqlalchemy import create_engine, event, MetaData
+from sqlalchemy.engine import Connection, Engine, make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
+from app.core.metrics import instrument_engine
 from config import settings
 
-# 데이터베이스 엔진 생성
-engine = create_engine(settings.database_url)
+# 동기 드라이버 -> 비동기 드라이버
+ASYNC_DRIVERS = {
+    "sqlite": "sqlite+aiosqlite",
+    "postgresql": "postgresql+asyncpg",
+    "postgresql+psycopg2": "postgresql+asyncpg",
+    "mysql": "mysql+aiomysql",
+    "mysql+pymysql": "mysql+aiomysql",
+}
+
+def get_async_database_url(database_url: str) -> str:
+    """동기 데이터베이스 URL을 비동기 드라이버 URL로 변환"""
+    url = make_url(database_url)
+    driver = ASYNC_DRIVERS.get(url.drivername)
+    if driver is None:
+        return database_url
+    return url.set(drivername=driver).render_as_string(hide_password=False)
+
+# 백엔드별 커넥션 풀 기본값 (Settings의 database_pool_* 값이 있으면 우선)
+DATABASE_PROFILES: Dict[str, Dict[str, Any]] = {
+    # WAL에서도 쓰기는 한 번에 하나이므로 커넥션을 적게 유지하고 잠금 대기는 busy_timeout에 맡김
+    "sqlite": {
+        "pool_size": 5,
+        "max_overflow": 5,
+        "pool_timeout": 30.0,
+        "pool_recycle": -1,
+        "pool_pre_ping": False,
+    },
+    "postgresql": {
+        "pool_size": 10,
+        "max_overflow": 20,
+        "pool_timeout": 30.0,
+        "pool_recycle": 1800,
+        "pool_pre_ping": True,
+    },
+    "default": {
+        "pool_size": 5,
+        "max_overflow": 10,
+        "pool_timeout": 30.0,
+        "pool_recycle": 1800,
+        "pool_pre_ping": True,
+    },
+}
+
+def resolve_profile(database_url: str) -> str:
+    """데이터베이스 프로필 결정 (auto이면 URL의 백엔드 기준)"""
+    if settings.database_profile != "auto":
+        return settings.database_profile
+    backend = make_url(database_url).get_backend_name()
+    return backend if backend in DATABASE_PROFILES else "default"
+
+def _pool_options(database_url: str) -> Dict[str, Any]:
+    """커넥션 풀 설정 (SQLite 메모리 DB는 단일 커넥션 풀을 사용하므로 제외)"""
+    url = make_url(database_url)
+    if url.get_backend_name() == "sqlite" and url.database in (None, "", ":memory:"):
+        return {}
+    options = dict(DATABASE_PROFILES.get(resolve_profile(database_url), DATABASE_PROFILES["default"]))
+    overrides = {
+        "pool_size": settings.database_pool_size,
+        "max_overflow": settings.database_max_overflow,
+        "pool_timeout": settings.database_pool_timeout,
+        "pool_recycle": settings.database_pool_recycle,
+        "pool_pre_ping": settings.database_pool_pre_ping,
+    }
+    options.update({key: value for key, value in overrides.items() if value is not None})
+    return options
+
+def sqlite_pragmas() -> List[str]:
+    """SQLite 커넥션마다 실행할 PRAGMA 목록"""
+    return [
+        f"PRAGMA journal_mode={settings.sqlite_journal_mode}",
+        f"PRAGMA synchronous={settings.sqlite_synchronous}",
+        f"PRAGMA mmap_size={int(settings.sqlite_mmap_size)}",
+        f"PRAGMA cache_size={int(settings.sqlite_cache_size)}",
+        f"PRAGMA busy_timeout={int(settings.sqlite_busy_timeout_ms)}",
+    ]
+
+def _apply_sqlite_pragmas(dbapi_connection, connection_record):
+    """새 SQLite 커넥션에 PRAGMA 적용 (pysqlite, aiosqlite 공통)"""
+    cursor = dbapi_connection.cursor()
+    try:
+        for pragma in sqlite_pragmas():
+            cursor.execute(pragma)
+    finally:
+        cursor.close()
+
+def configure_engine(sync_engine: Engine) -> Engine:
+    """프로필에 따른 커넥션 이벤트와 쿼리 메트릭 등록 (비동기 엔진은 sync_engine 전달)"""
+    if sync_engine.dialect.name == "sqlite" and resolve_profile(str(sync_engine.url)) == "sqlite":
+        event.listen(sync_engine, "connect", _apply_sqlite_pragmas)
+    return instrument_engine(sync_engine)
+
+# 동기 데이터베이스 엔진 생성 (스크립트, Celery 워커용)
+engine = configure_engine(
+    create_engine(settings.database_url, **_pool_options(settings.database_url))
+)
 
 # 세션 팩토리 생성
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# 비동기 데이터베이스 엔진 생성 (API 요청용)
+async_database_url = settings.async_database_url or get_async_database_url(settings.database_url)
+async_engine = create_async_engine(
+    async_database_url,
+    echo=settings.database_echo,
+    **_pool_options(async_database_url)
+)
+configure_engine(async_engine.sync_engine)
+
+# 비동기 세션 팩토리 생성 (커밋 후에도 응답 직렬화를 위해 속성을 만료시키지 않음)
+AsyncSessionLocal = async_sessionmaker(async_engine, expire_on_commit=False, autoflush=False)
+
 # 베이스 클래스
 Base = declarative_base()
 
 # 메타데이터
 metadata = MetaData()
 
+# Alembic 설정 파일 (프로젝트 루트)
+ALEMBIC_INI_PATH = Path(__file__).resolve().parents[2] / "alembic.ini"
+
+def run_migrations(connection: Connection, revision: str = "head"):
+    """주어진 동기 커넥션으로 Alembic 마이그레이션 실행"""
+    from alembic import command
+    from alembic.config import Config
+
+    config = Config(str(ALEMBIC_INI_PATH))
+    config.set_main_option("script_location", str(ALEMBIC_INI_PATH.parent / "alembic"))
+    config.attributes["connection"] = connection
+    command.upgrade(config, revision)
+
 async def init_db():
-    """데이터베이스 초기화"""
-    # 모든 모델 임포트 (테이블 생성을 위해)
-    from app.models.project import Project, WBSItem, Meeting, Document
-    from app.models.team import TeamMember, ProjectMember, ProjectTemplate
-    
-    # 모든 테이블 생성
-    Base.metadata.create_all(bind=engine)
-
-def get_db():
+    """데이터베이스 초기화 (스키마 마이그레이션 적용)"""
+    async with async_engine.begin() as conn:
+        await conn.run_sync(run_migrations)
+
+async def close_db():
+    """데이터베이스 커넥션 풀 정리"""
+    await async_engine.dispose()
+
+async def get_db() -> AsyncIterator[AsyncSession]:
     """데이터베이스 세션 의존성"""
-    db = SessionLocal()
-    try:
+    async with AsyncSessionLocal() as db:
         yield db
-    finally:
-        db.close()
@@ -0,0 +1,260 @@
+"""
+파일 다운로드 응답
+ETag/Last-Modified 검증자, 조건부 요청(304), 단일 바이트 범위 요청(206/416)을 지원하는 파일 응답 모듈
+
+본문 전송은 서버가 ASGI zerocopysend 확장을 제공하면 sendfile로,
+DOWNLOAD_ACCEL_REDIRECT_PREFIX가 설정되면 nginx X-Accel-Redirect로 위임하고,
+그 외에는 스레드에서 청크 단위로 읽어 전송합니다.
+"""
+import asyncio
+import mimetypes
+import os
+import stat
+from email.utils import formatdate, parsedate_to_datetime
+from typing import Dict, Optional, Tuple
+from urllib.parse import quote
+
+import anyio
+from fastapi import Request
+from starlette.responses import Response
+from starlette.types import Receive, Scope, Send
+
+from config import settings
+
+ZEROCOPY_EXTENSION = "http.response.zerocopysend"
+
+# 파일 시그니처 (해시 경로로 저장되어 확장자가 없는 파일의 Content-Type 판별)
+MAGIC_SIGNATURES = [
+    (0, b"%PDF-", "application/pdf"),
+    (0, b"ID3", "audio/mpeg"),
+    (0, b"\xff\xfb", "audio/mpeg"),
+    (0, b"\xff\xf3", "audio/mpeg"),
+    (0, b"OggS", "audio/ogg"),
+    (0, b"fLaC", "audio/flac"),
+    (0, b"\x1aE\xdf\xa3", "audio/webm"),
+    (4, b"ftypM4A", "audio/mp4"),
+    (4, b"ftyp", "video/mp4"),
+]
+
+
+def sniff_media_type(path: str) -> Optional[str]:
+    """파일 앞부분 시그니처로 Content-Type 추정"""
+    with open(path, "rb") as f:
+        head = f.read(16)
+    if head.startswith(b"RIFF") and head[8:12] == b"WAVE":
+        return "audio/wav"
+    for offset, signature, media_type in MAGIC_SIGNATURES:
+        if head[offset:offset + len(signature)] == signature:
+            return media_type
+    return None
+
+
+async def detect_media_type(path: str, filename: Optional[str] = None) -> str:
+    """파일명 확장자, 저장 경로 확장자, 파일 시그니처 순으로 Content-Type 판별"""
+    for name in (filename, path):
+        if name:
+            media_type = mimetypes.guess_type(name)[0]
+            if media_type:
+                return media_type
+    return await asyncio.to_thread(sniff_media_type, path) or "application/octet-stream"
+
+
+class RangeNotSatisfiable(Exception):
+    """요청 범위가 파일 크기를 벗어남"""
+    pass
+
+
+def parse_range(header: Optional[str], size: int) -> Optional[Tuple[int, int]]:
+    """Range 헤더를 (시작, 끝) 바이트 위치로 변환 (끝 포함)
+
+    해석할 수 없거나 여러 범위를 요청하면 None(전체 응답)을 반환하고,
+    파일 크기를 벗어나면 RangeNotSatisfiable을 발생시킵니다.
+    """
+    if not header or not header.startswith("bytes="):
+        return None
+    spec = header[len("bytes="):].strip()
+    if "," in spec or "-" not in spec:
+        return None
+    start_text, end_text = (part.strip() for part in spec.split("-", 1))
+    try:
+        if not start_text:
+            # 끝에서부터 suffix 바이트
+            suffix = int(end_text)
+            if suffix <= 0 or size == 0:
+                raise RangeNotSatisfiable()
+            return max(0, size - suffix), size - 1
+        start = int(start_text)
+        end = int(end_text) if end_text else max(start, size - 1)
+    except ValueError:
+        return None
+    if start < 0 or end < start:
+        return None
+    if start >= size:
+        raise RangeNotSatisfiable()
+    return start, min(end, size - 1)
+
+
+def make_etag(stat_result: os.stat_result, content_hash: Optional[str] = None) -> str:
+    """내용 해시가 있으면 강한 ETag, 없으면 크기/수정 시각 기반 약한 ETag"""
+    if content_hash:
+        return f'"{content_hash}"'
+    return f'W/"{stat_result.st_size:x}-{stat_result.st_mtime_ns:x}"'
+
+
+def _etag_matches(header: str, etag: str) -> bool:
+    """If-None-Match 약한 비교"""
+    if header.strip() == "*":
+        return True
+    candidates = {tag.strip().removeprefix("W/") for tag in header.split(",")}
+    return etag.removeprefix("W/") in candidates
+
+
+def _not_modified_since(header: str, mtime: float) -> bool:
+    try:
+        since = parsedate_to_datetime(header)
+    except (TypeError, ValueError):
+        return False
+    return since is not None and int(mtime) <= since.timestamp()
+
+
+def _if_range_matches(header: Optional[str], etag: str, last_modified: str) -> bool:
+    """If-Range 조건 (강한 ETag 또는 Last-Modified 일치 시에만 부분 응답)"""
+    if not header:
+        return True
+    header = header.strip()
+    if header.startswith('"') or header.startswith("W/"):
+        return not etag.startswith("W/") and header == etag
+    return header == last_modified
+
+
+def content_disposition(filename: str) -> str:
+    """다운로드 파일명 헤더 (비ASCII 파일명은 RFC 5987 filename*)"""
+    quoted = quote(filename)
+    if quoted != filename:
+        return f"attachment; filename*=utf-8''{quoted}"
+    return f'attachment; filename="{filename}"'
+
+
+class RangeFileResponse(Response):
+    """파일 전체 또는 일부 구간 응답"""
+
+    chunk_size = 1024 * 1024
+
+    def __init__(
+        self,
+        path: str,
+        start: int,
+        end: int,
+        status_code: int,
+        headers: Dict[str, str],
+        media_type: str,
+        accel_redirect: Optional[str] = None
+    ):
+        super().__init__(status_code=status_code, headers=headers, media_type=media_type)
+        self.path = path
+        self.start = start
+        self.length = end - start + 1
+        self.accel_redirect = accel_redirect
+        if accel_redirect:
+            # nginx가 내부 location에서 sendfile/Range를 직접 처리 (본문 없음)
+            self.headers["content-length"] = "0"
+            self.headers["x-accel-redirect"] = accel_redirect
+        else:
+            self.headers["content-length"] = str(self.length)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        await send({"type": "http.response.start", "status": self.status_code, "headers": self.raw_headers})
+        if scope["method"] == "HEAD" or self.accel_redirect or self.length <= 0:
+            await send({"type": "http.response.body", "body": b""})
+            return
+
+        if ZEROCOPY_EXTENSION in scope.get("extensions", {}):
+            with open(self.path, "rb") as file:
+                await send({
+                    "type": ZEROCOPY_EXTENSION,
+                    "file": file.fileno(),
+                    "offset": self.start,
+                    "count": self.length
+                })
+            return
+
+        async with await anyio.open_file(self.path, "rb") as file:
+            await file.seek(self.start)
+            remaining = self.length
+            while remaining > 0:
+                chunk = await file.read(min(self.chunk_size, remaining))
+                if not chunk:
+                    break
+                remaining -= len(chunk)
+                await send({"type": "http.response.body", "body": chunk, "more_body": remaining > 0})
+        if remaining > 0:
+            # 전송 중 파일이 줄어든 경우 응답 종료
+            await send({"type": "http.response.body", "body": b""})
+
+
+def _accel_redirect_path(path: str) -> Optional[str]:
+    """업로드 디렉토리 아래 파일을 nginx 내부 location 경로로 변환"""
+    prefix = settings.download_accel_redirect_prefix
+    if not prefix:
+        return None
+    root = os.path.abspath(settings.upload_dir)
+    absolute = os.path.abspath(path)
+    if os.path.commonpath([root, absolute]) != root:
+        return None
+    relative = os.path.relpath(absolute, root).replace(os.sep, "/")
+    return prefix.rstrip("/") + "/" + quote(relative)
+
+
+async def file_download_response(
+    request: Request,
+    path: str,
+    filename: str,
+    content_hash: Optional[str] = None,
+    media_type: Optional[str] = None
+) -> Response:
+    """조건부/범위 요청을 처리하는 파일 다운로드 응답 생성 (path는 존재하는 파일이어야 함)"""
+    stat_result = await asyncio.to_thread(os.stat, path)
+    if not stat.S_ISREG(stat_result.st_mode):
+        raise FileNotFoundError(path)
+
+    size = stat_result.st_size
+    etag = make_etag(stat_result, content_hash)
+    last_modified = formatdate(stat_result.st_mtime, usegmt=True)
+    headers = {
+        "etag": etag,
+        "last-modified": last_modified,
+        "accept-ranges": "bytes",
+        "cache-control": "private, no-cache"
+    }
+
+    # 조건부 요청 (If-None-Match가 있으면 If-Modified-Since는 무시)
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        if _etag_matches(if_none_match, etag):
+            return Response(status_code=304, headers=headers)
+    elif request.headers.get("if-modified-since") and _not_modified_since(
+        request.headers["if-modified-since"], stat_result.st_mtime
+    ):
+        return Response(status_code=304, headers=headers)
+
+    media_type = media_type or await detect_media_type(path, filename)
+    headers["content-disposition"] = content_disposition(filename)
+
+    start, end, status_code = 0, size - 1, 200
+    if _if_range_matches(request.headers.get("if-range"), etag, last_modified):
+        try:
+            byte_range = parse_range(request.headers.get("range"), size)
+        except RangeNotSatisfiable:
+            return Response(
+                status_code=416,
+                headers={"content-range": f"bytes */{size}", "accept-ranges": "bytes", "etag": etag}
+            )
+        if byte_range is not None:
+            start, end = byte_range
+            status_code = 206
+            headers["content-range"] = f"bytes {start}-{end}/{size}"
+
+    return RangeFileResponse(
+        path, start, end, status_code, headers, media_type,
+        accel_redirect=_accel_redirect_path(path)
+    )
@@ -0,0 +1,183 @@
+"""
+LLM 응답 캐시
+모델, temperature, 시스템 메시지, 프롬프트의 해시를 키로 파싱된 결과를 영속 저장하는 모듈
+"""
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Optional
+
+from config import settings
+
+
+class LLMResponseCache:
+    """내용 주소 기반(content-addressed) LLM 응답 캐시
+
+    동일한 요청(모델, temperature, 시스템 메시지, 프롬프트)에 대해
+    이전에 파싱된 결과를 OpenAI 호출 없이 반환합니다.
+    TTL 만료와 최대 항목 수 초과 시 가장 오래 사용되지 않은 항목부터 제거합니다.
+    """
+
+    def __init__(self, path: str, ttl_seconds: int = 86400, max_entries: int = 1000):
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+        self._initialized = False
+
+    @staticmethod
+    def make_key(
+        model: str,
+        temperature: float,
+        system_message: str,
+        prompt: str,
+        max_tokens: Optional[int] = None
+    ) -> str:
+        """요청 내용으로부터 캐시 키(SHA-256) 생성"""
+        payload = json.dumps(
+            {
+                "model": model,
+                "temperature": temperature,
+                "system_message": system_message,
+                "prompt": prompt,
+                "max_tokens": max_tokens
+            },
+            ensure_ascii=False,
+            sort_keys=True
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _connect(self) -> sqlite3.Connection:
+        """캐시 저장소 연결 (최초 연결 시 테이블 생성)"""
+        conn = sqlite3.connect(self.path, timeout=5.0)
+        if not self._initialized:
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS llm_cache (
+                    key TEXT PRIMARY KEY,
+                    model TEXT NOT NULL,
+                    value TEXT NOT NULL,
+                    created_at REAL NOT NULL,
+                    last_accessed REAL NOT NULL
+                )
+                """
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS ix_llm_cache_last_accessed ON llm_cache (last_accessed)"
+            )
+            conn.commit()
+            self._initialized = True
+        return conn
+
+    def get(self, key: str) -> Optional[Any]:
+        """캐시 조회 (만료된 항목은 미스로 처리)"""
+        now = time.time()
+        with self._lock:
+            conn = self._connect()
+            try:
+                row = conn.execute(
+                    "SELECT value, created_at FROM llm_cache WHERE key = ?", (key,)
+                ).fetchone()
+                if row is None:
+                    self.misses += 1
+                    return None
+
+                value, created_at = row
+                if self.ttl_seconds and now - created_at > self.ttl_seconds:
+                    conn.execute("DELETE FROM llm_cache WHERE key = ?", (key,))
+                    conn.commit()
+                    self.evictions += 1
+                    self.misses += 1
+                    return None
+
+                conn.execute(
+                    "UPDATE llm_cache SET last_accessed = ? WHERE key = ?", (now, key)
+                )
+                conn.commit()
+                self.hits += 1
+                return json.loads(value)
+            finally:
+                conn.close()
+
+    def set(self, key: str, value: Any, model: str = "") -> None:
+        """캐시 저장 후 TTL/크기 기준 정리"""
+        now = time.time()
+        serialized = json.dumps(value, ensure_ascii=False)
+        with self._lock:
+            conn = self._connect()
+            try:
+                conn.execute(
+                    """
+                    INSERT OR REPLACE INTO llm_cache (key, model, value, created_at, last_accessed)
+                    VALUES (?, ?, ?, ?, ?)
+                    """,
+                    (key, model, serialized, now, now)
+                )
+                self._evict(conn, now)
+                conn.commit()
+            finally:
+                conn.close()
+
+    def _evict(self, conn: sqlite3.Connection, now: float) -> None:
+        """만료 항목 및 최대 항목 수 초과분 제거"""
+        if self.ttl_seconds:
+            cursor = conn.execute(
+                "DELETE FROM llm_cache WHERE created_at < ?", (now - self.ttl_seconds,)
+            )
+            self.evictions += max(cursor.rowcount, 0)
+
+        if self.max_entries:
+            count = conn.execute("SELECT COUNT(*) FROM llm_cache").fetchone()[0]
+            overflow = count - self.max_entries
+            if overflow > 0:
+                cursor = conn.execute(
+                    """
+                    DELETE FROM llm_cache WHERE key IN (
+                        SELECT key FROM llm_cache ORDER BY last_accessed ASC LIMIT ?
+                    )
+                    """,
+                    (overflow,)
+                )
+                self.evictions += max(cursor.rowcount, 0)
+
+    def clear(self) -> None:
+        """캐시 전체 삭제"""
+        with self._lock:
+            conn = self._connect()
+            try:
+                conn.execute("DELETE FROM llm_cache")
+                conn.commit()
+            finally:
+                conn.close()
+
+    def stats(self) -> Dict[str, Any]:
+        """캐시 적중/미스 통계"""
+        with self._lock:
+            conn = self._connect()
+            try:
+                entries = conn.execute("SELECT COUNT(*) FROM llm_cache").fetchone()[0]
+            finally:
+                conn.close()
+
+        total = self.hits + self.misses
+        return {
+            "enabled": settings.llm_cache_enabled,
+            "entries": entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": round(self.hits / total, 4) if total else 0.0
+        }
+
+
+# 전역 캐시 인스턴스
+llm_cache = LLMResponseCache(
+    path=settings.llm_cache_path,
+    ttl_seconds=settings.llm_cache_ttl_seconds,
+    max_entries=settings.llm_cache_max_entries
+)
@@ -0,0 +1,238 @@
+"""
+Prometheus 메트릭
+HTTP 요청(라우트별 지연 시간, 요청당 SQL 수), DB 쿼리, OpenAI 호출(지연 시간, 토큰, 비용),
+n8n 호출(워크플로우별 지연 시간, 오류), WBS 생성 단계별 소요 시간을 수집하고
+/metrics 엔드포인트에서 Prometheus 텍스트 형식으로 노출하는 모듈
+
+요청 경로의 계측 비용을 줄이기 위해 순수 ASGI 미들웨어와 레이블 자식 메트릭 캐시를 사용합니다.
+여러 워커 프로세스로 실행할 때는 PROMETHEUS_MULTIPROC_DIR 환경 변수를 설정하면
+모든 워커의 값을 합산해 노출합니다.
+"""
+import os
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    CollectorRegistry,
+    Counter,
+    Histogram,
+    REGISTRY,
+    generate_latest,
+)
+from prometheus_client.multiprocess import MultiProcessCollector
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+# 외부 API(OpenAI, n8n)와 WBS 단계는 수 초~수 분이 걸리므로 별도 버킷 사용
+HTTP_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+DB_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0)
+QUERY_COUNT_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100)
+EXTERNAL_BUCKETS = (0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 20.0, 30.0, 60.0, 120.0, 300.0)
+
+# 모델별 1K 토큰당 가격 (USD, 입력/출력)
+OPENAI_PRICING_PER_1K: Dict[str, Tuple[float, float]] = {
+    "gpt-4": (0.03, 0.06),
+    "gpt-4-32k": (0.06, 0.12),
+    "gpt-4-turbo": (0.01, 0.03),
+    "gpt-4o": (0.005, 0.015),
+    "gpt-4o-mini": (0.00015, 0.0006),
+    "gpt-3.5-turbo": (0.0005, 0.0015),
+}
+
+HTTP_REQUEST_DURATION = Histogram(
+    "tasktory_http_request_duration_seconds",
+    "HTTP 요청 처리 시간",
+    ["method", "route", "status"],
+    buckets=HTTP_BUCKETS,
+)
+HTTP_REQUEST_DB_QUERIES = Histogram(
+    "tasktory_http_request_db_queries",
+    "HTTP 요청 하나에서 실행된 SQL 문 수",
+    ["method", "route"],
+    buckets=QUERY_COUNT_BUCKETS,
+)
+DB_QUERY_DURATION = Histogram(
+    "tasktory_db_query_duration_seconds",
+    "SQL 문 실행 시간",
+    ["operation"],
+    buckets=DB_BUCKETS,
+)
+OPENAI_REQUEST_DURATION = Histogram(
+    "tasktory_openai_request_duration_seconds",
+    "OpenAI ChatCompletion 호출 시간 (스트리밍은 마지막 청크까지)",
+    ["model", "outcome"],
+    buckets=EXTERNAL_BUCKETS,
+)
+OPENAI_TOKENS = Counter(
+    "tasktory_openai_tokens",
+    "OpenAI 사용 토큰 수 (스트리밍 응답은 추정치)",
+    ["model", "kind"],
+)
+OPENAI_COST = Counter(
+    "tasktory_openai_cost_usd",
+    "OpenAI 사용 추정 비용 (USD)",
+    ["model"],
+)
+N8N_REQUEST_DURATION = Histogram(
+    "tasktory_n8n_request_duration_seconds",
+    "n8n API 호출 시간",
+    ["operation", "workflow_id"],
+    buckets=EXTERNAL_BUCKETS,
+)
+N8N_ERRORS = Counter(
+    "tasktory_n8n_errors",
+    "n8n API 호출 실패 수",
+    ["operation", "workflow_id"],
+)
+WBS_STAGE_DURATION = Histogram(
+    "tasktory_wbs_stage_duration_seconds",
+    "WBS 생성 단계별 소요 시간",
+    ["stage", "outcome"],
+    buckets=EXTERNAL_BUCKETS,
+)
+
+UNMATCHED_ROUTE = "unmatched"
+EXCLUDED_PATHS = frozenset({"/metrics"})
+
+# 현재 요청에서 실행된 SQL 문 수 ([count], 요청 밖에서는 None)
+_request_queries: ContextVar[Optional[List[int]]] = ContextVar("request_queries", default=None)
+
+# 레이블 조합별 자식 메트릭 캐시 (labels() 조회 비용 절감)
+_children: Dict[Tuple[Any, ...], Any] = {}
+
+
+def _child(metric, *labels: str):
+    key = (metric, labels)
+    child = _children.get(key)
+    if child is None:
+        child = _children[key] = metric.labels(*labels)
+    return child
+
+
+class MetricsMiddleware:
+    """라우트 템플릿별 요청 처리 시간과 요청당 SQL 문 수를 기록하는 ASGI 미들웨어"""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["path"] in EXCLUDED_PATHS:
+            await self.app(scope, receive, send)
+            return
+
+        status = 500
+        queries = [0]
+        token = _request_queries.set(queries)
+        start = time.perf_counter()
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed = time.perf_counter() - start
+            _request_queries.reset(token)
+            # 경로 값 대신 라우트 템플릿을 레이블로 사용 (카디널리티 제한)
+            route = scope.get("route")
+            route_name = getattr(route, "path_format", None) or UNMATCHED_ROUTE
+            method = scope["method"]
+            _child(HTTP_REQUEST_DURATION, method, route_name, str(status)).observe(elapsed)
+            _child(HTTP_REQUEST_DB_QUERIES, method, route_name).observe(queries[0])
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_start", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    started = conn.info["query_start"].pop()
+    operation = statement.lstrip()[:6].upper()
+    if operation not in ("SELECT", "INSERT", "UPDATE", "DELETE"):
+        operation = "OTHER"
+    _child(DB_QUERY_DURATION, operation).observe(time.perf_counter() - started)
+    queries = _request_queries.get()
+    if queries is not None:
+        queries[0] += 1
+
+
+def _handle_db_error(exception_context):
+    # 실패한 문은 after_cursor_execute가 호출되지 않으므로 시작 시각만 정리
+    starts = exception_context.connection.info.get("query_start") if exception_context.connection else None
+    if starts:
+        starts.pop()
+
+
+def instrument_engine(sync_engine: Engine) -> Engine:
+    """엔진에 SQL 실행 시간/횟수 이벤트 등록 (비동기 엔진은 sync_engine 전달)"""
+    event.listen(sync_engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(sync_engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(sync_engine, "handle_error", _handle_db_error)
+    return sync_engine
+
+
+def observe_openai_call(
+    model: str,
+    elapsed: float,
+    prompt_tokens: int = 0,
+    completion_tokens: int = 0,
+    outcome: str = "success"
+) -> None:
+    """OpenAI 호출 시간, 토큰 수, 추정 비용 기록"""
+    _child(OPENAI_REQUEST_DURATION, model, outcome).observe(elapsed)
+    if prompt_tokens:
+        _child(OPENAI_TOKENS, model, "prompt").inc(prompt_tokens)
+    if completion_tokens:
+        _child(OPENAI_TOKENS, model, "completion").inc(completion_tokens)
+    pricing = OPENAI_PRICING_PER_1K.get(model)
+    if pricing and (prompt_tokens or completion_tokens):
+        cost = (prompt_tokens * pricing[0] + completion_tokens * pricing[1]) / 1000
+        _child(OPENAI_COST, model).inc(cost)
+
+
+@contextmanager
+def n8n_call_timer(operation: str, workflow_id: str = "") -> Iterator[None]:
+    """n8n API 호출 시간 측정 (예외 발생 시 오류 수 증가)"""
+    start = time.perf_counter()
+    try:
+        yield
+    except Exception:
+        _child(N8N_ERRORS, operation, workflow_id).inc()
+        raise
+    finally:
+        _child(N8N_REQUEST_DURATION, operation, workflow_id).observe(time.perf_counter() - start)
+
+
+@contextmanager
+def stage_timer(stage: str) -> Iterator[Dict[str, Optional[str]]]:
+    """WBS 생성 단계 소요 시간 측정
+
+    예외 없이 끝나면 completed, 예외(취소 포함)가 발생하면 failed로 기록하며,
+    호출자가 yield된 dict의 "outcome"을 지정하면 그 값을 사용합니다.
+    """
+    result: Dict[str, Optional[str]] = {"outcome": None}
+    start = time.perf_counter()
+    try:
+        yield result
+    except BaseException:
+        result["outcome"] = "failed"
+        raise
+    finally:
+        outcome = result["outcome"] or "completed"
+        _child(WBS_STAGE_DURATION, stage, outcome).observe(time.perf_counter() - start)
+
+
+def render_metrics() -> Tuple[bytes, str]:
+    """Prometheus 텍스트 형식의 메트릭과 Content-Type 반환"""
+    if os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+        registry = CollectorRegistry()
+        MultiProcessCollector(registry)
+        return generate_latest(registry), CONTENT_TYPE_LATEST
+    return generate_latest(REGISTRY), CONTENT_TYPE_LATEST
@@ -3,90 +3,156 @@ n8n MCP Client 구현
 n8n과의 통신을 담당하는 클라이언트 모듈
 """
 import asyncio
+import importlib.util
 import json
 from typing import Dict, List, Any, Optional
 import httpx
+from app.core.metrics import n8n_call_timer
 from config import settings
 
 class N8nMCPClient:
-    """n8n MCP Client 클래스"""
-    
-    def __init__(self):
+    """n8n MCP Client 클래스
+
+    커넥션 풀을 공유하는 단일 httpx.AsyncClient를 재사용합니다.
+    애플리케이션에서는 lifespan에서 생성한 공유 인스턴스(get_n8n_client)를 사용합니다.
+    """
+
+    def __init__(self, http_client: Optional[httpx.AsyncClient] = None):
         self.base_url = settings.n8n_mcp_server_url
         self.api_key = settings.n8n_mcp_api_key
         self.headers = {
             "Authorization": f"Bearer {self.api_key}",
             "Content-Type": "application/json"
         }
-    
+        self.timeouts = {
+            "execute_workflow": settings.n8n_timeout_execute,
+            "get_workflow_status": settings.n8n_timeout_status,
+            "trigger_webhook": settings.n8n_timeout_webhook,
+            "create_workflow": settings.n8n_timeout_create,
+            "get_workflows": settings.n8n_timeout_list
+        }
+        self._client = http_client
+        self._owns_client = http_client is None
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """공유 httpx.AsyncClient (최초 사용 시 생성)"""
+        if self._client is None or self._client.is_closed:
+            self._client = self._create_http_client()
+            self._owns_client = True
+        return self._client
+
+    @staticmethod
+    def _create_http_client() -> httpx.AsyncClient:
+        """커넥션 풀/keep-alive 설정이 적용된 httpx.AsyncClient 생성"""
+        limits = httpx.Limits(
+            max_connections=settings.n8n_max_connections,
+            max_keepalive_connections=settings.n8n_max_keepalive_connections,
+            keepalive_expiry=settings.n8n_keepalive_expiry
+        )
+        # HTTP/2는 h2 패키지가 설치된 경우에만 사용
+        http2 = settings.n8n_http2 and importlib.util.find_spec("h2") is not None
+        return httpx.AsyncClient(
+            limits=limits,
+            http2=http2,
+            timeout=httpx.Timeout(settings.n8n_timeout_execute, connect=settings.n8n_connect_timeout)
+        )
+
+    def _timeout(self, endpoint: str) -> httpx.Timeout:
+        """엔드포인트별 타임아웃"""
+        return httpx.Timeout(self.timeouts[endpoint], connect=settings.n8n_connect_timeout)
+
+    async def aclose(self):
+        """공유 클라이언트 종료"""
+        if self._client is not None and self._owns_client:
+            await self._client.aclose()
+        self._client = None
+
     async def execute_workflow(self, workflow_id: str, input_data: Dict[str, Any]) -> Dict[str, Any]:
         """n8n 워크플로우 실행"""
-        async with httpx.AsyncClient() as client:
+        with n8n_call_timer("execute_workflow", workflow_id):
             try:
-                response = await client.post(
+                response = await self.client.post(
                     f"{self.base_url}/api/v1/workflows/{workflow_id}/execute",
                     headers=self.headers,
                     json=input_data,
-                    timeout=30.0
+                    timeout=self._timeout("execute_workflow")
                 )
                 response.raise_for_status()
                 return response.json()
             except httpx.HTTPError as e:
                 raise Exception(f"n8n 워크플로우 실행 실패: {str(e)}")
-    
+
     async def get_workflow_status(self, execution_id: str) -> Dict[str, Any]:
         """워크플로우 실행 상태 조회"""
-        async with httpx.AsyncClient() as client:
+        with n8n_call_timer("get_workflow_status"):
             try:
-                response = await client.get(
+                response = await self.client.get(
                     f"{self.base_url}/api/v1/executions/{execution_id}",
                     headers=self.headers,
-                    timeout=10.0
+                    timeout=self._timeout("get_workflow_status")
                 )
                 response.raise_for_status()
                 return response.json()
             except httpx.HTTPError as e:
                 raise Exception(f"워크플로우 상태 조회 실패: {str(e)}")
-    
+
     async def trigger_webhook(self, webhook_url: str, data: Dict[str, Any]) -> Dict[str, Any]:
         """웹훅 트리거"""
-        async with httpx.AsyncClient() as client:
+        with n8n_call_timer("trigger_webhook"):
             try:
-                response = await client.post(
+                response = await self.client.post(
                     webhook_url,
                     json=data,
-                    timeout=10.0
+                    timeout=self._timeout("trigger_webhook")
                 )
                 response.raise_for_status()
                 return response.json()
             except httpx.HTTPError as e:
                 raise Exception(f"웹훅 트리거 실패: {str(e)}")
-    
+
     async def create_workflow(self, workflow_data: Dict[str, Any]) -> Dict[str, Any]:
         """새 워크플로우 생성"""
-        async with httpx.AsyncClient() as client:
+        with n8n_call_timer("create_workflow"):
             try:
-                response = await client.post(
+                response = await self.client.post(
                     f"{self.base_url}/api/v1/workflows",
                     headers=self.headers,
                     json=workflow_data,
-                    timeout=30.0
+                    timeout=self._timeout("create_workflow")
                 )
                 response.raise_for_status()
                 return response.json()
             except httpx.HTTPError as e:
                 raise Exception(f"워크플로우 생성 실패: {str(e)}")
-    
+
     async def get_workflows(self) -> List[Dict[str, Any]]:
         """워크플로우 목록 조회"""
-        async with httpx.AsyncClient() as client:
+        with n8n_call_timer("get_workflows"):
             try:
-                response = await client.get(
+                response = await self.client.get(
                     f"{self.base_url}/api/v1/workflows",
                     headers=self.headers,
-                    timeout=10.0
+                    timeout=self._timeout("get_workflows")
                 )
                 response.raise_for_status()
                 return response.json()
             except httpx.HTTPError as e:
                 raise Exception(f"워크플로우 목록 조회 실패: {str(e)}")
+
+# 애플리케이션 전역 공유 클라이언트
+_shared_client: Optional[N8nMCPClient] = None
+
+def get_n8n_client() -> N8nMCPClient:
+    """공유 N8nMCPClient 인스턴스 반환"""
+    global _shared_client
+    if _shared_client is None:
+        _shared_client = N8nMCPClient()
+    return _shared_client
+
+async def close_n8n_client():
+    """공유 N8nMCPClient 종료"""
+    global _shared_client
+    if _shared_client is not None:
+        await _shared_client.aclose()
+        _shared_client = None
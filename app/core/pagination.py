@@ -0,0 +1,120 @@
+"""
+목록 API 키셋(커서) 페이지네이션
+id 기준으로 정렬된 목록을 "마지막으로 본 id 이후" 조건으로 잘라 읽어
+깊은 페이지도 첫 페이지와 같은 비용으로 조회합니다.
+다음 페이지 커서는 X-Next-Cursor / Link 응답 헤더로 전달합니다.
+"""
+import base64
+import binascii
+import json
+from typing import Any, Dict, List, Optional
+
+from fastapi import HTTPException, Query, Request, Response
+from sqlalchemy import Select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from config import settings
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+PAGE_LIMIT_HEADER = "X-Page-Limit"
+PAGINATION_HEADERS = [NEXT_CURSOR_HEADER, PAGE_LIMIT_HEADER, "Link"]
+
+
+def _encode_payload(payload: Dict[str, Any]) -> str:
+    data = json.dumps(payload, separators=(",", ":"))
+    return base64.urlsafe_b64encode(data.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def _decode_payload(cursor: str, key: str) -> Dict[str, Any]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+    except (binascii.Error, UnicodeError, ValueError) as e:
+        raise ValueError("커서 형식이 올바르지 않습니다") from e
+    if not isinstance(payload, dict) or not isinstance(payload.get(key), int):
+        raise ValueError("커서 형식이 올바르지 않습니다")
+    return payload
+
+
+def encode_cursor(last_id: int, order: str) -> str:
+    """마지막 행 id와 정렬 방향을 불투명한 커서 문자열로 변환"""
+    return _encode_payload({"id": last_id, "o": order})
+
+
+def decode_cursor(cursor: str, order: str) -> int:
+    """커서 문자열에서 마지막 행 id 복원 (형식이 잘못되었거나 정렬 방향이 다르면 ValueError)"""
+    payload = _decode_payload(cursor, "id")
+    if payload.get("o") != order:
+        raise ValueError("커서의 정렬 방향이 요청과 다릅니다")
+    return payload["id"]
+
+
+def encode_offset_cursor(offset: int) -> str:
+    """순위 정렬 결과(검색 등)의 다음 페이지 시작 위치를 커서 문자열로 변환"""
+    return _encode_payload({"off": offset})
+
+
+def decode_offset_cursor(cursor: str) -> int:
+    """커서 문자열에서 시작 위치 복원 (형식이 잘못되었으면 ValueError)"""
+    offset = _decode_payload(cursor, "off")["off"]
+    if offset < 0:
+        raise ValueError("커서 형식이 올바르지 않습니다")
+    return offset
+
+
+def set_page_headers(request: Request, response: Response, limit: int, next_cursor: Optional[str]) -> None:
+    """페이지 크기와 다음 페이지 커서/URL을 응답 헤더에 기록"""
+    response.headers[PAGE_LIMIT_HEADER] = str(limit)
+    if next_cursor:
+        next_url = request.url.include_query_params(cursor=next_cursor, limit=limit)
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+        response.headers["Link"] = f'<{next_url}>; rel="next"'
+
+
+class PageParams:
+    """목록 API 공통 페이지 파라미터 (FastAPI 의존성)"""
+
+    def __init__(
+        self,
+        cursor: Optional[str] = Query(None, description="이전 응답의 X-Next-Cursor 값"),
+        limit: Optional[int] = Query(None, ge=1, description="페이지 크기 (서버 최대값으로 제한)"),
+        order: str = Query("asc", pattern="^(asc|desc)$", description="id 정렬 방향")
+    ):
+        self.order = order
+        self.limit = min(limit or settings.pagination_default_limit, settings.pagination_max_limit)
+        self.after_id: Optional[int] = None
+        if cursor:
+            try:
+                self.after_id = decode_cursor(cursor, order)
+            except ValueError as e:
+                raise HTTPException(status_code=400, detail=str(e))
+
+
+async def paginate(
+    db: AsyncSession,
+    query: Select,
+    key_column,
+    page: PageParams,
+    request: Request,
+    response: Response
+) -> List[Any]:
+    """키셋 조건으로 한 페이지를 조회하고 다음 페이지 커서를 응답 헤더에 기록"""
+    if page.order == "desc":
+        if page.after_id is not None:
+            query = query.where(key_column < page.after_id)
+        query = query.order_by(key_column.desc())
+    else:
+        if page.after_id is not None:
+            query = query.where(key_column > page.after_id)
+        query = query.order_by(key_column)
+
+    # 한 행을 더 읽어 다음 페이지 존재 여부 확인
+    result = await db.execute(query.limit(page.limit + 1))
+    items = list(result.scalars().all())
+
+    next_cursor = None
+    if len(items) > page.limit:
+        items = items[:page.limit]
+        next_cursor = encode_cursor(getattr(items[-1], key_column.key), page.order)
+    set_page_headers(request, response, page.limit, next_cursor)
+    return items
@@ -0,0 +1,94 @@
+"""
+업로드 파일 스트리밍 저장
+업로드 본문을 고정 크기 청크로 읽어 이벤트 루프 밖(스레드)에서 디스크에 기록하고,
+기록하는 동안 크기 제한 검사와 SHA-256 계산을 함께 수행하는 모듈
+"""
+import asyncio
+import hashlib
+import os
+from dataclasses import dataclass
+from typing import BinaryIO, Optional
+
+from fastapi import UploadFile
+
+from config import settings
+
+
+class UploadTooLargeError(Exception):
+    """업로드 크기 제한 초과"""
+
+    def __init__(self, max_bytes: int):
+        super().__init__(f"파일 크기는 {max_bytes // (1024 * 1024)}MB를 초과할 수 없습니다.")
+        self.max_bytes = max_bytes
+
+
+@dataclass
+class StoredUpload:
+    """저장된 업로드 파일 정보"""
+    path: str
+    size: int
+    sha256: str
+
+
+def safe_filename(filename: str) -> str:
+    """클라이언트가 보낸 파일명에서 디렉토리 경로 제거"""
+    name = os.path.basename((filename or "").replace("\\", "/")).strip()
+    return name or "upload"
+
+
+def _open_part_file(path: str) -> BinaryIO:
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    return open(path, "wb")
+
+
+def _write_chunk(buffer: BinaryIO, hasher, chunk: bytes) -> None:
+    hasher.update(chunk)
+    buffer.write(chunk)
+
+
+def _discard(buffer: BinaryIO, path: str) -> None:
+    buffer.close()
+    if os.path.exists(path):
+        os.remove(path)
+
+
+def _commit(buffer: BinaryIO, part_path: str, path: str) -> None:
+    buffer.close()
+    os.replace(part_path, path)
+
+
+async def save_upload(
+    upload: UploadFile,
+    path: str,
+    max_bytes: int,
+    chunk_size: Optional[int] = None
+) -> StoredUpload:
+    """업로드 파일을 청크 단위로 path에 저장 (업로드 크기와 관계없이 메모리 사용량 일정)
+
+    크기 제한을 넘으면 기록 중이던 임시 파일을 삭제하고 UploadTooLargeError를 발생시킵니다.
+    완료된 파일만 path에 나타나도록 임시 파일(.part)에 기록한 뒤 교체합니다.
+    """
+    if upload.size is not None and upload.size > max_bytes:
+        raise UploadTooLargeError(max_bytes)
+
+    chunk_size = chunk_size or settings.upload_chunk_size
+    part_path = f"{path}.part"
+    hasher = hashlib.sha256()
+    size = 0
+
+    buffer = await asyncio.to_thread(_open_part_file, part_path)
+    try:
+        while True:
+            chunk = await upload.read(chunk_size)
+            if not chunk:
+                break
+            size += len(chunk)
+            if size > max_bytes:
+                raise UploadTooLargeError(max_bytes)
+            await asyncio.to_thread(_write_chunk, buffer, hasher, chunk)
+    except BaseException:
+        await asyncio.to_thread(_discard, buffer, part_path)
+        raise
+
+    await asyncio.to_thread(_commit, buffer, part_path, path)
+    return StoredUpload(path=path, size=size, sha256=hasher.hexdigest())
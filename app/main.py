@@ -2,14 +2,19 @@
 Tasktory 메인 애플리케이션
 FastAPI 기반의 n8n MCP client 프로젝트 관리 자동화 시스템
 """
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Response
 from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
+import asyncio
 import uvicorn
 
-from app.core.database import init_db
+from app.core.database import init_db, close_db
 from app.api.v1.router import router as api_router
-from app.core.n8n_client import N8nMCPClient
+from app.core.n8n_client import get_n8n_client, close_n8n_client
+from app.core.metrics import MetricsMiddleware, render_metrics
+from app.core.pagination import PAGINATION_HEADERS
+from app.services.text_extraction import shutdown_extraction_executor
+from app.services.wbs_job_service import fail_interrupted_jobs
 from config import settings
 
 @asynccontextmanager
@@ -17,10 +22,15 @@ async def lifespan(app: FastAPI):
     """애플리케이션 생명주기 관리"""
     # 시작 시 초기화
     await init_db()
-    app.state.n8n_client = N8nMCPClient()
+    interrupted = await asyncio.to_thread(fail_interrupted_jobs)
+    if interrupted:
+        print(f"⚠️ 재시작으로 중단된 WBS 생성 작업 {interrupted}개를 실패로 표시했습니다")
+    app.state.n8n_client = get_n8n_client()
     yield
-    # 종료 시 정리
-    pass
+    # 종료 시 정리 (공유 n8n 커넥션 풀, 텍스트 추출 프로세스 풀, 데이터베이스 커넥션 풀 종료)
+    await close_n8n_client()
+    shutdown_extraction_executor()
+    await close_db()
 
 # FastAPI 앱 생성
 app = FastAPI(
@@ -37,8 +47,13 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=PAGINATION_HEADERS,
 )
 
+# 요청 메트릭 (라우트별 처리 시간, 요청당 SQL 문 수)
+if settings.metrics_enabled:
+    app.add_middleware(MetricsMiddleware)
+
 # API 라우터 등록
 app.include_router(api_router, prefix="/api/v1")
 
@@ -56,6 +71,14 @@ async def health_check():
     """헬스 체크 엔드포인트"""
     return {"status": "healthy", "service": "tasktory"}
 
+@app.get("/metrics", include_in_schema=False)
+async def metrics():
+    """Prometheus 메트릭 엔드포인트"""
+    if not settings.metrics_enabled:
+        raise HTTPException(status_code=404, detail="메트릭이 비활성화되어 있습니다")
+    body, content_type = render_metrics()
+    return Response(content=body, headers={"Content-Type": content_type})
+
 if __name__ == "__main__":
     uvicorn.run(
         "app.main:app",
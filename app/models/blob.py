@@ -0,0 +1,27 @@
+"""
+파일 저장소 관련 데이터 모델
+"""
+from sqlalchemy import Column, Integer, BigInteger, String, Text, DateTime
+from app.core.database import Base
+from datetime import datetime
+
+class Blob(Base):
+    """내용 주소 기반 저장소의 파일 (SHA-256 키, 참조 카운트)"""
+    __tablename__ = "blobs"
+
+    sha256 = Column(String(64), primary_key=True)
+    size = Column(BigInteger, nullable=False)
+    ref_count = Column(Integer, nullable=False, default=0)  # Document.file_path, Meeting.audio_file_path 참조 수
+    created_at = Column(DateTime, default=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, index=True)
+
+class ExtractedText(Base):
+    """파일에서 추출한 정규화 평문 (파일 SHA-256 키, 같은 내용은 한 번만 추출)"""
+    __tablename__ = "extracted_texts"
+
+    content_hash = Column(String(64), primary_key=True)
+    extractor = Column(String(20))  # txt, md, docx, xlsx, pdf 등
+    text = Column(Text, nullable=True)  # 추출 실패 시 None
+    char_count = Column(Integer, default=0)
+    error = Column(Text, nullable=True)  # 지원하지 않는 형식 등 실패 사유
+    created_at = Column(DateTime, default=datetime.utcnow)
@@ -0,0 +1,24 @@
+"""
+비동기 작업 관련 데이터 모델
+"""
+from sqlalchemy import Column, Integer, String, Text, DateTime, JSON
+from app.core.database import Base
+from datetime import datetime
+
+class WBSGenerationJob(Base):
+    """WBS 생성 작업 모델"""
+    __tablename__ = "wbs_generation_jobs"
+
+    id = Column(String(32), primary_key=True)  # uuid4 hex
+    project_id = Column(Integer, index=True)
+    status = Column(String(50), default="queued")  # queued, running, completed, failed
+    backend = Column(String(20), default="inprocess")  # inprocess, celery
+    owner = Column(String(100), nullable=True)  # inprocess 작업을 실행하는 프로세스 ("호스트:PID")
+    stages = Column(JSON)  # 단계별 상태 {"requirements": {"status": ..., "started_at": ..., "finished_at": ...}, ...}
+    request_payload = Column(JSON)  # 생성 요청 원본
+    result = Column(JSON)  # 생성 결과
+    error = Column(Text)
+    created_at = Column(DateTime, default=datetime.utcnow)
+    started_at = Column(DateTime, nullable=True)
+    finished_at = Column(DateTime, nullable=True)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
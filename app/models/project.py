@@ -29,8 +29,13 @@ class WBSItem(Base):
     __tablename__ = "wbs_items"
     
     id = Column(Integer, primary_key=True, index=True)
-    project_id = Column(Integer, ForeignKey("projects.id"))
-    parent_id = Column(Integer, ForeignKey("wbs_items.id"), nullable=True)
+    project_id = Column(Integer, ForeignKey("projects.id"), index=True)
+    parent_id = Column(Integer, ForeignKey("wbs_items.id"), nullable=True, index=True)
+    # 조상 ID 경로 (자기 자신 제외, 루트는 "/", 예: "/1/5/"), 하위 트리는 접두 범위로 조회
+    path = Column(
+        String(500).with_variant(String(500, collation="C"), "postgresql"),
+        nullable=False, default="/", server_default="/", index=True
+    )
     title = Column(String(255), nullable=False)
     description = Column(Text)
     level = Column(Integer, default=1)
@@ -51,12 +56,13 @@ class Meeting(Base):
     __tablename__ = "meetings"
     
     id = Column(Integer, primary_key=True, index=True)
-    project_id = Column(Integer, ForeignKey("projects.id"))
+    project_id = Column(Integer, ForeignKey("projects.id"), index=True)
     title = Column(String(255), nullable=False)
     description = Column(Text)
     meeting_date = Column(DateTime)
     participants = Column(JSON)  # 참석자 리스트
     audio_file_path = Column(String(500))
+    audio_content_hash = Column(String(64), nullable=True, index=True)  # 녹음 파일 SHA-256 (blobs 참조)
     transcript = Column(Text)
     summary = Column(Text)
     action_items = Column(JSON)
@@ -70,13 +76,16 @@ class Document(Base):
     __tablename__ = "documents"
     
     id = Column(Integer, primary_key=True, index=True)
-    project_id = Column(Integer, ForeignKey("projects.id"), nullable=True)
+    project_id = Column(Integer, ForeignKey("projects.id"), nullable=True, index=True)
     project_name = Column(String(255), nullable=True)  # 직접 입력된 프로젝트명
     title = Column(String(255), nullable=False)
     document_type = Column(String(100))  # proposal, rfp, design, manual, etc.
     description = Column(Text)  # 문서 설명
     content = Column(Text)
     file_path = Column(String(500))
+    file_name = Column(String(255), nullable=True)  # 업로드 원본 파일명
+    content_hash = Column(String(64), nullable=True, index=True)  # 첨부파일 SHA-256 (blobs, extracted_texts 참조)
+    text_status = Column(String(20), nullable=True)  # 첨부파일 텍스트 추출 상태: pending, completed, failed
     status = Column(String(50), default="draft")  # draft, review, approved, completed
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
@@ -1,7 +1,7 @@
 """
 팀원 관리 모델
 """
-from sqlalchemy import Column, Integer, String, DateTime, Boolean, Text, ForeignKey
+from sqlalchemy import Column, Integer, String, DateTime, Boolean, Text, ForeignKey, Index, text
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.core.database import Base
@@ -14,11 +14,11 @@ class TeamMember(Base):
     name = Column(String(100), nullable=False, index=True)
     email = Column(String(255), unique=True, nullable=False, index=True)
     position = Column(String(100), nullable=False)  # 직책
-    department = Column(String(100), nullable=True)  # 부서
+    department = Column(String(100), nullable=True, index=True)  # 부서
     experience_years = Column(Integer, default=0)  # 경력 년수
     skills = Column(Text, nullable=True)  # 기술 스택 (JSON 문자열)
-    skill_level = Column(String(20), default="Junior")  # Junior, Mid, Senior
-    availability = Column(Boolean, default=True)  # 프로젝트 참여 가능 여부
+    skill_level = Column(String(20), default="Junior", index=True)  # Junior, Mid, Senior
+    availability = Column(Boolean, default=True, index=True)  # 프로젝트 참여 가능 여부
     hourly_rate = Column(Integer, nullable=True)  # 시간당 비용 (선택사항)
     notes = Column(Text, nullable=True)  # 메모
     created_at = Column(DateTime(timezone=True), server_default=func.now())
@@ -30,6 +30,19 @@ class TeamMember(Base):
 class ProjectMember(Base):
     """프로젝트 멤버 모델"""
     __tablename__ = "project_members"
+    __table_args__ = (
+        Index("ix_project_members_project_active", "project_id", "is_active"),
+        Index("ix_project_members_member_active", "team_member_id", "is_active"),
+        # 같은 프로젝트에 같은 팀원의 활성 멤버십은 하나만 허용
+        Index(
+            "uq_project_members_active_member",
+            "project_id",
+            "team_member_id",
+            unique=True,
+            sqlite_where=text("is_active = 1"),
+            postgresql_where=text("is_active = true")
+        ),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     project_id = Column(Integer, ForeignKey("projects.id"), nullable=False)
@@ -49,6 +62,9 @@ class ProjectMember(Base):
 class ProjectTemplate(Base):
     """프로젝트 템플릿 모델"""
     __tablename__ = "project_templates"
+    __table_args__ = (
+        Index("ix_project_templates_active_category", "is_active", "category"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String(200), nullable=False)
@@ -0,0 +1,322 @@
+"""
+작업-팀원 할당 엔진
+필요 기술, 숙련도 차이, 시간당 비용, 현재 작업량을 NumPy로 벡터화하여 점수화하고
+용량 제한 하의 최소 비용 할당을 계산하는 모듈
+"""
+from dataclasses import dataclass, field
+from typing import Dict, List, Any, Optional, Sequence
+
+import numpy as np
+
+SKILL_LEVELS = {"junior": 1, "mid": 2, "senior": 3, "expert": 4}
+
+# 정확 해법(헝가리안)을 사용할 최대 비용 행렬 크기 (작업 수 x 슬롯 수)
+EXACT_MAX_CELLS = 40_000
+
+# 할당 불가 비용
+INFEASIBLE_COST = 1e6
+
+
+@dataclass
+class AssignmentWeights:
+    """비용 가중치"""
+    skill: float = 4.0  # 필요 기술 미보유 비율
+    under_level: float = 2.0  # 요구 숙련도 대비 부족 단계당
+    over_level: float = 0.3  # 요구 숙련도 대비 초과 단계당 (고급 인력 낭비)
+    rate: float = 1.0  # 시간당 비용 (최대 비용 대비 비율)
+    load: float = 1.5  # 현재 작업량 (가용 시간 대비 비율)
+
+
+@dataclass
+class AssignmentCandidate:
+    """할당 대상 팀원"""
+    name: str
+    skills: List[str]
+    skill_level: str = "Junior"
+    hourly_rate: Optional[float] = None
+    capacity_hours: Optional[float] = None  # None이면 제한 없음
+    current_load_hours: float = 0.0
+    available: bool = True
+
+
+@dataclass
+class AssignmentResult:
+    """할당 결과"""
+    assignments: List[Optional[str]]  # 작업 인덱스별 담당자명 (미할당 None)
+    costs: List[Optional[float]]
+    member_hours: Dict[str, float] = field(default_factory=dict)
+    method: str = "greedy"
+
+    @property
+    def unassigned(self) -> List[int]:
+        return [i for i, name in enumerate(self.assignments) if name is None]
+
+
+def _normalize_skill(skill: Any) -> str:
+    return str(skill or "").strip().lower()
+
+
+def _level(value: Any, default: int = 1) -> int:
+    return SKILL_LEVELS.get(str(value or "").strip().lower(), default)
+
+
+class AssignmentEngine:
+    """작업-팀원 최소 비용 할당 엔진
+
+    - 비용 행렬은 작업 x 팀원 크기로 한 번에 계산합니다 (행렬 곱 기반 기술 일치도).
+    - 작은 문제는 팀원별 용량을 슬롯으로 펼친 헝가리안 알고리즘으로 최적 할당합니다.
+    - 큰 문제는 후회(regret) 순서의 용량 제한 탐욕 할당을 사용합니다.
+    - 두 방식 모두 팀원별 가용 시간(capacity_hours)을 초과하지 않습니다.
+    """
+
+    def __init__(self, weights: Optional[AssignmentWeights] = None):
+        self.weights = weights or AssignmentWeights()
+
+    def cost_matrix(
+        self,
+        tasks: Sequence[Dict[str, Any]],
+        members: Sequence[AssignmentCandidate]
+    ) -> np.ndarray:
+        """작업 x 팀원 비용 행렬 계산"""
+        n_tasks, n_members = len(tasks), len(members)
+        if n_tasks == 0 or n_members == 0:
+            return np.zeros((n_tasks, n_members), dtype=np.float32)
+
+        # 기술 어휘 및 이진 행렬
+        vocabulary: Dict[str, int] = {}
+        task_skill_rows, task_skill_cols = [], []
+        for i, task in enumerate(tasks):
+            for skill in task.get("required_skills") or []:
+                key = _normalize_skill(skill)
+                if key:
+                    task_skill_rows.append(i)
+                    task_skill_cols.append(vocabulary.setdefault(key, len(vocabulary)))
+        member_skill_rows, member_skill_cols = [], []
+        for j, member in enumerate(members):
+            for skill in member.skills or []:
+                key = _normalize_skill(skill)
+                if key in vocabulary:
+                    member_skill_rows.append(j)
+                    member_skill_cols.append(vocabulary[key])
+
+        n_skills = max(len(vocabulary), 1)
+        task_skills = np.zeros((n_tasks, n_skills), dtype=np.float32)
+        task_skills[task_skill_rows, task_skill_cols] = 1.0
+        member_skills = np.zeros((n_members, n_skills), dtype=np.float32)
+        member_skills[member_skill_rows, member_skill_cols] = 1.0
+
+        required_count = task_skills.sum(axis=1, keepdims=True)
+        matched = task_skills @ member_skills.T
+        coverage = np.where(required_count > 0, matched / np.maximum(required_count, 1.0), 1.0)
+        cost = self.weights.skill * (1.0 - coverage)
+
+        # 숙련도 차이
+        required_level = np.array(
+            [_level(task.get("skill_level_required"), 1) for task in tasks], dtype=np.float32
+        )[:, None]
+        member_level = np.array([_level(m.skill_level, 1) for m in members], dtype=np.float32)[None, :]
+        gap = required_level - member_level
+        cost += self.weights.under_level * np.maximum(gap, 0.0)
+        cost += self.weights.over_level * np.maximum(-gap, 0.0)
+
+        # 시간당 비용 (미입력 시 중앙값)
+        rates = np.array(
+            [m.hourly_rate if m.hourly_rate is not None else np.nan for m in members], dtype=np.float32
+        )
+        if np.isfinite(rates).any():
+            rates = np.where(np.isfinite(rates), rates, np.nanmedian(rates))
+            max_rate = rates.max()
+            if max_rate > 0:
+                cost += self.weights.rate * (rates / max_rate)[None, :]
+
+        # 현재 작업량
+        load = np.array([
+            (m.current_load_hours / m.capacity_hours) if m.capacity_hours else 0.0
+            for m in members
+        ], dtype=np.float32)
+        cost += self.weights.load * load[None, :]
+
+        unavailable = np.array([not m.available for m in members])
+        if unavailable.any():
+            cost[:, unavailable] = INFEASIBLE_COST
+
+        return cost
+
+    def assign(
+        self,
+        tasks: Sequence[Dict[str, Any]],
+        members: Sequence[AssignmentCandidate]
+    ) -> AssignmentResult:
+        """용량 제한 하의 최소 비용 할당"""
+        n_tasks = len(tasks)
+        if n_tasks == 0 or not members:
+            return AssignmentResult(assignments=[None] * n_tasks, costs=[None] * n_tasks, method="none")
+
+        cost = self.cost_matrix(tasks, members)
+        hours = np.array([max(float(t.get("estimated_hours") or 0), 0.0) for t in tasks], dtype=np.float64)
+        capacity = np.array([
+            np.inf if m.capacity_hours is None else max(m.capacity_hours - m.current_load_hours, 0.0)
+            for m in members
+        ], dtype=np.float64)
+
+        slots = self._slot_counts(hours, capacity, n_tasks)
+        if n_tasks * int(slots.sum()) <= EXACT_MAX_CELLS:
+            member_index = self._assign_exact(cost, slots)
+            method = "hungarian"
+        else:
+            member_index = self._assign_greedy(cost, hours, capacity)
+            method = "greedy"
+
+        member_index = self._repair_capacity(cost, hours, capacity, member_index)
+
+        assignments: List[Optional[str]] = []
+        costs: List[Optional[float]] = []
+        member_hours: Dict[str, float] = {m.name: 0.0 for m in members}
+        for i, j in enumerate(member_index):
+            if j < 0 or cost[i, j] >= INFEASIBLE_COST:
+                assignments.append(None)
+                costs.append(None)
+                continue
+            assignments.append(members[j].name)
+            costs.append(round(float(cost[i, j]), 4))
+            member_hours[members[j].name] += float(hours[i])
+
+        return AssignmentResult(
+            assignments=assignments,
+            costs=costs,
+            member_hours=member_hours,
+            method=method
+        )
+
+    @staticmethod
+    def _slot_counts(hours: np.ndarray, capacity: np.ndarray, n_tasks: int) -> np.ndarray:
+        """팀원별 슬롯 수 (가용 시간 / 평균 작업 시간)"""
+        mean_hours = float(hours[hours > 0].mean()) if (hours > 0).any() else 1.0
+        slots = np.where(
+            np.isfinite(capacity),
+            np.floor(capacity / mean_hours),
+            n_tasks
+        )
+        return np.minimum(slots, n_tasks).astype(np.int64)
+
+    @staticmethod
+    def _assign_exact(cost: np.ndarray, slots: np.ndarray) -> np.ndarray:
+        """팀원 용량을 슬롯으로 펼쳐 헝가리안 알고리즘으로 최적 할당"""
+        n_tasks = cost.shape[0]
+        columns = np.repeat(np.arange(cost.shape[1]), slots)
+        expanded = cost[:, columns].astype(np.float64)
+
+        # 슬롯이 부족하면 미할당용 더미 열 추가
+        shortage = n_tasks - expanded.shape[1]
+        if shortage > 0:
+            expanded = np.hstack([expanded, np.full((n_tasks, shortage), INFEASIBLE_COST)])
+            columns = np.concatenate([columns, np.full(shortage, -1)])
+
+        row_to_col = _hungarian(expanded)
+        return np.array([columns[c] for c in row_to_col], dtype=np.int64)
+
+    @staticmethod
+    def _assign_greedy(cost: np.ndarray, hours: np.ndarray, capacity: np.ndarray) -> np.ndarray:
+        """후회(최선-차선 비용 차이)가 큰 작업부터 용량 내 최저 비용 팀원에게 할당"""
+        n_tasks, n_members = cost.shape
+        if n_members > 1:
+            best_two = np.partition(cost, 1, axis=1)[:, :2]
+            regret = best_two[:, 1] - best_two[:, 0]
+        else:
+            regret = np.zeros(n_tasks)
+
+        # 후회가 큰 작업, 같으면 긴 작업 우선
+        order = np.lexsort((-hours, -regret))
+        remaining = capacity.copy()
+        result = np.full(n_tasks, -1, dtype=np.int64)
+        preference = np.argsort(cost, axis=1)
+
+        for i in order:
+            fits = remaining >= hours[i] - 1e-9
+            if not fits.any():
+                continue
+            row = preference[i]
+            j = row[np.argmax(fits[row])]
+            result[i] = j
+            remaining[j] -= hours[i]
+        return result
+
+    @staticmethod
+    def _repair_capacity(
+        cost: np.ndarray,
+        hours: np.ndarray,
+        capacity: np.ndarray,
+        member_index: np.ndarray
+    ) -> np.ndarray:
+        """용량을 초과한 팀원의 작업을 다른 팀원에게 재할당"""
+        member_index = member_index.copy()
+        used = np.zeros(len(capacity))
+        for i, j in enumerate(member_index):
+            if j >= 0:
+                used[j] += hours[i]
+
+        overloaded = np.where(used > capacity + 1e-9)[0]
+        for j in overloaded:
+            # 이 팀원에게 비용 이점이 가장 적은 작업부터 이동
+            task_ids = np.where(member_index == j)[0]
+            task_ids = task_ids[np.argsort(-cost[task_ids, j])]
+            for i in task_ids:
+                if used[j] <= capacity[j] + 1e-9:
+                    break
+                used[j] -= hours[i]
+                member_index[i] = -1
+                fits = capacity - used >= hours[i] - 1e-9
+                fits[j] = False
+                if fits.any():
+                    candidates = np.where(fits)[0]
+                    k = candidates[np.argmin(cost[i, candidates])]
+                    member_index[i] = k
+                    used[k] += hours[i]
+        return member_index
+
+
+def _hungarian(cost: np.ndarray) -> List[int]:
+    """직사각 비용 행렬(행 <= 열)의 최소 비용 완전 매칭 (행별 열 인덱스)"""
+    n, m = cost.shape
+    u = np.zeros(n + 1)
+    v = np.zeros(m + 1)
+    p = np.zeros(m + 1, dtype=np.int64)  # 열 j에 매칭된 행 (1부터, 0은 미매칭)
+    way = np.zeros(m + 1, dtype=np.int64)
+
+    for i in range(1, n + 1):
+        p[0] = i
+        j0 = 0
+        minv = np.full(m + 1, np.inf)
+        used = np.zeros(m + 1, dtype=bool)
+        while True:
+            used[j0] = True
+            i0 = p[j0]
+            free = ~used[1:]
+            current = cost[i0 - 1] - u[i0] - v[1:]
+            improve = free & (current < minv[1:])
+            minv[1:][improve] = current[improve]
+            way[1:][improve] = j0
+
+            candidates = np.where(free, minv[1:], np.inf)
+            j1 = int(np.argmin(candidates)) + 1
+            delta = candidates[j1 - 1]
+
+            u[p[used]] += delta
+            v[used] -= delta
+            minv[1:][free] -= delta
+            j0 = j1
+            if p[j0] == 0:
+                break
+
+        while True:
+            j1 = way[j0]
+            p[j0] = p[j1]
+            j0 = j1
+            if j0 == 0:
+                break
+
+    row_to_col = [0] * n
+    for j in range(1, m + 1):
+        if p[j]:
+            row_to_col[p[j] - 1] = j - 1
+    return row_to_col
@@ -0,0 +1,108 @@
+"""
+업로드 파일 저장 및 참조 카운트 관리 서비스
+업로드를 내용 주소 기반 저장소에 넣고, 파일을 가리키는
+Document.file_path / Meeting.audio_file_path 수를 blobs 테이블에 기록하는 모듈
+"""
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Optional
+
+from fastapi import UploadFile
+from sqlalchemy import delete, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.blob_store import blob_store
+from app.core.uploads import save_upload
+from app.models.blob import Blob
+from config import settings
+
+
+@dataclass
+class StoredBlob:
+    """저장소에 저장된 업로드"""
+    path: str
+    sha256: str
+    size: int
+    deduplicated: bool  # 이미 같은 내용이 저장되어 있었는지 여부
+
+
+async def _ensure_blob_row(db: AsyncSession, sha256: str, size: int) -> None:
+    """blobs 행이 없으면 생성하고, 있으면 가비지 컬렉션 유예 시간을 갱신"""
+    result = await db.execute(
+        update(Blob).where(Blob.sha256 == sha256).values(updated_at=datetime.utcnow())
+    )
+    if result.rowcount == 0:
+        db.add(Blob(sha256=sha256, size=size, ref_count=0))
+    try:
+        await db.commit()
+    except IntegrityError:
+        # 같은 내용이 동시에 업로드된 경우
+        await db.rollback()
+
+
+async def store_upload(db: AsyncSession, upload: UploadFile, max_bytes: int) -> StoredBlob:
+    """업로드를 스트리밍으로 해시 계산하며 저장소에 저장 (참조 카운트는 증가시키지 않음)
+
+    가비지 컬렉션이 행을 다시 확인한 뒤 파일을 지우므로 blobs 행을 먼저 커밋하고 파일을 저장합니다.
+    """
+    stored = await save_upload(upload, blob_store.staging_path(), max_bytes)
+    await _ensure_blob_row(db, stored.sha256, stored.size)
+    path, created = await blob_store.ingest(stored.path, stored.sha256)
+    if not created:
+        print(f"♻️ 중복 업로드 재사용: {stored.sha256[:12]} ({stored.size} bytes)")
+    return StoredBlob(path=path, sha256=stored.sha256, size=stored.size, deduplicated=not created)
+
+
+async def acquire_blob(db: AsyncSession, sha256: Optional[str]) -> bool:
+    """참조 카운트 증가 (커밋은 참조하는 행과 같은 트랜잭션에서 호출자가 수행)"""
+    if not sha256:
+        return False
+    result = await db.execute(
+        update(Blob).where(Blob.sha256 == sha256).values(ref_count=Blob.ref_count + 1)
+    )
+    return result.rowcount == 1
+
+
+async def release_blob(db: AsyncSession, sha256: Optional[str]) -> None:
+    """참조 카운트 감소 (0이 된 파일은 collect_unreferenced_blobs에서 삭제)"""
+    if not sha256:
+        return
+    await db.execute(
+        update(Blob)
+        .where(Blob.sha256 == sha256, Blob.ref_count > 0)
+        .values(ref_count=Blob.ref_count - 1)
+    )
+
+
+async def collect_unreferenced_blobs(db: AsyncSession, grace_seconds: Optional[int] = None) -> int:
+    """유예 시간이 지나도록 참조되지 않은 파일 삭제
+
+    업로드 직후 문서 생성 전까지는 참조 카운트가 0이므로 유예 시간 안의 파일은 남겨둡니다.
+    """
+    if grace_seconds is None:
+        grace_seconds = settings.blob_gc_grace_seconds
+    cutoff = datetime.utcnow() - timedelta(seconds=grace_seconds)
+    result = await db.execute(
+        select(Blob.sha256).where(Blob.ref_count == 0, Blob.updated_at < cutoff)
+    )
+
+    removed = 0
+    for sha256 in result.scalars().all():
+        deleted = await db.execute(
+            delete(Blob).where(Blob.sha256 == sha256, Blob.ref_count == 0, Blob.updated_at < cutoff)
+        )
+        await db.commit()
+        if deleted.rowcount != 1:
+            continue
+        # 행 삭제 후 같은 내용이 다시 업로드되었을 수 있으므로, 파일을 저장 경로에서 빼낸 뒤
+        # 행이 다시 생겼는지 확인하고 생겼으면 되돌림 (업로드는 행을 먼저 커밋한 뒤 파일을 저장)
+        detached = await blob_store.detach(sha256)
+        if detached is None:
+            continue
+        if await db.scalar(select(Blob.sha256).where(Blob.sha256 == sha256)) is not None:
+            await blob_store.restore(sha256, detached)
+            continue
+        await blob_store.discard(detached)
+        removed += 1
+    return removed
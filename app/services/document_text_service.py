@@ -0,0 +1,115 @@
+"""
+문서 첨부파일 텍스트 캐시 서비스
+첨부파일을 프로세스 풀에서 한 번만 평문으로 변환해 extracted_texts(내용 해시 키)에 저장하고,
+문서 내용 조회와 WBS 생성에서 파일을 다시 읽지 않고 저장된 텍스트를 사용하도록 하는 모듈
+"""
+import asyncio
+import os
+from typing import Dict, List, Optional
+
+from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.database import AsyncSessionLocal
+from app.models.blob import ExtractedText
+from app.models.project import Document
+from app.services.text_extraction import extract_file_in_pool
+
+# 같은 파일의 동시 추출 요청은 하나의 작업을 공유
+_inflight: Dict[str, asyncio.Task] = {}
+
+
+async def _extract(path: str, filename: Optional[str], sha256: Optional[str]) -> Dict[str, Optional[str]]:
+    task = _inflight.get(path)
+    if task is None:
+        task = asyncio.ensure_future(extract_file_in_pool(path, filename, sha256))
+        _inflight[path] = task
+        task.add_done_callback(lambda _: _inflight.pop(path, None))
+    return await asyncio.shield(task)
+
+
+async def _save_extracted_text(result: Dict[str, Optional[str]]) -> None:
+    """추출 결과 저장 (호출자 세션과 분리된 트랜잭션, 동시에 저장된 경우 무시)"""
+    async with AsyncSessionLocal() as db:
+        db.add(ExtractedText(
+            content_hash=result["sha256"],
+            extractor=result["extractor"],
+            text=result["text"],
+            char_count=len(result["text"] or ""),
+            error=result["error"]
+        ))
+        try:
+            await db.commit()
+        except IntegrityError:
+            await db.rollback()
+
+
+async def ensure_document_text(db: AsyncSession, document: Document) -> Optional[ExtractedText]:
+    """문서 첨부파일의 추출 텍스트 조회 (캐시에 없으면 프로세스 풀에서 추출 후 저장)"""
+    if not document.file_path:
+        return None
+
+    if document.content_hash:
+        extracted = await db.get(ExtractedText, document.content_hash)
+        if extracted is not None:
+            if document.text_status is None:
+                document.text_status = "completed" if extracted.text is not None else "failed"
+                await db.commit()
+            return extracted
+
+    if not os.path.exists(document.file_path):
+        return None
+
+    result = await _extract(document.file_path, document.file_name, document.content_hash)
+    extracted = await db.get(ExtractedText, result["sha256"])
+    if extracted is None:
+        await _save_extracted_text(result)
+        extracted = await db.get(ExtractedText, result["sha256"])
+
+    # 이전 업로드 방식 파일은 여기서 내용 해시를 기록
+    document.content_hash = result["sha256"]
+    document.text_status = "completed" if extracted.text is not None else "failed"
+    await db.commit()
+
+    status = "✅" if extracted.text is not None else "⚠️"
+    print(f"{status} 문서 {document.id} 텍스트 추출: {extracted.char_count}자 ({extracted.extractor})")
+    return extracted
+
+
+async def extract_document_text_task(document_id: int) -> None:
+    """문서 생성 후 백그라운드 텍스트 추출 (요청과 별도 세션 사용)"""
+    try:
+        async with AsyncSessionLocal() as db:
+            document = await db.get(Document, document_id)
+            if document is not None:
+                await ensure_document_text(db, document)
+    except Exception as e:
+        print(f"❌ 문서 {document_id} 텍스트 추출 실패: {e}")
+
+
+async def load_document_files(db: AsyncSession, document_ids: List[int]) -> List[Dict[str, str]]:
+    """문서 ID 목록을 WBS 생성용 additional_files 형식({filename, content})으로 변환"""
+    if not document_ids:
+        return []
+    result = await db.execute(select(Document).where(Document.id.in_(document_ids)))
+    documents = {document.id: document for document in result.scalars().all()}
+
+    files = []
+    for document_id in document_ids:
+        document = documents.get(document_id)
+        if document is None:
+            continue
+        if document.content:
+            content = document.content
+        else:
+            extracted = await ensure_document_text(db, document)
+            if extracted is None or extracted.text is None:
+                continue
+            content = extracted.text
+        files.append({
+            "filename": document.file_name or document.title,
+            "content": content,
+            "document_id": document.id
+        })
+    return files
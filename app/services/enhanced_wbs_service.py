@@ -2,15 +2,89 @@
 고도화된 WBS 생성 서비스
 요건 추출, Task 분배, 기간 추정을 포함한 종합적인 프로젝트 분석 서비스
 """
+import asyncio
 import json
 import re
-from typing import Dict, List, Any, Optional, Tuple
+import time
+from typing import Dict, List, Any, Optional, Tuple, Callable, Awaitable, AsyncIterator
 from datetime import datetime, timedelta
 from dataclasses import dataclass
 from openai import AsyncOpenAI
-from app.core.n8n_client import N8nMCPClient
+from app.core.n8n_client import N8nMCPClient, get_n8n_client
+from app.core.llm_cache import LLMResponseCache, llm_cache
+from app.core.metrics import observe_openai_call, stage_timer
+from app.services.llm_json import IncrementalJSONExtractor, TRUNCATED_KEY, parse_json_object
+from app.services.requirement_mapreduce import estimate_tokens, split_documents, merge_requirement_analyses
+from app.services.schedule_engine import ScheduleEngine, ScheduleCycleError
+from app.services.assignment_engine import AssignmentEngine, AssignmentCandidate
+from app.services.workload_aggregation import aggregate_workload, utilization_rate
 from config import settings
 
+# 단계별 진행 상황 콜백: (stage, status) -> None
+ProgressCallback = Callable[[str, str], Awaitable[None]]
+
+# 요구사항 기반 로컬 Task 생성 시 추정치
+ESTIMATED_EFFORT_HOURS = {"S": 16, "M": 40, "L": 80, "XL": 160}
+COMPLEXITY_HOURS = {"simple": 24, "medium": 40, "complex": 80}
+COMPLEXITY_SKILL_LEVEL = {"simple": "Junior", "medium": "Mid", "complex": "Senior"}
+
+# LLM 모델 및 시스템 메시지
+WBS_LLM_MODEL = "gpt-4"
+
+REQUIREMENT_ANALYSIS_SYSTEM_MESSAGE = """당신은 엔터프라이즈 소프트웨어 개발을 위한 시니어 프로젝트 아키텍트입니다. 
+                        제안서, RFP, 프로젝트 목표를 분석하여 상세한 요구사항을 추출하고, 
+                        기술적 복잡도와 개발 우선순위를 평가합니다."""
+
+REQUIREMENT_ANALYSIS_JSON_FORMAT = """{
+  "project_overview": "프로젝트 전체 개요",
+  "business_requirements": [
+    {
+      "requirement": "비즈니스 요구사항",
+      "priority": "High/Medium/Low",
+      "complexity": "Simple/Medium/Complex"
+    }
+  ],
+  "technical_requirements": [
+    {
+      "requirement": "기술적 요구사항",
+      "category": "Frontend/Backend/Database/Infrastructure/etc",
+      "complexity": "Simple/Medium/Complex",
+      "estimated_effort": "S/M/L/XL"
+    }
+  ],
+  "functional_requirements": [
+    {
+      "feature": "기능명",
+      "description": "상세 설명",
+      "priority": "High/Medium/Low",
+      "dependencies": ["의존성 기능들"]
+    }
+  ],
+  "non_functional_requirements": [
+    {
+      "requirement": "성능/보안/확장성 등",
+      "description": "상세 설명",
+      "priority": "High/Medium/Low"
+    }
+  ],
+  "technical_stack_suggestions": [
+    {
+      "category": "Frontend/Backend/Database/etc",
+      "technologies": ["기술 스택"],
+      "reasoning": "선택 이유"
+    }
+  ],
+  "project_complexity": "Simple/Medium/Complex",
+  "estimated_duration_weeks": 숫자,
+  "risk_factors": ["위험 요소들"]
+}
+"""
+
+TASK_ALLOCATION_SYSTEM_MESSAGE = """당신은 시니어 프로젝트 매니저이자 기술 아키텍트입니다. 
+                        요구사항을 분석하여 구체적인 작업으로 분해하고, 
+                        팀원의 기술 역량을 고려하여 최적의 작업 할당을 수행합니다.
+                        각 작업의 예상 소요 시간과 의존성을 명확히 정의합니다."""
+
 @dataclass
 class TeamMember:
     """팀원 정보 데이터 클래스"""
@@ -21,6 +95,8 @@ class TeamMember:
     availability: bool = True
     hourly_rate: Optional[int] = None
     department: Optional[str] = None
+    allocation_percentage: int = 100  # 프로젝트 할당 비율 (0-100)
+    current_load_hours: float = 0  # 다른 작업에 이미 배정된 시간
 
 @dataclass
 class Task:
@@ -43,12 +119,19 @@ class ProjectPhase:
     tasks: List[Task]
     responsible_team: List[str]
 
+class RequirementAnalysisParseError(ValueError):
+    """요구사항 분석 응답에 JSON이 없음 (기본 구조 생성을 위해 원문 보관)"""
+
+    def __init__(self, response_text: str):
+        super().__init__("요구사항 분석 결과에서 JSON을 찾을 수 없습니다")
+        self.response_text = response_text
+
 class EnhancedWBSService:
     """고도화된 WBS 생성 서비스"""
     
-    def __init__(self):
-        self.openai_client = AsyncOpenAI(api_key=settings.openai_api_key)
-        self.n8n_client = N8nMCPClient()
+    def __init__(self, n8n_client: Optional[N8nMCPClient] = None):
+        self.openai_client = AsyncOpenAI(api_key=settings.openai_api_key, base_url=settings.openai_base_url)
+        self.n8n_client = n8n_client or get_n8n_client()
     
     async def analyze_requirements(
         self,
@@ -57,7 +140,14 @@ class EnhancedWBSService:
         project_goals: str,
         additional_files: List[Dict[str, str]] = None
     ) -> Dict[str, Any]:
-        """요건 추출 및 분석"""
+        """요건 추출 및 분석
+
+        입력 문서가 한 번의 호출에 담기 어려울 만큼 크면 청크 단위 map-reduce로 분석합니다.
+        """
+        if self._use_map_reduce_analysis(proposal_content, rfp_content, project_goals, additional_files):
+            return await self._analyze_requirements_map_reduce(
+                proposal_content, rfp_content, project_goals, additional_files
+            )
         
         # 통합된 요구사항 분석 프롬프트
         analysis_prompt = self._create_requirement_analysis_prompt(
@@ -65,33 +155,113 @@ class EnhancedWBSService:
         )
         
         try:
-            # OpenAI를 통한 요구사항 분석
-            response = await self.openai_client.chat.completions.create(
-                model="gpt-4",
-                messages=[
-                    {
-                        "role": "system",
-                        "content": """당신은 엔터프라이즈 소프트웨어 개발을 위한 시니어 프로젝트 아키텍트입니다. 
-                        제안서, RFP, 프로젝트 목표를 분석하여 상세한 요구사항을 추출하고, 
-                        기술적 복잡도와 개발 우선순위를 평가합니다."""
-                    },
-                    {
-                        "role": "user",
-                        "content": analysis_prompt
-                    }
-                ],
+            # OpenAI를 통한 요구사항 분석 (동일 요청은 캐시에서 반환)
+            return await self._cached_chat_completion(
+                system_message=REQUIREMENT_ANALYSIS_SYSTEM_MESSAGE,
+                prompt=analysis_prompt,
                 temperature=0.2,
-                max_tokens=4000
+                max_tokens=4000,
+                parse=self._load_requirement_analysis
             )
             
-            analysis_result = response.choices[0].message.content
-            
-            # JSON 형식으로 파싱
-            return self._parse_requirement_analysis(analysis_result)
-            
+        except RequirementAnalysisParseError as e:
+            # JSON이 없으면 기본 구조 반환 (캐시에 저장하지 않음)
+            return self._default_requirement_analysis(e.response_text)
         except Exception as e:
             raise Exception(f"요구사항 분석 실패: {str(e)}")
     
+    @staticmethod
+    def _requirement_sources(
+        proposal_content: str,
+        rfp_content: str,
+        additional_files: List[Dict[str, str]] = None
+    ) -> List[Tuple[str, str]]:
+        """분석 대상 문서 목록 (제목, 본문)"""
+        sources = [("제안서 내용", proposal_content or ""), ("RFP 내용", rfp_content or "")]
+        for file in additional_files or []:
+            sources.append((f"추가 파일: {file.get('filename', 'Unknown')}", file.get("content", "") or ""))
+        return sources
+    
+    def _use_map_reduce_analysis(
+        self,
+        proposal_content: str,
+        rfp_content: str,
+        project_goals: str,
+        additional_files: List[Dict[str, str]] = None
+    ) -> bool:
+        """요구사항 분석 방식 결정 (auto: 입력 토큰이 청크 한도를 넘으면 map-reduce)"""
+        mode = settings.requirement_analysis_mode
+        if mode == "mapreduce":
+            return True
+        if mode != "auto":
+            return False
+        sources = self._requirement_sources(proposal_content, rfp_content, additional_files)
+        total_tokens = estimate_tokens(project_goals or "") + sum(
+            estimate_tokens(text) for _, text in sources
+        )
+        return total_tokens > settings.requirement_chunk_tokens
+    
+    async def _analyze_requirements_map_reduce(
+        self,
+        proposal_content: str,
+        rfp_content: str,
+        project_goals: str,
+        additional_files: List[Dict[str, str]] = None
+    ) -> Dict[str, Any]:
+        """청크별 요구사항 분석(map)을 제한된 동시성으로 실행한 뒤 병합(reduce)"""
+        chunks = split_documents(
+            self._requirement_sources(proposal_content, rfp_content, additional_files),
+            settings.requirement_chunk_tokens
+        )
+        if not chunks:
+            chunks = [""]
+        
+        semaphore = asyncio.Semaphore(max(settings.requirement_map_concurrency, 1))
+        
+        async def analyze_chunk(index: int, chunk: str) -> Dict[str, Any]:
+            async with semaphore:
+                try:
+                    return await self._cached_chat_completion(
+                        system_message=REQUIREMENT_ANALYSIS_SYSTEM_MESSAGE,
+                        prompt=self._create_chunk_analysis_prompt(
+                            chunk, project_goals, index, len(chunks)
+                        ),
+                        temperature=0.2,
+                        max_tokens=settings.requirement_map_max_tokens,
+                        parse=self._load_requirement_analysis
+                    )
+                except RequirementAnalysisParseError as e:
+                    return self._default_requirement_analysis(e.response_text)
+        
+        results = await asyncio.gather(
+            *(analyze_chunk(index, chunk) for index, chunk in enumerate(chunks, start=1)),
+            return_exceptions=True
+        )
+        
+        partials = []
+        failed_chunks = []
+        for index, result in enumerate(results, start=1):
+            if isinstance(result, Exception):
+                print(f"⚠️ 요구사항 청크 분석 실패 ({index}/{len(chunks)}): {result}")
+                failed_chunks.append(index)
+            else:
+                partials.append(result)
+        
+        if not partials:
+            raise Exception(f"요구사항 분석 실패: 모든 청크 분석 실패 ({results[0]})")
+        if len(failed_chunks) / len(chunks) > settings.requirement_map_max_failure_ratio:
+            raise Exception(
+                f"요구사항 분석 실패: {len(chunks)}개 청크 중 {len(failed_chunks)}개 분석 실패 {failed_chunks}"
+            )
+        
+        print(f"✅ 요구사항 map-reduce 분석 완료: {len(partials)}/{len(chunks)}개 청크")
+        merged = merge_requirement_analyses(partials)
+        merged["chunk_count"] = len(chunks)
+        merged["failed_chunks"] = failed_chunks
+        if any(partial.get(TRUNCATED_KEY) for partial in partials):
+            merged[TRUNCATED_KEY] = True
+        return merged
+    
     async def generate_enhanced_wbs(
         self,
         project_id: int,
@@ -99,47 +269,361 @@ class EnhancedWBSService:
         rfp_content: str,
         project_goals: str,
         team_members: List[Dict[str, Any]],
-        additional_files: List[Dict[str, str]] = None
+        additional_files: List[Dict[str, str]] = None,
+        progress: Optional[ProgressCallback] = None,
+        assignment_mode: str = "llm"
     ) -> Dict[str, Any]:
-        """고도화된 WBS 생성"""
+        """고도화된 WBS 생성
+
+        progress가 주어지면 단계(requirements, allocation, n8n)별
+        시작/완료/실패 시점에 progress(stage, status)를 호출합니다.
+        assignment_mode가 "optimizer"이면 두 번째 LLM 호출 없이
+        요구사항에서 Task를 만들고 할당 엔진으로 담당자를 배정합니다.
+        """
         
+        stage = None
         try:
             # 1. 요구사항 분석
-            requirements = await self.analyze_requirements(
-                proposal_content, rfp_content, project_goals, additional_files
-            )
+            stage = "requirements"
+            await self._report_progress(progress, stage, "running")
+            with stage_timer(stage):
+                requirements = await self.analyze_requirements(
+                    proposal_content, rfp_content, project_goals, additional_files
+                )
+            await self._report_progress(progress, stage, "completed")
             
             # 2. 팀원 정보 구조화
             structured_team = self._structure_team_members(team_members)
             
             # 3. Task 분배 및 기간 추정
-            wbs_data = await self._generate_task_allocation(
-                requirements, structured_team
-            )
+            stage = "allocation"
+            await self._report_progress(progress, stage, "running")
+            with stage_timer(stage):
+                if assignment_mode == "optimizer":
+                    wbs_data = self._generate_local_allocation(requirements, structured_team)
+                else:
+                    wbs_data = await self._generate_task_allocation(
+                        requirements, structured_team
+                    )
+            await self._report_progress(progress, stage, "completed")
             
             # 4. n8n 워크플로우 실행 (외부 시스템 연동)
-            n8n_result = await self._execute_n8n_workflow(
-                project_id, wbs_data, structured_team
+            stage = "n8n"
+            await self._report_progress(progress, stage, "running")
+            n8n_result = await self._timed_n8n_workflow(project_id, wbs_data, structured_team)
+            await self._report_progress(
+                progress, stage, "failed" if n8n_result.get("status") == "failed" else "completed"
             )
             
+            # 5. 결과 요약 (팀 할당, 일정)
+            stage = "summary"
+            with stage_timer(stage):
+                return self._build_wbs_result(
+                    project_id, requirements, wbs_data, structured_team, n8n_result
+                )
+            
+        except Exception as e:
+            if stage:
+                await self._report_progress(progress, stage, "failed")
             return {
-                "status": "success",
-                "project_id": project_id,
-                "requirements_analysis": requirements,
-                "wbs_data": wbs_data,
-                "team_allocation": self._generate_team_allocation_summary(wbs_data, structured_team),
-                "timeline": self._generate_project_timeline(wbs_data),
-                "n8n_execution": n8n_result,
-                "created_at": datetime.utcnow().isoformat()
+                "status": "failed",
+                "error": str(e),
+                "project_id": project_id
+            }
+    
+    async def stream_enhanced_wbs(
+        self,
+        project_id: int,
+        proposal_content: str,
+        rfp_content: str,
+        project_goals: str,
+        team_members: List[Dict[str, Any]],
+        additional_files: List[Dict[str, str]] = None,
+        assignment_mode: str = "llm"
+    ) -> AsyncIterator[Tuple[str, Dict[str, Any]]]:
+        """고도화된 WBS 생성 (스트리밍)
+
+        (event, data) 튜플을 순서대로 생성합니다.
+        - stage: 단계 시작/완료/실패 {"stage", "status"}
+        - requirements: 요구사항 분석 결과
+        - phase: Task 분배 응답에서 완성된 단계(phase) 객체
+        - result: generate_enhanced_wbs와 동일한 최종 결과
+        - error: 실패 정보
+        """
+        stage = None
+        try:
+            # 1. 요구사항 분석
+            stage = "requirements"
+            yield "stage", {"stage": stage, "status": "running"}
+            requirements = None
+            with stage_timer(stage):
+                if self._use_map_reduce_analysis(proposal_content, rfp_content, project_goals, additional_files):
+                    requirements = await self._analyze_requirements_map_reduce(
+                        proposal_content, rfp_content, project_goals, additional_files
+                    )
+                else:
+                    analysis_prompt = self._create_requirement_analysis_prompt(
+                        proposal_content, rfp_content, project_goals, additional_files
+                    )
+                    try:
+                        async for event, data in self._stream_cached_chat_completion(
+                            system_message=REQUIREMENT_ANALYSIS_SYSTEM_MESSAGE,
+                            prompt=analysis_prompt,
+                            temperature=0.2,
+                            max_tokens=4000,
+                            parse=self._load_requirement_analysis
+                        ):
+                            if event == "parsed":
+                                requirements = data
+                    except RequirementAnalysisParseError as e:
+                        requirements = self._default_requirement_analysis(e.response_text)
+            yield "requirements", requirements
+            yield "stage", {"stage": stage, "status": "completed"}
+            
+            # 2. 팀원 정보 구조화
+            structured_team = self._structure_team_members(team_members)
+            
+            # 3. Task 분배 및 기간 추정 (완성된 단계부터 전송)
+            stage = "allocation"
+            yield "stage", {"stage": stage, "status": "running"}
+            wbs_data = None
+            # 스트리밍 중에는 클라이언트로 단계(phase)를 전송하는 시간도 포함
+            with stage_timer(stage):
+                if assignment_mode == "optimizer":
+                    wbs_data = self._generate_local_allocation(requirements, structured_team)
+                    for phase in wbs_data["project_phases"]:
+                        yield "phase", phase
+                else:
+                    async for event, data in self._stream_task_allocation(requirements, structured_team):
+                        if event == "item":
+                            yield "phase", data
+                        elif event == "parsed":
+                            wbs_data = data
+            yield "stage", {"stage": stage, "status": "completed"}
+            
+            # 4. n8n 워크플로우 실행 (외부 시스템 연동)
+            stage = "n8n"
+            yield "stage", {"stage": stage, "status": "running"}
+            n8n_result = await self._timed_n8n_workflow(project_id, wbs_data, structured_team)
+            yield "stage", {
+                "stage": stage,
+                "status": "failed" if n8n_result.get("status") == "failed" else "completed"
             }
             
+            # 5. 결과 요약 (팀 할당, 일정)
+            stage = "summary"
+            with stage_timer(stage):
+                result = self._build_wbs_result(
+                    project_id, requirements, wbs_data, structured_team, n8n_result
+                )
+            yield "result", result
+            
         except Exception as e:
-            return {
+            if stage:
+                yield "stage", {"stage": stage, "status": "failed"}
+            yield "error", {
                 "status": "failed",
                 "error": str(e),
                 "project_id": project_id
             }
     
+    async def _stream_task_allocation(
+        self,
+        requirements: Dict[str, Any],
+        team_members: List[TeamMember]
+    ) -> AsyncIterator[Tuple[str, Any]]:
+        """Task 분배 스트리밍 ("item": 완성된 단계, "parsed": 전체 결과)"""
+        allocation_prompt = self._create_task_allocation_prompt(
+            requirements, team_members
+        )
+        try:
+            async for event, data in self._stream_cached_chat_completion(
+                system_message=TASK_ALLOCATION_SYSTEM_MESSAGE,
+                prompt=allocation_prompt,
+                temperature=0.3,
+                max_tokens=6000,
+                parse=self._load_task_allocation,
+                stream_array_key="project_phases"
+            ):
+                yield event, data
+        except ValueError:
+            # 파싱 실패시 기본 구조 반환 (캐시에 저장하지 않음)
+            wbs_data = self._create_default_wbs_structure(team_members)
+            for phase in wbs_data["project_phases"]:
+                yield "item", phase
+            yield "parsed", wbs_data
+    
+    def _build_wbs_result(
+        self,
+        project_id: int,
+        requirements: Dict[str, Any],
+        wbs_data: Dict[str, Any],
+        structured_team: List[TeamMember],
+        n8n_result: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """WBS 생성 결과 구성 (LLM 응답이 잘렸거나 일부 문서 청크 분석이 실패한 경우 status는 partial)"""
+        truncated = bool(requirements.get(TRUNCATED_KEY) or wbs_data.get(TRUNCATED_KEY))
+        partial = truncated or bool(requirements.get("failed_chunks"))
+        return {
+            "status": "partial" if partial else "success",
+            "truncated": truncated,
+            "project_id": project_id,
+            "requirements_analysis": requirements,
+            "wbs_data": wbs_data,
+            "team_allocation": self._generate_team_allocation_summary(wbs_data, structured_team),
+            "timeline": self._generate_project_timeline(wbs_data),
+            "n8n_execution": n8n_result,
+            "created_at": datetime.utcnow().isoformat()
+        }
+    
+    @staticmethod
+    async def _report_progress(
+        progress: Optional[ProgressCallback],
+        stage: str,
+        status: str
+    ):
+        """단계 진행 상황 보고 (보고 실패는 파이프라인에 영향을 주지 않음)"""
+        if progress is None:
+            return
+        try:
+            await progress(stage, status)
+        except Exception as e:
+            print(f"⚠️ 진행 상황 보고 실패 ({stage}/{status}): {e}")
+    
+    async def _cached_chat_completion(
+        self,
+        system_message: str,
+        prompt: str,
+        temperature: float,
+        max_tokens: int,
+        parse: Callable[[str], Dict[str, Any]],
+        model: str = WBS_LLM_MODEL
+    ) -> Dict[str, Any]:
+        """캐시를 거치는 ChatCompletion 호출 (파싱된 결과를 캐시)"""
+        cache_key = self._cache_key(model, temperature, system_message, prompt, max_tokens)
+        if cache_key is not None:
+            cached = await asyncio.to_thread(llm_cache.get, cache_key)
+            if cached is not None:
+                return cached
+        
+        started = time.perf_counter()
+        try:
+            response = await self.openai_client.chat.completions.create(
+                model=model,
+                messages=[
+                    {"role": "system", "content": system_message},
+                    {"role": "user", "content": prompt}
+                ],
+                temperature=temperature,
+                max_tokens=max_tokens
+            )
+        except Exception:
+            observe_openai_call(model, time.perf_counter() - started, outcome="error")
+            raise
+        usage = response.usage
+        observe_openai_call(
+            model,
+            time.perf_counter() - started,
+            prompt_tokens=usage.prompt_tokens if usage else 0,
+            completion_tokens=usage.completion_tokens if usage else 0
+        )
+        
+        choice = response.choices[0]
+        parsed = parse(choice.message.content)
+        if choice.finish_reason == "length":
+            parsed[TRUNCATED_KEY] = True
+        
+        # 잘린 응답에서 복구한 결과는 캐시하지 않음 (재요청 시 다시 생성)
+        if cache_key is not None and not parsed.get(TRUNCATED_KEY):
+            await asyncio.to_thread(llm_cache.set, cache_key, parsed, model)
+        
+        return parsed
+    
+    async def _stream_cached_chat_completion(
+        self,
+        system_message: str,
+        prompt: str,
+        temperature: float,
+        max_tokens: int,
+        parse: Callable[[str], Dict[str, Any]],
+        stream_array_key: Optional[str] = None,
+        model: str = WBS_LLM_MODEL
+    ) -> AsyncIterator[Tuple[str, Any]]:
+        """캐시를 거치는 스트리밍 ChatCompletion 호출
+
+        stream_array_key가 주어지면 해당 배열의 항목이 완성될 때마다
+        ("item", dict)를 생성하고, 마지막에 ("parsed", 결과)를 생성합니다.
+        """
+        cache_key = self._cache_key(model, temperature, system_message, prompt, max_tokens)
+        if cache_key is not None:
+            cached = await asyncio.to_thread(llm_cache.get, cache_key)
+            if cached is not None:
+                if stream_array_key:
+                    for item in cached.get(stream_array_key, []):
+                        yield "item", item
+                yield "parsed", cached
+                return
+        
+        item_parser = IncrementalJSONExtractor(stream_array_key) if stream_array_key else None
+        chunks = []
+        finish_reason = None
+        started = time.perf_counter()
+        try:
+            stream = await self.openai_client.chat.completions.create(
+                model=model,
+                messages=[
+                    {"role": "system", "content": system_message},
+                    {"role": "user", "content": prompt}
+                ],
+                temperature=temperature,
+                max_tokens=max_tokens,
+                stream=True
+            )
+            async for chunk in stream:
+                if not chunk.choices:
+                    continue
+                finish_reason = chunk.choices[0].finish_reason or finish_reason
+                delta = chunk.choices[0].delta.content
+                if not delta:
+                    continue
+                chunks.append(delta)
+                if item_parser:
+                    for item in item_parser.feed(delta):
+                        yield "item", item
+        except Exception:
+            observe_openai_call(model, time.perf_counter() - started, outcome="error")
+            raise
+        
+        content = "".join(chunks)
+        # 스트리밍 응답에는 usage가 없으므로 토큰 수를 추정해 기록
+        observe_openai_call(
+            model,
+            time.perf_counter() - started,
+            prompt_tokens=estimate_tokens(system_message) + estimate_tokens(prompt),
+            completion_tokens=estimate_tokens(content)
+        )
+        parsed = parse(content)
+        if finish_reason == "length":
+            parsed[TRUNCATED_KEY] = True
+        
+        if cache_key is not None and not parsed.get(TRUNCATED_KEY):
+            await asyncio.to_thread(llm_cache.set, cache_key, parsed, model)
+        
+        yield "parsed", parsed
+    
+    @staticmethod
+    def _cache_key(
+        model: str,
+        temperature: float,
+        system_message: str,
+        prompt: str,
+        max_tokens: int
+    ) -> Optional[str]:
+        """LLM 캐시 키 (캐시 비활성화 시 None)"""
+        if not settings.llm_cache_enabled:
+            return None
+        return LLMResponseCache.make_key(model, temperature, system_message, prompt, max_tokens)
+    
     def _create_requirement_analysis_prompt(
         self,
         proposal_content: str,
@@ -170,76 +654,52 @@ class EnhancedWBSService:
 {additional_content}
 
 다음 JSON 형식으로 응답해주세요:
-{{
-  "project_overview": "프로젝트 전체 개요",
-  "business_requirements": [
-    {{
-      "requirement": "비즈니스 요구사항",
-      "priority": "High/Medium/Low",
-      "complexity": "Simple/Medium/Complex"
-    }}
-  ],
-  "technical_requirements": [
-    {{
-      "requirement": "기술적 요구사항",
-      "category": "Frontend/Backend/Database/Infrastructure/etc",
-      "complexity": "Simple/Medium/Complex",
-      "estimated_effort": "S/M/L/XL"
-    }}
-  ],
-  "functional_requirements": [
-    {{
-      "feature": "기능명",
-      "description": "상세 설명",
-      "priority": "High/Medium/Low",
-      "dependencies": ["의존성 기능들"]
-    }}
-  ],
-  "non_functional_requirements": [
-    {{
-      "requirement": "성능/보안/확장성 등",
-      "description": "상세 설명",
-      "priority": "High/Medium/Low"
-    }}
-  ],
-  "technical_stack_suggestions": [
-    {{
-      "category": "Frontend/Backend/Database/etc",
-      "technologies": ["기술 스택"],
-      "reasoning": "선택 이유"
-    }}
-  ],
-  "project_complexity": "Simple/Medium/Complex",
-  "estimated_duration_weeks": 숫자,
-  "risk_factors": ["위험 요소들"]
-}}
-"""
+{REQUIREMENT_ANALYSIS_JSON_FORMAT}"""
     
-    def _parse_requirement_analysis(self, analysis_text: str) -> Dict[str, Any]:
-        """요구사항 분석 결과 파싱"""
-        try:
-            # JSON 부분 추출
-            json_start = analysis_text.find('{')
-            json_end = analysis_text.rfind('}') + 1
-            
-            if json_start != -1 and json_end > json_start:
-                json_str = analysis_text[json_start:json_end]
-                return json.loads(json_str)
-            else:
-                # JSON이 없으면 기본 구조 반환
-                return {
-                    "project_overview": analysis_text,
-                    "business_requirements": [],
-                    "technical_requirements": [],
-                    "functional_requirements": [],
-                    "non_functional_requirements": [],
-                    "technical_stack_suggestions": [],
-                    "project_complexity": "Medium",
-                    "estimated_duration_weeks": 12,
-                    "risk_factors": []
-                }
-        except Exception as e:
-            raise Exception(f"요구사항 분석 결과 파싱 실패: {str(e)}")
+    def _create_chunk_analysis_prompt(
+        self,
+        chunk: str,
+        project_goals: str,
+        index: int,
+        total: int
+    ) -> str:
+        """문서 청크 요구사항 분석 프롬프트 생성"""
+        return f"""
+다음은 프로젝트 문서를 나눈 {total}개 부분 중 {index}번째 부분입니다.
+이 부분에 포함된 요구사항만 추출해주세요. 나머지 부분은 별도로 분석된 뒤 병합됩니다.
+
+## 프로젝트 목표:
+{project_goals}
+
+{chunk}
+
+다음 JSON 형식으로 응답해주세요:
+{REQUIREMENT_ANALYSIS_JSON_FORMAT}"""
+    
+    def _load_requirement_analysis(self, analysis_text: str) -> Dict[str, Any]:
+        """요구사항 분석 결과 JSON 추출 (실패 시 RequirementAnalysisParseError)"""
+        # 코드 펜스, 앞뒤 설명 문구, 잘린 응답을 허용하는 JSON 추출
+        parsed, truncated = parse_json_object(analysis_text)
+        if parsed is None:
+            raise RequirementAnalysisParseError(analysis_text)
+        if truncated:
+            parsed[TRUNCATED_KEY] = True
+        return parsed
+    
+    @staticmethod
+    def _default_requirement_analysis(analysis_text: str) -> Dict[str, Any]:
+        """JSON이 없는 요구사항 분석 응답의 기본 구조"""
+        return {
+            "project_overview": analysis_text,
+            "business_requirements": [],
+            "technical_requirements": [],
+            "functional_requirements": [],
+            "non_functional_requirements": [],
+            "technical_stack_suggestions": [],
+            "project_complexity": "Medium",
+            "estimated_duration_weeks": 12,
+            "risk_factors": []
+        }
     
     def _structure_team_members(self, team_members: List[Dict[str, Any]]) -> List[TeamMember]:
         """팀원 정보를 구조화된 형태로 변환"""
@@ -253,11 +713,19 @@ class EnhancedWBSService:
                 skill_level=member.get('skill_level', 'Junior'),
                 availability=member.get('availability', True),
                 hourly_rate=member.get('hourly_rate'),
-                department=member.get('department')
+                department=member.get('department'),
+                allocation_percentage=self._member_allocation(member),
+                current_load_hours=member.get('current_load_hours', 0) or 0
             ))
         
         return structured_team
     
+    @staticmethod
+    def _member_allocation(member: Dict[str, Any]) -> int:
+        """팀원 정보의 프로젝트 할당 비율 (allocation_percentage 또는 allocation)"""
+        allocation = member.get('allocation_percentage', member.get('allocation'))
+        return 100 if allocation is None else allocation
+    
     async def _generate_task_allocation(
         self,
         requirements: Dict[str, Any],
@@ -271,31 +739,160 @@ class EnhancedWBSService:
         )
         
         try:
-            response = await self.openai_client.chat.completions.create(
-                model="gpt-4",
-                messages=[
-                    {
-                        "role": "system",
-                        "content": """당신은 시니어 프로젝트 매니저이자 기술 아키텍트입니다. 
-                        요구사항을 분석하여 구체적인 작업으로 분해하고, 
-                        팀원의 기술 역량을 고려하여 최적의 작업 할당을 수행합니다.
-                        각 작업의 예상 소요 시간과 의존성을 명확히 정의합니다."""
-                    },
-                    {
-                        "role": "user",
-                        "content": task_allocation_prompt
-                    }
-                ],
+            return await self._cached_chat_completion(
+                system_message=TASK_ALLOCATION_SYSTEM_MESSAGE,
+                prompt=task_allocation_prompt,
                 temperature=0.3,
-                max_tokens=6000
+                max_tokens=6000,
+                parse=self._load_task_allocation
             )
             
-            allocation_result = response.choices[0].message.content
-            return self._parse_task_allocation(allocation_result, team_members)
-            
+        except ValueError:
+            # 파싱 실패시 기본 구조 반환 (캐시에 저장하지 않음)
+            return self._create_default_wbs_structure(team_members)
         except Exception as e:
             raise Exception(f"Task 분배 생성 실패: {str(e)}")
     
+    def _generate_local_allocation(
+        self,
+        requirements: Dict[str, Any],
+        team_members: List[TeamMember]
+    ) -> Dict[str, Any]:
+        """LLM 호출 없이 요구사항에서 Task를 만들고 할당 엔진으로 배정"""
+        wbs_data = self._build_tasks_from_requirements(requirements)
+        duration_weeks = requirements.get("estimated_duration_weeks") or 12
+        return self.assign_tasks(wbs_data, team_members, duration_weeks)
+    
+    def assign_tasks(
+        self,
+        wbs_data: Dict[str, Any],
+        team_members: List[TeamMember],
+        duration_weeks: float = 12
+    ) -> Dict[str, Any]:
+        """할당 엔진으로 wbs_data의 모든 Task 담당자(assigned_to) 재배정"""
+        tasks = [
+            task
+            for phase in wbs_data.get("project_phases", [])
+            for task in phase.get("tasks", [])
+        ]
+        candidates = [
+            AssignmentCandidate(
+                name=member.name,
+                skills=member.skills or [],
+                skill_level=member.skill_level,
+                hourly_rate=member.hourly_rate,
+                capacity_hours=duration_weeks * 40 * member.allocation_percentage / 100,
+                current_load_hours=member.current_load_hours,
+                available=member.availability
+            )
+            for member in team_members
+        ]
+        result = AssignmentEngine().assign(tasks, candidates)
+        
+        for task, assignee, cost in zip(tasks, result.assignments, result.costs):
+            task["assigned_to"] = assignee or ""
+            task["assignment_reason"] = (
+                f"할당 엔진({result.method}) 최소 비용 배정 (비용 {cost})"
+                if assignee else "가용 시간 내 배정 가능한 팀원이 없습니다"
+            )
+            task["assignment_cost"] = cost
+        
+        wbs_data["team_workload"] = [
+            {
+                "member_name": member.name,
+                "total_hours": result.member_hours.get(member.name, 0),
+                "tasks_count": sum(1 for assignee in result.assignments if assignee == member.name),
+                "utilization_rate": (
+                    f"{result.member_hours.get(member.name, 0) / candidate.capacity_hours * 100:.1f}%"
+                    if candidate.capacity_hours else "N/A"
+                )
+            }
+            for member, candidate in zip(team_members, candidates)
+        ]
+        wbs_data["assignment_method"] = result.method
+        return wbs_data
+    
+    def _build_tasks_from_requirements(self, requirements: Dict[str, Any]) -> Dict[str, Any]:
+        """요구사항 분석 결과를 단계별 Task 구조로 변환"""
+        stack_by_category = {}
+        for suggestion in requirements.get("technical_stack_suggestions", []):
+            category = str(suggestion.get("category", "")).strip().lower()
+            stack_by_category.setdefault(category, []).extend(suggestion.get("technologies", []))
+        
+        def estimate(item: Dict[str, Any]) -> Tuple[int, str]:
+            complexity = str(item.get("complexity", "Medium")).strip().lower()
+            hours = ESTIMATED_EFFORT_HOURS.get(
+                str(item.get("estimated_effort", "")).strip().upper(),
+                COMPLEXITY_HOURS.get(complexity, 40)
+            )
+            return hours, COMPLEXITY_SKILL_LEVEL.get(complexity, "Mid")
+        
+        technical_tasks = []
+        for item in requirements.get("technical_requirements", []):
+            hours, level = estimate(item)
+            category = item.get("category", "")
+            technical_tasks.append({
+                "task_name": item.get("requirement", ""),
+                "description": item.get("requirement", ""),
+                "required_skills": [category] + stack_by_category.get(str(category).strip().lower(), []),
+                "skill_level_required": level,
+                "estimated_hours": hours,
+                "priority": item.get("priority", "High"),
+                "dependencies": [],
+                "deliverables": []
+            })
+        
+        functional_tasks = []
+        for item in requirements.get("functional_requirements", []):
+            hours, level = estimate(item)
+            functional_tasks.append({
+                "task_name": item.get("feature", ""),
+                "description": item.get("description", ""),
+                "required_skills": item.get("required_skills", []),
+                "skill_level_required": level,
+                "estimated_hours": hours,
+                "priority": item.get("priority", "Medium"),
+                "dependencies": item.get("dependencies", []),
+                "deliverables": []
+            })
+        
+        non_functional_tasks = []
+        for item in requirements.get("non_functional_requirements", []):
+            hours, level = estimate(item)
+            non_functional_tasks.append({
+                "task_name": item.get("requirement", ""),
+                "description": item.get("description", ""),
+                "required_skills": [],
+                "skill_level_required": level,
+                "estimated_hours": hours,
+                "priority": item.get("priority", "Medium"),
+                "dependencies": [],
+                "deliverables": []
+            })
+        
+        phases = [
+            ("기술 기반 구축", "기술적 요구사항 구현", technical_tasks),
+            ("기능 개발", "기능적 요구사항 구현", functional_tasks),
+            ("품질 및 비기능 요구사항", "성능/보안/확장성 등 비기능 요구사항 대응", non_functional_tasks)
+        ]
+        return {
+            "project_phases": [
+                {
+                    "phase_name": name,
+                    "description": description,
+                    "duration_weeks": max(round(sum(t["estimated_hours"] for t in tasks) / 40), 1),
+                    "tasks": tasks
+                }
+                for name, description, tasks in phases if tasks
+            ],
+            "team_workload": [],
+            "project_timeline": {
+                "total_duration_weeks": requirements.get("estimated_duration_weeks") or 12,
+                "critical_path": [],
+                "milestones": []
+            }
+        }
+    
     def _create_task_allocation_prompt(
         self,
         requirements: Dict[str, Any],
@@ -375,27 +972,18 @@ class EnhancedWBSService:
 }}
 """
     
-    def _parse_task_allocation(
-        self,
-        allocation_text: str,
-        team_members: List[TeamMember]
-    ) -> Dict[str, Any]:
-        """Task 분배 결과 파싱"""
-        try:
-            # JSON 부분 추출
-            json_start = allocation_text.find('{')
-            json_end = allocation_text.rfind('}') + 1
-            
-            if json_start != -1 and json_end > json_start:
-                json_str = allocation_text[json_start:json_end]
-                return json.loads(json_str)
-            else:
-                # 기본 구조 반환
-                return self._create_default_wbs_structure(team_members)
-                
-        except Exception as e:
-            # 파싱 실패시 기본 구조 반환
-            return self._create_default_wbs_structure(team_members)
+    def _load_task_allocation(self, allocation_text: str) -> Dict[str, Any]:
+        """Task 분배 결과 JSON 추출 (실패 시 ValueError)
+
+        응답이 잘린 경우 마지막으로 완성된 단계까지 복구하고 truncated를 표시합니다.
+        """
+        parsed, truncated = parse_json_object(allocation_text)
+        if parsed is not None and parsed.get("project_phases"):
+            if truncated:
+                parsed[TRUNCATED_KEY] = True
+            return parsed
+        
+        raise ValueError("Task 분배 결과에서 JSON을 찾을 수 없습니다")
     
     def _create_default_wbs_structure(self, team_members: List[TeamMember]) -> Dict[str, Any]:
         """기본 WBS 구조 생성"""
@@ -438,6 +1026,19 @@ class EnhancedWBSService:
             }
         }
     
+    async def _timed_n8n_workflow(
+        self,
+        project_id: int,
+        wbs_data: Dict[str, Any],
+        team_members: List[TeamMember]
+    ) -> Dict[str, Any]:
+        """n8n 단계 실행 (실패 결과도 failed 단계로 기록)"""
+        with stage_timer("n8n") as timer:
+            n8n_result = await self._execute_n8n_workflow(project_id, wbs_data, team_members)
+            if n8n_result.get("status") == "failed":
+                timer["outcome"] = "failed"
+        return n8n_result
+    
     async def _execute_n8n_workflow(
         self,
         project_id: int,
@@ -469,35 +1070,7 @@ class EnhancedWBSService:
     
     def _extract_team_assignment(self, wbs_data: Dict[str, Any]) -> List[Dict[str, Any]]:
         """팀 할당 정보 추출"""
-        team_assignments = []
-        
-        for phase in wbs_data.get("project_phases", []):
-            for task in phase.get("tasks", []):
-                assigned_to = task.get("assigned_to", "")
-                if assigned_to and not any(a["name"] == assigned_to for a in team_assignments):
-                    team_assignments.append({
-                        "name": assigned_to,
-                        "role": task.get("skill_level_required", ""),
-                        "task_count": 0,
-                        "total_hours": 0,
-                        "tasks": []
-                    })
-        
-        # 작업 수 및 시간 계산
-        for phase in wbs_data.get("project_phases", []):
-            for task in phase.get("tasks", []):
-                assigned_to = task.get("assigned_to", "")
-                for assignment in team_assignments:
-                    if assignment["name"] == assigned_to:
-                        assignment["task_count"] += 1
-                        assignment["total_hours"] += task.get("estimated_hours", 0)
-                        assignment["tasks"].append({
-                            "name": task.get("task_name", ""),
-                            "priority": task.get("priority", "Medium"),
-                            "hours": task.get("estimated_hours", 0)
-                        })
-        
-        return team_assignments
+        return aggregate_workload(wbs_data).to_assignments()
     
     def _generate_team_allocation_summary(
         self,
@@ -505,55 +1078,45 @@ class EnhancedWBSService:
         team_members: List[TeamMember]
     ) -> Dict[str, Any]:
         """팀 할당 요약 생성"""
+        workload = aggregate_workload(wbs_data)
+        weeks = wbs_data.get("project_timeline", {}).get("total_duration_weeks", 12)
+        
         summary = {
             "total_team_members": len(team_members),
-            "assigned_members": 0,
-            "unassigned_tasks": 0,
+            "assigned_members": len(workload.members),
+            "unassigned_tasks": workload.unassigned_tasks,
             "workload_distribution": [],
             "skill_utilization": {}
         }
         
-        # 할당된 멤버 수 계산
-        assigned_members = set()
-        for phase in wbs_data.get("project_phases", []):
-            for task in phase.get("tasks", []):
-                if task.get("assigned_to"):
-                    assigned_members.add(task.get("assigned_to"))
-                else:
-                    summary["unassigned_tasks"] += 1
-        
-        summary["assigned_members"] = len(assigned_members)
-        
-        # 작업량 분배 계산
+        # 작업량 분배 계산 (주당 40시간 중 프로젝트 할당 비율 기준 활용률)
         for member in team_members:
-            member_workload = {
+            member_workload = workload.get(member.name)
+            total_hours = member_workload.total_hours if member_workload else 0
+            summary["workload_distribution"].append({
                 "name": member.name,
                 "skill_level": member.skill_level,
-                "total_hours": 0,
-                "task_count": 0,
-                "utilization_rate": "0%"
-            }
-            
-            for phase in wbs_data.get("project_phases", []):
-                for task in phase.get("tasks", []):
-                    if task.get("assigned_to") == member.name:
-                        member_workload["total_hours"] += task.get("estimated_hours", 0)
-                        member_workload["task_count"] += 1
-            
-            if member_workload["total_hours"] > 0:
-                # 주당 40시간 기준으로 활용률 계산
-                weeks = wbs_data.get("project_timeline", {}).get("total_duration_weeks", 12)
-                total_available_hours = weeks * 40
-                utilization = (member_workload["total_hours"] / total_available_hours) * 100
-                member_workload["utilization_rate"] = f"{utilization:.1f}%"
-            
-            summary["workload_distribution"].append(member_workload)
+                "total_hours": total_hours,
+                "task_count": member_workload.task_count if member_workload else 0,
+                "utilization_rate": utilization_rate(
+                    total_hours, weeks, member.allocation_percentage, member.availability
+                )
+            })
         
         return summary
     
     def _generate_project_timeline(self, wbs_data: Dict[str, Any]) -> Dict[str, Any]:
-        """프로젝트 타임라인 생성"""
-        timeline = wbs_data.get("project_timeline", {})
+        """프로젝트 타임라인 생성
+
+        LLM이 제시한 start_week/end_week 대신 작업 의존성과 예상 시간으로
+        일정(CPM)을 직접 계산합니다. 의존성에 순환이 있으면 LLM 일정을 그대로 사용합니다.
+        """
+        try:
+            return ScheduleEngine().build_timeline(wbs_data)
+        except ScheduleCycleError as e:
+            timeline = dict(wbs_data.get("project_timeline", {}))
+            timeline["schedule_error"] = str(e)
+            timeline["dependency_cycle"] = e.cycle
         
         # 간트 차트 데이터 생성
         gantt_data = []
@@ -0,0 +1,219 @@
+"""
+LLM 출력 JSON 처리 유틸리티
+LLM 응답에서 JSON 객체를 추출하는 모듈
+청크 단위로 도착하는 스트리밍 응답도 한 번의 순회로 처리하며,
+코드 펜스와 앞뒤 설명 문구를 무시하고 잘린 응답에서는 완성된 부분만 복구합니다.
+"""
+import bisect
+import json
+import re
+from typing import Any, Dict, List, Optional, Tuple
+
+# 닫는 괄호 앞의 불필요한 쉼표 (LLM이 자주 생성)
+_TRAILING_COMMA = re.compile(r",\s*([}\]])")
+
+_CLOSERS = {"{": "}", "[": "]"}
+
+# 잘린 응답에서 일부만 복구한 결과에 붙이는 표시 키 (캐시하지 않고 호출자에게 전달)
+TRUNCATED_KEY = "truncated"
+
+
+def _loads_lenient(text: str) -> Optional[Any]:
+    """JSON 파싱 (실패 시 불필요한 쉼표를 제거하고 재시도, 그래도 실패하면 None)"""
+    try:
+        return json.loads(text)
+    except json.JSONDecodeError:
+        pass
+    try:
+        return json.loads(_TRAILING_COMMA.sub(r"\1", text))
+    except json.JSONDecodeError:
+        return None
+
+
+class IncrementalJSONExtractor:
+    """LLM 출력에서 가장 바깥쪽의 균형 잡힌 JSON 객체를 점진적으로 추출
+
+    feed()로 청크를 전달하면 이미 처리한 위치부터 이어서 스캔하므로 전체 비용은
+    응답 길이에 선형입니다. array_key가 주어지면 최상위 객체의 해당 배열 항목
+    (예: project_phases의 각 단계)이 닫히는 즉시 feed()의 반환값으로 전달합니다.
+    finish()는 완성된 객체를, 응답이 잘린 경우 최상위 값 또는 최상위 배열의 항목 중
+    마지막으로 완성된 것까지를 닫아 복구한 객체를 반환하고 truncated를 True로 설정합니다.
+    복구 지점은 항목 경계로만 잡으므로 키가 빠진 중간 객체는 결과에 포함되지 않습니다.
+    """
+
+    def __init__(self, array_key: Optional[str] = None):
+        self.array_key = array_key
+        # 수신한 청크를 이어 붙이지 않고 보관 (문자열 누적 복사로 인한 O(n^2) 방지)
+        self._chunks: List[str] = []
+        self._offsets: List[int] = []
+        self._length = 0
+        self._stack: List[str] = []
+        self._in_string = False
+        self._escape = False
+        self._string_start = -1
+        self._start = -1
+        # 후보 '{' 다음의 첫 문자를 기다리는 중 (JSON 객체라면 '"' 또는 '}')
+        self._awaiting_key = False
+        self._last_key: Optional[str] = None
+        self._in_array = False
+        self._item_start = -1
+        self._result: Optional[Dict[str, Any]] = None
+        self._done = False
+        # 스택 안의 열린 객체('{') 수 (최상위 객체만 열려 있으면 1)
+        self._open_objects = 0
+        # 잘린 응답 복구용: 마지막 항목 경계 위치와 그 시점에 필요한 닫는 괄호
+        self._salvage_end = -1
+        self._salvage_closers = ""
+        self.truncated = False
+
+    def feed(self, chunk: str) -> List[Dict[str, Any]]:
+        """청크 추가 후 새로 완성된 배열 항목 목록 반환"""
+        if not chunk:
+            return []
+        base = self._length
+        self._chunks.append(chunk)
+        self._offsets.append(base)
+        self._length += len(chunk)
+        if self._done:
+            return []
+
+        completed = []
+        stack = self._stack
+        for offset, ch in enumerate(chunk):
+            i = base + offset
+
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif ch == "\\":
+                    self._escape = True
+                elif ch == '"':
+                    self._in_string = False
+                    if len(stack) == 1:
+                        self._last_key = self._slice(self._string_start + 1, i)
+                continue
+
+            if self._awaiting_key:
+                if ch in " \t\r\n":
+                    continue
+                self._awaiting_key = False
+                if ch not in '"}':
+                    # 설명 문구의 짝 없는 '{' (예: "{참고}", "{ {")는 후보에서 제외하고 이 문자부터 다시 탐색
+                    self._reset_candidate()
+
+            if not stack:
+                # 객체 밖의 설명 문구, 코드 펜스, 최상위 배열은 무시
+                if ch == "{":
+                    stack.append(ch)
+                    self._open_objects = 1
+                    self._start = i
+                    self._awaiting_key = True
+                    self._last_key = None
+                continue
+
+            if ch == '"':
+                self._in_string = True
+                self._string_start = i
+            elif ch in "{[":
+                stack.append(ch)
+                if ch == "{":
+                    self._open_objects += 1
+                depth = len(stack)
+                if ch == "[" and depth == 2 and self.array_key and self._last_key == self.array_key:
+                    self._in_array = True
+                elif ch == "{" and depth == 3 and self._in_array:
+                    self._item_start = i
+            elif ch in "}]":
+                depth = len(stack)
+                if ch == "}" and depth == 3 and self._item_start != -1:
+                    item = _loads_lenient(self._slice(self._item_start, i + 1))
+                    if isinstance(item, dict):
+                        completed.append(item)
+                    self._item_start = -1
+                elif ch == "]" and depth == 2:
+                    self._in_array = False
+                if stack.pop() == "{":
+                    self._open_objects -= 1
+
+                if not stack:
+                    parsed = _loads_lenient(self._slice(self._start, i + 1))
+                    if isinstance(parsed, dict):
+                        # 첫 번째로 완성된 객체를 결과로 사용하고 뒤의 문구는 무시
+                        self._result = parsed
+                        self._done = True
+                        break
+                    self._reset_candidate()
+                elif self._open_objects == 1:
+                    # 최상위 객체와 배열만 열려 있음: 최상위 값이나 최상위 배열의 항목이 완성된 경계
+                    self._salvage_end = i + 1
+                    self._salvage_closers = "".join(_CLOSERS[c] for c in reversed(stack))
+
+        return completed
+
+    def _slice(self, start: int, end: int) -> str:
+        """수신한 전체 텍스트의 [start, end) 구간"""
+        index = bisect.bisect_right(self._offsets, start) - 1
+        parts = []
+        while index < len(self._chunks) and self._offsets[index] < end:
+            chunk_start = self._offsets[index]
+            parts.append(self._chunks[index][max(start - chunk_start, 0):end - chunk_start])
+            index += 1
+        return "".join(parts)
+
+    def _reset_candidate(self):
+        """현재 후보 객체를 버리고 다음 '{'부터 다시 탐색"""
+        self._stack.clear()
+        self._in_string = False
+        self._escape = False
+        self._start = -1
+        self._awaiting_key = False
+        self._last_key = None
+        self._in_array = False
+        self._item_start = -1
+        self._open_objects = 0
+        self._salvage_end = -1
+        self._salvage_closers = ""
+
+    def finish(self) -> Optional[Dict[str, Any]]:
+        """스트림 종료 후 추출 결과 반환 (JSON 객체가 없으면 None)
+
+        설명 문구의 '{'는 feed()에서 이미 후보에서 제외되므로 다시 스캔하지 않고,
+        닫히지 않은 후보는 마지막 항목 경계까지 복구합니다.
+        """
+        if self._result is None and self._start != -1:
+            self._salvage()
+        self._done = True
+        return self._result
+
+    def _salvage(self) -> bool:
+        """잘린 응답: 마지막 항목 경계까지 잘라 열린 괄호를 닫아 복구"""
+        if self._salvage_end == -1:
+            return False
+        salvaged = _loads_lenient(self._slice(self._start, self._salvage_end) + self._salvage_closers)
+        if not isinstance(salvaged, dict):
+            return False
+        self._result = salvaged
+        self.truncated = True
+        return True
+
+    @property
+    def result(self) -> Optional[Dict[str, Any]]:
+        """완성된 JSON 객체 (finish() 전에는 완성된 경우에만 값이 있음)"""
+        return self._result
+
+    @property
+    def text(self) -> str:
+        """지금까지 수신한 전체 텍스트"""
+        return self._slice(0, self._length)
+
+
+def parse_json_object(text: str) -> Tuple[Optional[Dict[str, Any]], bool]:
+    """텍스트에서 JSON 객체 추출 ((객체 또는 None, 잘린 응답에서 복구했는지 여부))"""
+    extractor = IncrementalJSONExtractor()
+    extractor.feed(text or "")
+    return extractor.finish(), extractor.truncated
+
+
+def extract_json_object(text: str) -> Optional[Dict[str, Any]]:
+    """텍스트에서 JSON 객체 추출 (없으면 None)"""
+    return parse_json_object(text)[0]
@@ -5,7 +5,9 @@ n8n MCP (Model Context Protocol) 서버를 통한 AI 모델 연동 WBS 생성 
 import json
 from typing import Dict, List, Any, Optional
 from openai import AsyncOpenAI
-from app.core.n8n_client import N8nMCPClient
+from app.core.n8n_client import N8nMCPClient, get_n8n_client
+from app.services.llm_json import parse_json_object
+from app.services.workload_aggregation import aggregate_workload
 from config import settings
 # from prompts.cursor_ai_template import format_cursor_prompt, format_team_info_table
 
@@ -70,9 +72,9 @@ JSON 형식으로 응답해주세요:
 class N8nMCPService:
     """n8n MCP 서버를 통한 AI 모델 연동 WBS 생성 서비스"""
     
-    def __init__(self):
-        self.openai_client = AsyncOpenAI(api_key=settings.openai_api_key)
-        self.n8n_client = N8nMCPClient()
+    def __init__(self, n8n_client: Optional[N8nMCPClient] = None):
+        self.openai_client = AsyncOpenAI(api_key=settings.openai_api_key, base_url=settings.openai_base_url)
+        self.n8n_client = n8n_client or get_n8n_client()
     
     async def generate_wbs_via_n8n_mcp(
         self,
@@ -118,16 +120,14 @@ class N8nMCPService:
             # MCP 응답에서 WBS 데이터 추출
             ai_response = mcp_response.get("llm_response", "")
             
-            # JSON 부분 추출 및 파싱
-            json_start = ai_response.find('{')
-            json_end = ai_response.rfind('}') + 1
+            # JSON 부분 추출 및 파싱 (코드 펜스, 설명 문구, 잘린 응답 허용)
+            wbs_data, truncated = parse_json_object(ai_response)
             
-            if json_start != -1 and json_end != -1:
-                json_str = ai_response[json_start:json_end]
-                wbs_data = json.loads(json_str)
-                
+            if wbs_data is not None:
+                # 잘린 응답에서 일부만 복구한 경우 partial로 보고
                 return {
-                    "status": "success",
+                    "status": "partial" if truncated else "success",
+                    "truncated": truncated,
                     "wbs_data": wbs_data,
                     "raw_response": ai_response,
                     "mcp_execution_id": mcp_response.get("execution_id"),
@@ -173,7 +173,7 @@ class N8nMCPService:
                 team_members=team_members
             )
             
-            if wbs_result.get("status") != "success":
+            if wbs_result.get("status") not in ("success", "partial"):
                 return {
                     "status": "failed",
                     "error": wbs_result.get("error", "WBS 생성 실패"),
@@ -194,7 +194,8 @@ class N8nMCPService:
             )
             
             return {
-                "status": "success",
+                "status": wbs_result["status"],
+                "truncated": wbs_result.get("truncated", False),
                 "wbs_data": wbs_result["wbs_data"],
                 "n8n_execution_id": n8n_result.get("execution_id"),
                 "mcp_execution_id": wbs_result.get("mcp_execution_id"),
@@ -241,40 +242,5 @@ class N8nMCPService:
     
     def _extract_team_assignment(self, wbs_data: Dict[str, Any]) -> List[Dict[str, Any]]:
         """팀 할당 정보 추출"""
-        team_assignments = []
-        assigned_people = set()
-        
-        for deliverable in wbs_data.get("deliverables", []):
-            for task in deliverable.get("tasks", []):
-                assigned_to = task.get("assigned_to", "")
-                if assigned_to and assigned_to not in assigned_people:
-                    assigned_people.add(assigned_to)
-                    team_assignments.append({
-                        "name": assigned_to,
-                        "role": task.get("required_skill", ""),
-                        "task_count": 0,
-                        "tasks": []
-                    })
-        
-        # 작업 수 카운트
-        assigned_people = list(assigned_people)
-        for assignee in assigned_people:
-            task_count = 0
-            tasks = []
-            
-            for deliverable in wbs_data.get("deliverables", []):
-                for task in deliverable.get("tasks", []):
-                    if task.get("assigned_to", "") == assignee:
-                        task_count += 1
-                        tasks.append({
-                            "name": task.get("task_name", ""),
-                            "priority": task.get("priority", "Medium")
-                        })
-            
-            # 해당하는 사람의 정보 업데이트
-            for assignment in team_assignments:
-                if assignment["name"] == assignee:
-                    assignment["task_count"] = task_count
-                    assignment["tasks"] = tasks
-            
-        return team_assignments
+        workload = aggregate_workload(wbs_data, group_key="deliverables", role_key="required_skill")
+        return workload.to_assignments(include_hours=False)
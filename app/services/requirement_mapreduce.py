@@ -0,0 +1,182 @@
+"""
+대용량 요구사항 문서 map-reduce 유틸리티
+제안서, RFP, 추가 파일을 토큰 한도 내의 청크로 나누고
+청크별 요구사항 분석 결과를 기존 스키마로 병합(중복 제거)하는 모듈
+"""
+import re
+from typing import Dict, List, Any, Optional, Tuple
+
+# 문단 -> 줄 -> 문장 -> 단어 순으로 자연스러운 경계에서 분할
+_SEPARATORS = ("\n\n", "\n", ". ", " ")
+
+# 목록별 중복 판단 기준 필드
+REQUIREMENT_LIST_KEYS = {
+    "business_requirements": "requirement",
+    "technical_requirements": "requirement",
+    "functional_requirements": "feature",
+    "non_functional_requirements": "requirement",
+    "technical_stack_suggestions": "category",
+}
+
+_PRIORITY_RANK = {"low": 0, "medium": 1, "high": 2}
+_COMPLEXITY_RANK = {"simple": 0, "medium": 1, "complex": 2}
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def estimate_tokens(text: str) -> int:
+    """토크나이저 없이 토큰 수 추정
+
+    영문/숫자는 약 4자당 1토큰, 한글 등 비ASCII 문자는 1자당 약 1토큰으로 계산합니다.
+    UTF-8 바이트 길이를 이용해 문자 단위 순회 없이 계산합니다.
+    """
+    if not text:
+        return 0
+    length = len(text)
+    non_ascii = min((len(text.encode("utf-8")) - length) // 2, length)
+    return (length - non_ascii) // 4 + non_ascii + 1
+
+
+def _split_text(text: str, max_tokens: int, separators: Tuple[str, ...] = _SEPARATORS) -> List[str]:
+    """텍스트를 max_tokens 이하 조각으로 분할"""
+    if estimate_tokens(text) <= max_tokens:
+        return [text]
+
+    if not separators:
+        # 구분자가 없으면 문자 수 기준으로 자름 (1자 1토큰으로 보수적으로 가정)
+        return [text[i:i + max_tokens] for i in range(0, len(text), max_tokens)]
+
+    separator, rest = separators[0], separators[1:]
+    pieces: List[str] = []
+    current: List[str] = []
+    current_tokens = 0
+    for part in text.split(separator):
+        part_tokens = estimate_tokens(part)
+        if part_tokens > max_tokens:
+            if current:
+                pieces.append(separator.join(current))
+                current, current_tokens = [], 0
+            pieces.extend(_split_text(part, max_tokens, rest))
+            continue
+        if current and current_tokens + part_tokens > max_tokens:
+            pieces.append(separator.join(current))
+            current, current_tokens = [], 0
+        current.append(part)
+        current_tokens += part_tokens
+    if current:
+        pieces.append(separator.join(current))
+    return [piece for piece in pieces if piece.strip()]
+
+
+def split_documents(sources: List[Tuple[str, str]], max_tokens: int) -> List[str]:
+    """(제목, 본문) 목록을 max_tokens 이하의 청크 텍스트로 분할
+
+    큰 문서는 여러 청크로 나누고, 작은 문서는 한 청크에 함께 담습니다.
+    각 조각에는 "## 제목 (부분 i/n)" 머리글을 붙입니다.
+    """
+    # 머리글 분량을 고려한 본문 한도
+    body_tokens = max(max_tokens - 50, 1)
+
+    sections: List[Tuple[str, int]] = []
+    for title, text in sources:
+        if not text or not text.strip():
+            continue
+        parts = _split_text(text, body_tokens)
+        for index, part in enumerate(parts, start=1):
+            header = f"## {title}" if len(parts) == 1 else f"## {title} (부분 {index}/{len(parts)})"
+            section = f"{header}\n{part}"
+            sections.append((section, estimate_tokens(section)))
+
+    chunks: List[str] = []
+    current: List[str] = []
+    current_tokens = 0
+    for section, tokens in sections:
+        if current and current_tokens + tokens > max_tokens:
+            chunks.append("\n\n".join(current))
+            current, current_tokens = [], 0
+        current.append(section)
+        current_tokens += tokens
+    if current:
+        chunks.append("\n\n".join(current))
+    return chunks
+
+
+def _normalize(value: Any) -> str:
+    """중복 비교용 정규화"""
+    return _WHITESPACE.sub(" ", str(value or "")).strip().lower()
+
+
+def _higher(current: Any, candidate: Any, rank: Dict[str, int]) -> Any:
+    """순위가 더 높은 값 (알 수 없는 값이면 기존 값 유지)"""
+    current_rank = rank.get(_normalize(current), -1)
+    candidate_rank = rank.get(_normalize(candidate), -1)
+    return candidate if candidate_rank > current_rank else current
+
+
+def _merge_item(existing: Dict[str, Any], item: Dict[str, Any]):
+    """중복 항목 병합 (우선순위/복잡도는 높은 값, 목록은 합집합, 빈 필드는 채움)"""
+    for key, value in item.items():
+        current = existing.get(key)
+        if key == "priority":
+            existing[key] = _higher(current, value, _PRIORITY_RANK)
+        elif key == "complexity":
+            existing[key] = _higher(current, value, _COMPLEXITY_RANK)
+        elif isinstance(current, list) and isinstance(value, list):
+            seen = {_normalize(v) for v in current}
+            for v in value:
+                if _normalize(v) not in seen:
+                    seen.add(_normalize(v))
+                    current.append(v)
+        elif not current and value:
+            existing[key] = value
+
+
+def merge_requirement_analyses(partials: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """청크별 요구사항 분석 결과를 하나의 분석 결과로 병합"""
+    merged: Dict[str, Any] = {key: [] for key in REQUIREMENT_LIST_KEYS}
+    indexes: Dict[str, Dict[str, Dict[str, Any]]] = {key: {} for key in REQUIREMENT_LIST_KEYS}
+    overviews: List[str] = []
+    risk_factors: List[Any] = []
+    seen_risks = set()
+    complexity: Optional[str] = None
+    duration_weeks = 0
+
+    for partial in partials:
+        overview = partial.get("project_overview")
+        if overview and overview not in overviews:
+            overviews.append(overview)
+
+        for key, id_field in REQUIREMENT_LIST_KEYS.items():
+            for item in partial.get(key) or []:
+                if not isinstance(item, dict):
+                    continue
+                identity = _normalize(item.get(id_field))
+                if not identity:
+                    merged[key].append(dict(item))
+                    continue
+                existing = indexes[key].get(identity)
+                if existing is None:
+                    existing = dict(item)
+                    indexes[key][identity] = existing
+                    merged[key].append(existing)
+                else:
+                    _merge_item(existing, item)
+
+        for risk in partial.get("risk_factors") or []:
+            identity = _normalize(risk)
+            if identity and identity not in seen_risks:
+                seen_risks.add(identity)
+                risk_factors.append(risk)
+
+        complexity = _higher(complexity, partial.get("project_complexity"), _COMPLEXITY_RANK)
+        try:
+            duration_weeks = max(duration_weeks, int(partial.get("estimated_duration_weeks") or 0))
+        except (TypeError, ValueError):
+            pass
+
+    merged["project_overview"] = "\n".join(overviews)
+    merged["project_complexity"] = complexity or "Medium"
+    # 청크는 같은 프로젝트의 일부이므로 기간은 합산하지 않고 최댓값 사용
+    merged["estimated_duration_weeks"] = duration_weeks or 12
+    merged["risk_factors"] = risk_factors
+    return merged
@@ -0,0 +1,382 @@
+"""
+자원 평준화(Resource Leveling) 스케줄러
+팀원별 주당 가용 시간(프로젝트 할당 비율, 참여 가능 여부)을 넘지 않도록
+WBS 작업에 시작/종료 일정을 배정하고 팀원별 주간 활용률을 계산하는 모듈
+"""
+import heapq
+import math
+from collections import defaultdict
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Dict, List, Any, Optional, Iterable, Tuple
+
+from app.services.schedule_engine import ScheduleEngine, ScheduledTask
+
+PRIORITY_RANK = {"high": 0, "medium": 1, "low": 2}
+
+
+@dataclass
+class LevelingTask:
+    """평준화 대상 작업"""
+    key: str
+    name: str
+    hours: float
+    assigned_to: str = ""
+    project_id: Optional[int] = None
+    priority: str = "Medium"
+    phase_name: str = ""
+    dependencies: List[str] = field(default_factory=list)  # 같은 프로젝트 내 선행 작업명
+
+
+@dataclass
+class MemberCapacity:
+    """팀원 주당 가용 시간"""
+    name: str
+    weekly_hours: float
+    project_hours: Dict[Optional[int], float] = field(default_factory=dict)  # 프로젝트별 주당 한도
+
+    def project_limit(self, project_id: Optional[int]) -> float:
+        """프로젝트별 주당 한도 (지정되지 않은 프로젝트는 전체 가용 시간)"""
+        if project_id in self.project_hours:
+            return self.project_hours[project_id]
+        return self.weekly_hours
+
+
+def tasks_from_wbs(wbs_data: Dict[str, Any], project_id: Optional[int] = None) -> List[LevelingTask]:
+    """wbs_data의 단계별 작업을 평준화 작업 목록으로 변환"""
+    tasks = []
+    for phase in wbs_data.get("project_phases", []):
+        for task in phase.get("tasks", []):
+            try:
+                hours = max(float(task.get("estimated_hours") or 0), 0.0)
+            except (TypeError, ValueError):
+                hours = 0.0
+            tasks.append(LevelingTask(
+                key=f"{project_id}:{len(tasks)}",
+                name=task.get("task_name", ""),
+                hours=hours,
+                assigned_to=task.get("assigned_to", "") or "",
+                project_id=project_id,
+                priority=task.get("priority", "Medium") or "Medium",
+                phase_name=phase.get("phase_name", ""),
+                dependencies=list(task.get("dependencies") or [])
+            ))
+    return tasks
+
+
+def build_member_capacities(
+    memberships: Iterable[Dict[str, Any]],
+    hours_per_week: float = 40.0
+) -> Dict[str, MemberCapacity]:
+    """프로젝트 멤버십으로부터 팀원별 주당 가용 시간 계산
+
+    memberships 항목: {"name", "availability", "project_id", "allocation_percentage"}
+    한 팀원의 활성 프로젝트 할당 비율 합이 100%를 넘으면 비례 축소하여
+    모든 프로젝트를 합쳐도 주당 가용 시간을 초과하지 않도록 합니다.
+    """
+    allocations: Dict[str, Dict[Optional[int], float]] = defaultdict(dict)
+    available: Dict[str, bool] = {}
+
+    for membership in memberships:
+        name = membership["name"]
+        available[name] = available.get(name, True) and bool(membership.get("availability", True))
+        allocation = membership.get("allocation_percentage")
+        allocation = 100.0 if allocation is None else max(float(allocation), 0.0)
+        project_id = membership.get("project_id")
+        allocations[name][project_id] = allocations[name].get(project_id, 0.0) + allocation
+
+    capacities = {}
+    for name, per_project in allocations.items():
+        if not available.get(name, True):
+            capacities[name] = MemberCapacity(name=name, weekly_hours=0.0)
+            continue
+
+        total = sum(per_project.values())
+        scale = min(1.0, 100.0 / total) if total > 0 else 0.0
+        project_hours = {
+            project_id: hours_per_week * allocation / 100.0 * scale
+            for project_id, allocation in per_project.items()
+        }
+        capacities[name] = MemberCapacity(
+            name=name,
+            weekly_hours=hours_per_week * min(total, 100.0) / 100.0,
+            project_hours=project_hours
+        )
+    return capacities
+
+
+class ResourceLevelingScheduler:
+    """우선순위 규칙 기반 직렬 스케줄 생성(Serial SGS) 평준화 스케줄러
+
+    선행 작업이 모두 배정된 작업 중 CPM 최늦 시작(latest start)이 가장 이른 작업,
+    우선순위(High > Medium > Low), 작업 시간이 긴 작업 순으로 배정합니다.
+    각 작업은 선행 작업이 끝난 주부터 담당자의 남은 주간 가용 시간을 채우며 진행됩니다.
+    팀원·프로젝트별로 첫 여유 주차를 기억하므로 전체 작업량에 거의 선형으로 동작합니다.
+    """
+
+    def __init__(self, hours_per_week: float = 40.0, horizon_weeks: int = 520):
+        self.hours_per_week = hours_per_week
+        self.horizon_weeks = horizon_weeks
+
+    def level(
+        self,
+        tasks: List[LevelingTask],
+        capacities: Dict[str, MemberCapacity],
+        start_date: Optional[datetime] = None
+    ) -> Dict[str, Any]:
+        """작업 일정 배정 및 팀원별 주간 활용률 계산"""
+        capacities = dict(capacities)
+        cpm_tasks = self._build_cpm_tasks(tasks)
+        # 우선순위 규칙용 최늦 시작 계산 (순환 시 ScheduleCycleError)
+        ScheduleEngine(self.hours_per_week).compute(cpm_tasks)
+
+        n = len(tasks)
+        successors: List[List[int]] = [[] for _ in range(n)]
+        remaining = [0] * n
+        for index, task in enumerate(cpm_tasks):
+            for predecessor in task.predecessors:
+                successors[predecessor].append(index)
+                remaining[index] += 1
+
+        # 팀원 전체 / 팀원·프로젝트별 주간 사용 시간과 첫 여유 주차
+        used_total: Dict[str, List[float]] = defaultdict(list)
+        used_project: Dict[Tuple[str, Optional[int]], List[float]] = defaultdict(list)
+        first_free: Dict[Tuple[str, Optional[int]], int] = defaultdict(int)
+
+        ready_week = [0] * n
+        start_week = [0] * n
+        finish_week = [0] * n
+        scheduled = [False] * n
+        unscheduled = []
+        unknown_members = set()
+
+        heap = [self._priority(cpm_tasks, tasks, i) for i in range(n) if remaining[i] == 0]
+        heapq.heapify(heap)
+
+        while heap:
+            index = heapq.heappop(heap)[-1]
+            task = tasks[index]
+            member = task.assigned_to
+
+            if not member or task.hours <= 0:
+                duration = math.ceil(task.hours / self.hours_per_week) if task.hours > 0 else 1
+                start_week[index] = ready_week[index]
+                finish_week[index] = ready_week[index] + duration - 1
+                scheduled[index] = True
+            else:
+                capacity = capacities.get(member)
+                if capacity is None:
+                    unknown_members.add(member)
+                    capacity = MemberCapacity(name=member, weekly_hours=self.hours_per_week)
+                    capacities[member] = capacity
+
+                placed = self._place(
+                    task, capacity, ready_week[index],
+                    used_total[member], used_project[(member, task.project_id)],
+                    first_free
+                )
+                if placed is None:
+                    unscheduled.append({
+                        "key": task.key,
+                        "task": task.name,
+                        "assigned_to": member,
+                        "reason": "담당자의 가용 시간이 없습니다"
+                    })
+                    start_week[index] = finish_week[index] = ready_week[index]
+                else:
+                    start_week[index], finish_week[index] = placed
+                    scheduled[index] = True
+
+            for successor in successors[index]:
+                if finish_week[index] > ready_week[successor]:
+                    ready_week[successor] = finish_week[index]
+                remaining[successor] -= 1
+                if remaining[successor] == 0:
+                    heapq.heappush(heap, self._priority(cpm_tasks, tasks, successor))
+
+        return self._build_result(
+            tasks, cpm_tasks, start_week, finish_week, scheduled,
+            capacities, used_total, unscheduled, unknown_members, start_date
+        )
+
+    def _build_cpm_tasks(self, tasks: List[LevelingTask]) -> List[ScheduledTask]:
+        """프로젝트 내 작업명으로 선행 작업을 연결한 CPM 작업 목록"""
+        index_by_name: Dict[Tuple[Optional[int], str], int] = {}
+        for index, task in enumerate(tasks):
+            index_by_name.setdefault((task.project_id, ScheduleEngine._normalize(task.name)), index)
+
+        cpm_tasks = []
+        for index, task in enumerate(tasks):
+            predecessors = []
+            for dependency in task.dependencies:
+                predecessor = index_by_name.get((task.project_id, ScheduleEngine._normalize(dependency)))
+                if predecessor is not None and predecessor != index and predecessor not in predecessors:
+                    predecessors.append(predecessor)
+            cpm_tasks.append(ScheduledTask(
+                name=task.name,
+                duration_hours=task.hours,
+                assigned_to=task.assigned_to,
+                priority=task.priority,
+                predecessors=predecessors
+            ))
+        return cpm_tasks
+
+    @staticmethod
+    def _priority(cpm_tasks: List[ScheduledTask], tasks: List[LevelingTask], index: int) -> tuple:
+        """우선순위 키: (최늦 시작, 우선순위, -작업 시간, 인덱스)"""
+        task = tasks[index]
+        return (
+            cpm_tasks[index].latest_start,
+            PRIORITY_RANK.get(str(task.priority).lower(), 1),
+            -task.hours,
+            index
+        )
+
+    def _place(
+        self,
+        task: LevelingTask,
+        capacity: MemberCapacity,
+        ready: int,
+        used_total: List[float],
+        used_project: List[float],
+        first_free: Dict[Tuple[str, Optional[int]], int]
+    ) -> Optional[Tuple[int, int]]:
+        """담당자의 주간 가용 시간을 채우며 작업 배정 (시작 주차, 종료 주차)"""
+        weekly_limit = capacity.weekly_hours
+        project_limit = min(capacity.project_limit(task.project_id), weekly_limit)
+        if project_limit <= 0:
+            return None
+
+        free_key = (capacity.name, task.project_id)
+        week = max(ready, first_free[free_key])
+        remaining = task.hours
+        start = None
+        epsilon = 1e-9
+        taken: List[Tuple[int, float]] = []
+
+        while remaining > epsilon:
+            if week >= self.horizon_weeks:
+                # 계획 기간 안에 끝나지 않으면 이미 채운 시간을 되돌리고 배정 실패
+                for taken_week, hours in taken:
+                    used_total[taken_week] -= hours
+                    used_project[taken_week] -= hours
+                return None
+            while len(used_total) <= week:
+                used_total.append(0.0)
+            while len(used_project) <= week:
+                used_project.append(0.0)
+
+            available = min(weekly_limit - used_total[week], project_limit - used_project[week])
+            if available > epsilon:
+                take = min(available, remaining)
+                used_total[week] += take
+                used_project[week] += take
+                taken.append((week, take))
+                remaining -= take
+                if start is None:
+                    start = week
+            if remaining > epsilon:
+                week += 1
+
+        # 가득 찬 주차를 건너뛰도록 첫 여유 주차 갱신
+        pointer = first_free[free_key]
+        while pointer < len(used_total) and min(
+            weekly_limit - used_total[pointer],
+            project_limit - (used_project[pointer] if pointer < len(used_project) else 0.0)
+        ) <= epsilon:
+            pointer += 1
+        first_free[free_key] = pointer
+
+        return start, week
+
+    def _build_result(
+        self,
+        tasks: List[LevelingTask],
+        cpm_tasks: List[ScheduledTask],
+        start_week: List[int],
+        finish_week: List[int],
+        scheduled: List[bool],
+        capacities: Dict[str, MemberCapacity],
+        used_total: Dict[str, List[float]],
+        unscheduled: List[Dict[str, Any]],
+        unknown_members: set,
+        start_date: Optional[datetime]
+    ) -> Dict[str, Any]:
+        """평준화 결과 구성 (주차는 1부터 시작)"""
+        scheduled_tasks = []
+        for index, task in enumerate(tasks):
+            item = {
+                "key": task.key,
+                "project_id": task.project_id,
+                "phase": task.phase_name,
+                "task": task.name,
+                "assigned_to": task.assigned_to,
+                "hours": task.hours,
+                "priority": task.priority,
+                "start_week": start_week[index] + 1,
+                "end_week": finish_week[index] + 1,
+                "slack_hours": cpm_tasks[index].slack,
+                "scheduled": scheduled[index]
+            }
+            if start_date:
+                item["start_date"] = (start_date + timedelta(weeks=start_week[index])).date().isoformat()
+                item["end_date"] = (
+                    start_date + timedelta(weeks=finish_week[index] + 1) - timedelta(days=1)
+                ).date().isoformat()
+            scheduled_tasks.append(item)
+
+        makespan = max((finish_week[i] + 1 for i in range(len(tasks))), default=0)
+
+        utilization = {}
+        for member, weeks in used_total.items():
+            capacity = capacities[member].weekly_hours
+            utilization[member] = [
+                {
+                    "week": week + 1,
+                    "hours": round(hours, 2),
+                    "capacity": round(capacity, 2),
+                    "utilization_rate": f"{(hours / capacity * 100) if capacity else 0:.1f}%"
+                }
+                for week, hours in enumerate(weeks)
+            ]
+
+        return {
+            "total_duration_weeks": makespan,
+            "tasks": scheduled_tasks,
+            "member_utilization": utilization,
+            "unscheduled_tasks": unscheduled,
+            "unknown_members": sorted(unknown_members)
+        }
+
+
+async def load_member_capacities(db, project_ids: List[int], hours_per_week: float = 40.0) -> Dict[str, MemberCapacity]:
+    """대상 프로젝트 팀원들의 전체 활성 멤버십으로 주당 가용 시간 계산 (AsyncSession)"""
+    from sqlalchemy import select
+    from app.models.team import TeamMember, ProjectMember
+
+    member_ids = select(ProjectMember.team_member_id).where(
+        ProjectMember.project_id.in_(project_ids),
+        ProjectMember.is_active == True
+    )
+    result = await db.execute(
+        select(ProjectMember, TeamMember).join(
+            TeamMember, ProjectMember.team_member_id == TeamMember.id
+        ).where(
+            ProjectMember.team_member_id.in_(member_ids),
+            ProjectMember.is_active == True
+        )
+    )
+    rows = result.all()
+
+    return build_member_capacities(
+        (
+            {
+                "name": member.name,
+                "availability": member.availability,
+                "project_id": membership.project_id,
+                "allocation_percentage": membership.allocation_percentage
+            }
+            for membership, member in rows
+        ),
+        hours_per_week
+    )
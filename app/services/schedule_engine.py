@@ -0,0 +1,249 @@
+"""
+일정 계산 엔진
+WBS 작업의 의존성(dependencies)과 예상 시간(estimated_hours)으로 DAG를 구성하고
+CPM(Critical Path Method)으로 가장 이른/늦은 시작, 여유 시간, 크리티컬 패스를 계산하는 모듈
+"""
+import math
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Dict, List, Any, Optional, Tuple
+
+
+class ScheduleCycleError(Exception):
+    """작업 의존성에 순환이 있는 경우"""
+
+    def __init__(self, cycle: List[str]):
+        self.cycle = cycle
+        super().__init__(f"작업 의존성에 순환이 있습니다: {' -> '.join(cycle)}")
+
+
+@dataclass
+class ScheduledTask:
+    """일정이 계산된 작업"""
+    name: str
+    duration_hours: float
+    earliest_start: float = 0.0
+    earliest_finish: float = 0.0
+    latest_start: float = 0.0
+    latest_finish: float = 0.0
+    slack: float = 0.0
+    is_critical: bool = False
+    phase_name: str = ""
+    assigned_to: str = ""
+    priority: str = "Medium"
+    predecessors: List[int] = field(default_factory=list)
+
+
+@dataclass
+class ScheduleResult:
+    """일정 계산 결과"""
+    tasks: List[ScheduledTask]
+    order: List[int]  # 위상 정렬 순서 (tasks 인덱스)
+    project_duration_hours: float
+    critical_path: List[str]
+    unresolved_dependencies: List[Dict[str, str]]
+
+
+class ScheduleEngine:
+    """CPM 기반 일정 계산 엔진
+
+    작업 수 V, 의존성 수 E에 대해 O(V + E)로 동작합니다.
+    작업 기간은 담당자가 전일 투입된다고 가정하여 estimated_hours를 그대로 사용합니다.
+    """
+
+    def __init__(self, hours_per_week: float = 40.0):
+        self.hours_per_week = hours_per_week
+
+    @staticmethod
+    def _normalize(name: Any) -> str:
+        """작업명 비교용 정규화"""
+        return str(name or "").strip().lower()
+
+    def build_tasks(self, wbs_data: Dict[str, Any]) -> Tuple[List[ScheduledTask], List[Dict[str, str]]]:
+        """wbs_data에서 작업 목록과 선행 작업 인덱스 구성"""
+        tasks: List[ScheduledTask] = []
+        raw_dependencies: List[List[Any]] = []
+        index_by_name: Dict[str, int] = {}
+
+        for phase in wbs_data.get("project_phases", []):
+            for task in phase.get("tasks", []):
+                name = task.get("task_name", "")
+                try:
+                    hours = max(float(task.get("estimated_hours") or 0), 0.0)
+                except (TypeError, ValueError):
+                    hours = 0.0
+                index = len(tasks)
+                tasks.append(ScheduledTask(
+                    name=name,
+                    duration_hours=hours,
+                    phase_name=phase.get("phase_name", ""),
+                    assigned_to=task.get("assigned_to", "") or "",
+                    priority=task.get("priority", "Medium")
+                ))
+                raw_dependencies.append(task.get("dependencies") or [])
+                index_by_name.setdefault(self._normalize(name), index)
+
+        unresolved = []
+        for index, dependencies in enumerate(raw_dependencies):
+            seen = set()
+            for dependency in dependencies:
+                predecessor = index_by_name.get(self._normalize(dependency))
+                if predecessor is None:
+                    unresolved.append({"task": tasks[index].name, "dependency": str(dependency)})
+                    continue
+                if predecessor == index or predecessor in seen:
+                    continue
+                seen.add(predecessor)
+                tasks[index].predecessors.append(predecessor)
+
+        return tasks, unresolved
+
+    def schedule(self, wbs_data: Dict[str, Any]) -> ScheduleResult:
+        """가장 이른/늦은 일정, 여유 시간, 크리티컬 패스 계산"""
+        tasks, unresolved = self.build_tasks(wbs_data)
+        return self.compute(tasks, unresolved)
+
+    def compute(
+        self,
+        tasks: List[ScheduledTask],
+        unresolved: Optional[List[Dict[str, str]]] = None
+    ) -> ScheduleResult:
+        """선행 작업 인덱스가 채워진 작업 목록에 대해 CPM 계산"""
+        n = len(tasks)
+
+        successors: List[List[int]] = [[] for _ in range(n)]
+        indegree = [0] * n
+        for index, task in enumerate(tasks):
+            for predecessor in task.predecessors:
+                successors[predecessor].append(index)
+                indegree[index] += 1
+
+        # 위상 정렬 (Kahn)
+        queue = deque(i for i in range(n) if indegree[i] == 0)
+        order: List[int] = []
+        remaining = indegree[:]
+        while queue:
+            current = queue.popleft()
+            order.append(current)
+            for successor in successors[current]:
+                remaining[successor] -= 1
+                if remaining[successor] == 0:
+                    queue.append(successor)
+
+        if len(order) < n:
+            raise ScheduleCycleError(self._find_cycle(tasks, remaining))
+
+        # 전진 계산 (earliest start/finish)
+        for index in order:
+            task = tasks[index]
+            start = 0.0
+            for predecessor in task.predecessors:
+                finish = tasks[predecessor].earliest_finish
+                if finish > start:
+                    start = finish
+            task.earliest_start = start
+            task.earliest_finish = start + task.duration_hours
+
+        project_duration = max((task.earliest_finish for task in tasks), default=0.0)
+
+        # 후진 계산 (latest start/finish)
+        for index in reversed(order):
+            task = tasks[index]
+            finish = project_duration
+            for successor in successors[index]:
+                start = tasks[successor].latest_start
+                if start < finish:
+                    finish = start
+            task.latest_finish = finish
+            task.latest_start = finish - task.duration_hours
+            task.slack = max(task.latest_start - task.earliest_start, 0.0)
+            task.is_critical = task.slack <= 1e-9
+
+        critical_path = self._critical_path(tasks, order, successors)
+
+        return ScheduleResult(
+            tasks=tasks,
+            order=order,
+            project_duration_hours=project_duration,
+            critical_path=critical_path,
+            unresolved_dependencies=unresolved or []
+        )
+
+    @staticmethod
+    def _critical_path(
+        tasks: List[ScheduledTask],
+        order: List[int],
+        successors: List[List[int]]
+    ) -> List[str]:
+        """시작 작업부터 종료 작업까지 이어지는 크리티컬 패스 작업명"""
+        current: Optional[int] = next(
+            (i for i in order if tasks[i].is_critical and tasks[i].earliest_start == 0.0),
+            None
+        )
+
+        path: List[str] = []
+        while current is not None:
+            path.append(tasks[current].name)
+            finish = tasks[current].earliest_finish
+            next_index = None
+            for successor in successors[current]:
+                candidate = tasks[successor]
+                if candidate.is_critical and abs(candidate.earliest_start - finish) <= 1e-9:
+                    next_index = successor
+                    break
+            current = next_index
+        return path
+
+    @staticmethod
+    def _find_cycle(tasks: List[ScheduledTask], remaining: List[int]) -> List[str]:
+        """위상 정렬 후 남은 작업들에서 순환 경로 하나를 찾음"""
+        # 남은 작업은 모두 순환 위 또는 순환 뒤에 있으므로 선행 작업을 따라가면 순환에 도달
+        start = next(i for i, degree in enumerate(remaining) if degree > 0)
+        visited: Dict[int, int] = {}
+        path: List[int] = []
+        current = start
+        while current not in visited:
+            visited[current] = len(path)
+            path.append(current)
+            current = next(p for p in tasks[current].predecessors if remaining[p] > 0)
+        cycle = path[visited[current]:]
+        cycle.reverse()
+        return [tasks[i].name for i in cycle] + [tasks[cycle[0]].name]
+
+    def to_week(self, hours: float) -> int:
+        """시작 시각(시간)을 1부터 시작하는 주차로 변환"""
+        return int(hours // self.hours_per_week) + 1
+
+    def build_timeline(self, wbs_data: Dict[str, Any]) -> Dict[str, Any]:
+        """간트 차트 데이터를 포함한 프로젝트 타임라인 생성"""
+        result = self.schedule(wbs_data)
+        llm_timeline = wbs_data.get("project_timeline", {}) or {}
+
+        gantt_data = []
+        for task in result.tasks:
+            start_week = self.to_week(task.earliest_start)
+            end_week = max(start_week, math.ceil(task.earliest_finish / self.hours_per_week))
+            gantt_data.append({
+                "task": task.name,
+                "phase": task.phase_name,
+                "start": start_week,
+                "end": end_week,
+                "duration": end_week - start_week + 1,
+                "earliest_start_hours": task.earliest_start,
+                "earliest_finish_hours": task.earliest_finish,
+                "latest_start_hours": task.latest_start,
+                "latest_finish_hours": task.latest_finish,
+                "slack_hours": task.slack,
+                "is_critical": task.is_critical,
+                "assigned_to": task.assigned_to,
+                "priority": task.priority
+            })
+
+        return {
+            "total_duration_weeks": max(math.ceil(result.project_duration_hours / self.hours_per_week), 1),
+            "total_duration_hours": result.project_duration_hours,
+            "critical_path": result.critical_path,
+            "milestones": llm_timeline.get("milestones", []),
+            "unresolved_dependencies": result.unresolved_dependencies,
+            "gantt_data": gantt_data
+        }
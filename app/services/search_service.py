@@ -0,0 +1,181 @@
+"""
+전문 검색 서비스
+문서/회의/WBS 아이템 전문 검색 인덱스(search_index, 마이그레이션 0005)를 조회해
+순위가 매겨진 검색 결과를 반환하는 모듈
+
+- SQLite: FTS5 trigram MATCH + bm25 순위 (3글자 미만 검색어는 LIKE 조건)
+- PostgreSQL: tsvector 접두 일치(to_tsquery 'simple') + ts_rank 순위
+
+SQLite trigram 색인은 3글자 미만 부분 문자열을 찾을 수 없어, 검색어가 모두 2글자 이하
+(예: "회의", "설계")이면 색인 없이 search_index 전체를 LIKE로 스캔합니다. 이 경우 bm25 대신
+제목 포함 여부와 본문 등장 횟수로 계산한 점수로 정렬하므로 결과 순서는 결정적이지만,
+비용은 색인 행 수에 비례합니다. 3글자 이상 검색어를 함께 주면 MATCH로 후보를 먼저 줄입니다.
+"""
+import re
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+ENTITY_TYPES = ("document", "meeting", "wbs_item")
+
+# FTS5 trigram 토크나이저는 3글자 이상 부분 문자열만 색인으로 찾을 수 있음
+TRIGRAM_MIN_LENGTH = 3
+TITLE_WEIGHT = 10.0
+BODY_WEIGHT = 1.0
+SNIPPET_TOKENS = 16
+HIGHLIGHT_START = "<mark>"
+HIGHLIGHT_END = "</mark>"
+
+_TSQUERY_SPECIAL = re.compile(r"[&|!():*<>'\\]")
+
+
+def split_terms(query: str, max_terms: int = 8) -> List[str]:
+    """검색어를 공백 기준 단어로 분리 (중복 제거, 최대 max_terms개)"""
+    terms: List[str] = []
+    for term in query.split():
+        term = term.strip()
+        if term and term not in terms:
+            terms.append(term)
+    return terms[:max_terms]
+
+
+def build_fts5_query(terms: Sequence[str]) -> Tuple[Optional[str], List[str]]:
+    """FTS5 MATCH 식(3글자 이상 단어, AND)과 LIKE로 처리할 짧은 단어 분리"""
+    long_terms = [t for t in terms if len(t) >= TRIGRAM_MIN_LENGTH]
+    short_terms = [t for t in terms if len(t) < TRIGRAM_MIN_LENGTH]
+    match = " ".join('"' + t.replace('"', '""') + '"' for t in long_terms) or None
+    return match, short_terms
+
+
+def build_tsquery(terms: Sequence[str]) -> Optional[str]:
+    """to_tsquery('simple') 식 (단어별 접두 일치, AND) - 조사가 붙은 한국어 단어도 일치"""
+    cleaned = [_TSQUERY_SPECIAL.sub(" ", t).split() for t in terms]
+    parts = [f"{word}:*" for words in cleaned for word in words]
+    return " & ".join(parts) or None
+
+
+def _like_pattern(term: str) -> str:
+    escaped = term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"%{escaped}%"
+
+
+def _like_score(terms: Sequence[str], params: Dict[str, Any]) -> str:
+    """짧은 검색어 점수식: 단어별 (제목 포함 시 TITLE_WEIGHT) + (본문 등장 횟수 × BODY_WEIGHT)"""
+    parts = []
+    for i, term in enumerate(terms):
+        params[f"term_{i}"] = term.lower()
+        occurrences = (
+            f"(length(lower(coalesce(body, ''))) - length(replace(lower(coalesce(body, '')), :term_{i}, ''))) "
+            f"/ length(:term_{i})"
+        )
+        parts.append(
+            f"(CASE WHEN title LIKE :like_{i} ESCAPE '\\' THEN {TITLE_WEIGHT} ELSE 0 END "
+            f"+ {BODY_WEIGHT} * {occurrences})"
+        )
+    return " + ".join(parts)
+
+
+def _common_filters(
+    params: Dict[str, Any],
+    entity_types: Sequence[str],
+    project_id: Optional[int]
+) -> List[str]:
+    conditions = []
+    if entity_types and set(entity_types) != set(ENTITY_TYPES):
+        names = []
+        for i, entity_type in enumerate(entity_types):
+            params[f"type_{i}"] = entity_type
+            names.append(f":type_{i}")
+        conditions.append(f"entity_type IN ({', '.join(names)})")
+    if project_id is not None:
+        params["project_id"] = project_id
+        conditions.append("project_id = :project_id")
+    return conditions
+
+
+async def _search_sqlite(
+    db: AsyncSession,
+    terms: Sequence[str],
+    entity_types: Sequence[str],
+    project_id: Optional[int],
+    limit: int,
+    offset: int
+) -> List[Dict[str, Any]]:
+    match, short_terms = build_fts5_query(terms)
+    params: Dict[str, Any] = {"limit": limit, "offset": offset}
+    conditions = _common_filters(params, entity_types, project_id)
+    for i, term in enumerate(short_terms):
+        params[f"like_{i}"] = _like_pattern(term)
+        conditions.append(f"(title LIKE :like_{i} ESCAPE '\\' OR body LIKE :like_{i} ESCAPE '\\')")
+
+    if match:
+        params["match"] = match
+        conditions.insert(0, "search_index MATCH :match")
+        score = f"-bm25(search_index, 0, 0, 0, {TITLE_WEIGHT}, {BODY_WEIGHT})"
+        snippet = (
+            f"snippet(search_index, 4, '{HIGHLIGHT_START}', '{HIGHLIGHT_END}', '…', {SNIPPET_TOKENS})"
+        )
+        order = "score DESC, rowid DESC"
+    else:
+        # 짧은 검색어만 있는 경우 색인 없이 LIKE 검색 (제목 포함 여부와 본문 등장 횟수 점수 순)
+        score = _like_score(short_terms, params)
+        snippet = "substr(body, max(instr(lower(body), :term_0) - 40, 1), 200)"
+        order = "score DESC, rowid DESC"
+
+    sql = (
+        f"SELECT entity_type, entity_id, project_id, title, {snippet} AS snippet, {score} AS score "
+        f"FROM search_index WHERE {' AND '.join(conditions)} "
+        f"ORDER BY {order} LIMIT :limit OFFSET :offset"
+    )
+    result = await db.execute(text(sql), params)
+    return [dict(row._mapping) for row in result]
+
+
+async def _search_postgresql(
+    db: AsyncSession,
+    terms: Sequence[str],
+    entity_types: Sequence[str],
+    project_id: Optional[int],
+    limit: int,
+    offset: int
+) -> List[Dict[str, Any]]:
+    tsquery = build_tsquery(terms)
+    if not tsquery:
+        return []
+    params: Dict[str, Any] = {"tsquery": tsquery, "limit": limit, "offset": offset}
+    conditions = ["tsv @@ to_tsquery('simple', :tsquery)"]
+    conditions += _common_filters(params, entity_types, project_id)
+
+    # 하이라이트(ts_headline)는 비용이 크므로 현재 페이지 행에만 적용
+    sql = (
+        "SELECT page.entity_type, page.entity_id, page.project_id, page.title, "
+        "ts_headline('simple', page.body, to_tsquery('simple', :tsquery), "
+        f"'StartSel={HIGHLIGHT_START}, StopSel={HIGHLIGHT_END}, MaxWords=30, MinWords=10') AS snippet, "
+        "page.score FROM ("
+        "SELECT entity_type, entity_id, project_id, title, body, "
+        "ts_rank(tsv, to_tsquery('simple', :tsquery)) AS score "
+        f"FROM search_index WHERE {' AND '.join(conditions)} "
+        "ORDER BY score DESC, id DESC LIMIT :limit OFFSET :offset"
+        ") AS page ORDER BY page.score DESC"
+    )
+    result = await db.execute(text(sql), params)
+    return [dict(row._mapping) for row in result]
+
+
+async def search(
+    db: AsyncSession,
+    query: str,
+    entity_types: Optional[Sequence[str]] = None,
+    project_id: Optional[int] = None,
+    limit: int = 20,
+    offset: int = 0
+) -> List[Dict[str, Any]]:
+    """전문 검색 (관련도 순, 결과 행: entity_type, entity_id, project_id, title, snippet, score)"""
+    terms = split_terms(query)
+    if not terms:
+        return []
+    entity_types = list(entity_types or ENTITY_TYPES)
+    if db.bind.dialect.name == "postgresql":
+        return await _search_postgresql(db, terms, entity_types, project_id, limit, offset)
+    return await _search_sqlite(db, terms, entity_types, project_id, limit, offset)
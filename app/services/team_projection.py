@@ -0,0 +1,93 @@
+"""
+프로젝트 팀원 조회 및 응답 변환 모듈
+프로젝트 멤버십과 팀원 정보를 한 번의 조인 쿼리로 읽고
+팀원 수와 관계없이 같은 방식으로 응답 dict로 변환하는 모듈
+"""
+import json
+from functools import lru_cache
+from typing import Dict, List, Any, Optional, Tuple
+
+from sqlalchemy import Select, select
+
+from app.models.team import TeamMember, ProjectMember
+
+
+@lru_cache(maxsize=1024)
+def _parse_skills(raw: str) -> Tuple[str, ...]:
+    try:
+        skills = json.loads(raw)
+    except (TypeError, ValueError):
+        return ()
+    return tuple(skills) if isinstance(skills, list) else ()
+
+
+def parse_skills(raw: Optional[str]) -> List[str]:
+    """JSON 문자열로 저장된 skills를 리스트로 변환 (같은 문자열은 한 번만 파싱)"""
+    if not raw:
+        return []
+    return list(_parse_skills(raw))
+
+
+def project_members_query(project_id: int, active_only: bool = False) -> Select:
+    """프로젝트 멤버십과 팀원을 함께 읽는 조인 쿼리 (행: (ProjectMember, TeamMember))"""
+    query = (
+        select(ProjectMember, TeamMember)
+        .join(TeamMember, ProjectMember.team_member_id == TeamMember.id)
+        .where(ProjectMember.project_id == project_id)
+        .order_by(ProjectMember.id)
+    )
+    if active_only:
+        query = query.where(ProjectMember.is_active == True)
+    return query
+
+
+def team_member_to_dict(member: TeamMember) -> Dict[str, Any]:
+    """팀원 응답 변환"""
+    return {
+        "id": member.id,
+        "name": member.name,
+        "email": member.email,
+        "position": member.position,
+        "department": member.department,
+        "experience_years": member.experience_years,
+        "skills": parse_skills(member.skills),
+        "skill_level": member.skill_level,
+        "availability": member.availability,
+        "hourly_rate": member.hourly_rate,
+        "notes": member.notes,
+        "created_at": member.created_at,
+        "updated_at": member.updated_at
+    }
+
+
+def project_member_to_dict(membership: ProjectMember, member: TeamMember) -> Dict[str, Any]:
+    """프로젝트 멤버 응답 변환 (팀원 정보 포함)"""
+    return {
+        "id": membership.id,
+        "project_id": membership.project_id,
+        "team_member_id": membership.team_member_id,
+        "role": membership.role,
+        "responsibility": membership.responsibility,
+        "allocation_percentage": membership.allocation_percentage,
+        "start_date": membership.start_date,
+        "end_date": membership.end_date,
+        "is_active": membership.is_active,
+        "created_at": membership.created_at,
+        "team_member": team_member_to_dict(member)
+    }
+
+
+def project_team_member_to_dict(membership: ProjectMember, member: TeamMember) -> Dict[str, Any]:
+    """프로젝트 투입 팀원 요약 변환 (WBS 생성 화면용)"""
+    return {
+        "id": member.id,
+        "name": member.name,
+        "email": member.email,
+        "role": member.position,
+        "skills": parse_skills(member.skills),
+        "experience_years": member.experience_years,
+        "skill_level": member.skill_level,
+        "availability": member.availability,
+        "project_role": membership.role,
+        "allocation": membership.allocation_percentage
+    }
@@ -0,0 +1,216 @@
+"""
+문서 텍스트 추출 모듈
+업로드된 TXT/MD/DOCX/XLSX/PDF 파일을 정규화된 평문으로 변환합니다.
+DOCX/XLSX는 표준 라이브러리(zipfile, XML)로 읽고, PDF는 pypdf가 설치된 경우에만 지원합니다.
+추출은 CPU를 많이 쓰므로 별도 프로세스 풀에서 실행합니다.
+"""
+import asyncio
+import hashlib
+import multiprocessing
+import os
+import re
+import unicodedata
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional
+from xml.etree import ElementTree
+
+from config import settings
+
+WORD_NS = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+SHEET_NS = "{http://schemas.openxmlformats.org/spreadsheetml/2006/main}"
+REL_NS = "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}"
+PACKAGE_REL_NS = "{http://schemas.openxmlformats.org/package/2006/relationships}"
+
+TEXT_EXTENSIONS = {".txt", ".md", ".csv"}
+SUPPORTED_EXTENSIONS = TEXT_EXTENSIONS | {".docx", ".xlsx", ".pdf"}
+
+_CONTROL_CHARS = re.compile(r"[\x00-\x08\x0b\x0c\x0e-\x1f\x7f]")
+_INLINE_SPACES = re.compile(r"[ \u00a0\u3000]+")
+_BLANK_LINES = re.compile(r"\n{3,}")
+
+
+class UnsupportedDocumentError(Exception):
+    """텍스트를 추출할 수 없는 파일 형식"""
+    pass
+
+
+def normalize_text(text: str) -> str:
+    """유니코드 정규화(NFC), 제어 문자 제거, 공백/빈 줄 정리"""
+    text = unicodedata.normalize("NFC", text).replace("\r\n", "\n").replace("\r", "\n")
+    text = _CONTROL_CHARS.sub("", text)
+    lines = [_INLINE_SPACES.sub(" ", line).strip() for line in text.split("\n")]
+    return _BLANK_LINES.sub("\n\n", "\n".join(lines)).strip()
+
+
+def _extract_plain_text(path: str) -> str:
+    with open(path, "rb") as f:
+        raw = f.read()
+    for encoding in ("utf-8-sig", "cp949"):
+        try:
+            return raw.decode(encoding)
+        except UnicodeDecodeError:
+            continue
+    return raw.decode("utf-8", errors="replace")
+
+
+def _extract_docx(path: str) -> str:
+    """word/document.xml의 문단(w:p)을 줄 단위로 추출 (표 셀 문단 포함)"""
+    paragraphs: List[str] = []
+    with zipfile.ZipFile(path) as archive:
+        with archive.open("word/document.xml") as xml_file:
+            for _, element in ElementTree.iterparse(xml_file):
+                if element.tag != f"{WORD_NS}p":
+                    continue
+                parts = []
+                for node in element.iter():
+                    if node.tag == f"{WORD_NS}t" and node.text:
+                        parts.append(node.text)
+                    elif node.tag == f"{WORD_NS}tab":
+                        parts.append("\t")
+                    elif node.tag in (f"{WORD_NS}br", f"{WORD_NS}cr"):
+                        parts.append("\n")
+                paragraphs.append("".join(parts))
+                element.clear()
+    return "\n".join(paragraphs)
+
+
+def _xlsx_sheets(archive: zipfile.ZipFile) -> List[tuple]:
+    """(시트명, 시트 XML 경로) 목록 (통합 문서의 시트 순서)"""
+    workbook = ElementTree.fromstring(archive.read("xl/workbook.xml"))
+    rels = ElementTree.fromstring(archive.read("xl/_rels/workbook.xml.rels"))
+    targets = {
+        rel.get("Id"): rel.get("Target", "")
+        for rel in rels.iter(f"{PACKAGE_REL_NS}Relationship")
+    }
+    sheets = []
+    for sheet in workbook.iter(f"{SHEET_NS}sheet"):
+        target = targets.get(sheet.get(f"{REL_NS}id"), "")
+        target = target.lstrip("/") if target.startswith("/") else f"xl/{target}"
+        sheets.append((sheet.get("name", ""), target))
+    return sheets
+
+
+def _extract_xlsx(path: str) -> str:
+    """시트별로 행을 탭 구분 텍스트로 추출 (공유 문자열/인라인 문자열/값)"""
+    sections: List[str] = []
+    with zipfile.ZipFile(path) as archive:
+        shared_strings: List[str] = []
+        if "xl/sharedStrings.xml" in archive.namelist():
+            root = ElementTree.fromstring(archive.read("xl/sharedStrings.xml"))
+            for item in root.iter(f"{SHEET_NS}si"):
+                shared_strings.append("".join(t.text or "" for t in item.iter(f"{SHEET_NS}t")))
+
+        for name, sheet_path in _xlsx_sheets(archive):
+            if sheet_path not in archive.namelist():
+                continue
+            rows = [f"## {name}"]
+            with archive.open(sheet_path) as xml_file:
+                for _, row in ElementTree.iterparse(xml_file):
+                    if row.tag != f"{SHEET_NS}row":
+                        continue
+                    values = []
+                    for cell in row.iter(f"{SHEET_NS}c"):
+                        cell_type = cell.get("t")
+                        if cell_type == "inlineStr":
+                            values.append("".join(t.text or "" for t in cell.iter(f"{SHEET_NS}t")))
+                            continue
+                        value = cell.find(f"{SHEET_NS}v")
+                        if value is None or value.text is None:
+                            values.append("")
+                        elif cell_type == "s":
+                            values.append(shared_strings[int(value.text)])
+                        else:
+                            values.append(value.text)
+                    if any(values):
+                        rows.append("\t".join(values).rstrip("\t"))
+                    row.clear()
+            sections.append("\n".join(rows))
+    return "\n\n".join(sections)
+
+
+def _extract_pdf(path: str) -> str:
+    try:
+        from pypdf import PdfReader
+    except ImportError:
+        raise UnsupportedDocumentError("PDF 텍스트 추출에는 pypdf 패키지가 필요합니다 (pip install pypdf)")
+    reader = PdfReader(path)
+    return "\n\n".join(page.extract_text() or "" for page in reader.pages)
+
+
+EXTRACTORS = {
+    ".docx": _extract_docx,
+    ".xlsx": _extract_xlsx,
+    ".pdf": _extract_pdf,
+}
+
+
+def file_sha256(path: str, chunk_size: int = 1024 * 1024) -> str:
+    """파일 SHA-256 (청크 단위)"""
+    hasher = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            hasher.update(chunk)
+    return hasher.hexdigest()
+
+
+def extract_text(path: str, filename: Optional[str] = None) -> str:
+    """파일을 정규화된 평문으로 변환 (확장자는 filename 우선, 없으면 path 기준)"""
+    extension = os.path.splitext(filename or path)[1].lower()
+    if extension in TEXT_EXTENSIONS:
+        text = _extract_plain_text(path)
+    elif extension in EXTRACTORS:
+        try:
+            text = EXTRACTORS[extension](path)
+        except (zipfile.BadZipFile, KeyError, ElementTree.ParseError) as e:
+            raise UnsupportedDocumentError(f"{extension} 파일 구조를 읽을 수 없습니다: {e}")
+    else:
+        raise UnsupportedDocumentError(f"텍스트 추출을 지원하지 않는 형식입니다: {extension or '(확장자 없음)'}")
+    return normalize_text(text)[:settings.text_extraction_max_chars]
+
+
+def extract_file(path: str, filename: Optional[str] = None, sha256: Optional[str] = None) -> Dict[str, Optional[str]]:
+    """프로세스 풀 작업 단위: 해시(미지정 시 계산)와 추출 결과 반환 (예외 대신 error 필드)"""
+    result: Dict[str, Optional[str]] = {
+        "sha256": sha256 or file_sha256(path),
+        "extractor": os.path.splitext(filename or path)[1].lower().lstrip(".") or None,
+        "text": None,
+        "error": None
+    }
+    try:
+        result["text"] = extract_text(path, filename)
+    except UnsupportedDocumentError as e:
+        result["error"] = str(e)
+    return result
+
+
+_executor: Optional[ProcessPoolExecutor] = None
+
+
+def get_extraction_executor() -> ProcessPoolExecutor:
+    """텍스트 추출 프로세스 풀 (최초 사용 시 생성)"""
+    global _executor
+    if _executor is None:
+        _executor = ProcessPoolExecutor(
+            max_workers=settings.text_extraction_workers,
+            mp_context=multiprocessing.get_context("spawn")
+        )
+    return _executor
+
+
+def shutdown_extraction_executor() -> None:
+    """텍스트 추출 프로세스 풀 종료"""
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=False, cancel_futures=True)
+        _executor = None
+
+
+async def extract_file_in_pool(
+    path: str,
+    filename: Optional[str] = None,
+    sha256: Optional[str] = None
+) -> Dict[str, Optional[str]]:
+    """프로세스 풀에서 extract_file 실행 (이벤트 루프 비차단)"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(get_extraction_executor(), extract_file, path, filename, sha256)
@@ -0,0 +1,258 @@
+"""
+WBS 생성 작업 큐 서비스
+고도화된 WBS 생성 파이프라인을 HTTP 요청과 분리해 워커 풀에서 실행하고
+단계별(requirements, allocation, n8n) 진행 상황을 데이터베이스에 기록하는 모듈
+"""
+import asyncio
+import os
+import socket
+import uuid
+from datetime import datetime
+from typing import Dict, Any, Optional, Set
+
+from app.core.database import SessionLocal
+from app.models.job import WBSGenerationJob
+from config import settings
+
+# 파이프라인 단계
+JOB_STAGES = ("requirements", "allocation", "n8n")
+
+# inprocess 작업 소유자 식별용 (호스트, 프로세스별 임의 토큰)
+HOSTNAME = socket.gethostname()
+_PROCESS_TOKEN = uuid.uuid4().hex[:8]
+
+def _initial_stages() -> Dict[str, Dict[str, Any]]:
+    """초기 단계 상태"""
+    return {stage: {"status": "pending"} for stage in JOB_STAGES}
+
+def process_owner() -> str:
+    """현재 프로세스의 작업 소유자 값 ("호스트:PID:토큰", fork 이후에도 PID를 새로 읽음)"""
+    return f"{HOSTNAME}:{os.getpid()}:{_PROCESS_TOKEN}"
+
+def create_job(project_id: int, request_payload: Dict[str, Any]) -> WBSGenerationJob:
+    """작업 레코드 생성"""
+    db = SessionLocal()
+    try:
+        job = WBSGenerationJob(
+            id=uuid.uuid4().hex,
+            project_id=project_id,
+            status="queued",
+            backend=settings.wbs_job_backend,
+            owner=process_owner() if settings.wbs_job_backend != "celery" else None,
+            stages=_initial_stages(),
+            request_payload=request_payload
+        )
+        db.add(job)
+        db.commit()
+        db.refresh(job)
+        return job
+    finally:
+        db.close()
+
+def get_job(job_id: str) -> Optional[WBSGenerationJob]:
+    """작업 레코드 조회"""
+    db = SessionLocal()
+    try:
+        return db.query(WBSGenerationJob).filter(WBSGenerationJob.id == job_id).first()
+    finally:
+        db.close()
+
+def _update_job(job_id: str, stage: Optional[str] = None, stage_status: Optional[str] = None, **fields):
+    """작업 상태 및 단계 상태 갱신"""
+    db = SessionLocal()
+    try:
+        job = db.query(WBSGenerationJob).filter(WBSGenerationJob.id == job_id).first()
+        if not job:
+            return
+
+        if stage:
+            now = datetime.utcnow().isoformat()
+            stages = dict(job.stages or _initial_stages())
+            stage_info = dict(stages.get(stage, {}))
+            stage_info["status"] = stage_status
+            if stage_status == "running":
+                stage_info["started_at"] = now
+            else:
+                stage_info["finished_at"] = now
+            stages[stage] = stage_info
+            # JSON 컬럼은 새 객체를 할당해야 변경이 감지됨
+            job.stages = stages
+
+        for field, value in fields.items():
+            setattr(job, field, value)
+
+        db.commit()
+    finally:
+        db.close()
+
+def _owner_alive(owner: Optional[str]) -> bool:
+    """작업 소유 프로세스가 실행 중인지 (다른 호스트의 프로세스는 확인할 수 없으므로 실행 중으로 간주)"""
+    if not owner:
+        return False
+    host, pid, token = (owner.split(":") + ["", ""])[:3]
+    if host != HOSTNAME:
+        return True
+    if pid == str(os.getpid()):
+        # 같은 PID를 재사용한 이전 프로세스(컨테이너 재시작 등)는 토큰으로 구분
+        return token == _PROCESS_TOKEN
+    try:
+        os.kill(int(pid), 0)
+    except (ValueError, ProcessLookupError):
+        return False
+    except PermissionError:
+        return True
+    return True
+
+def fail_interrupted_jobs() -> int:
+    """소유 프로세스가 종료되어 중단된 프로세스 내 작업을 실패로 표시 (애플리케이션 시작 시 호출)
+
+    inprocess 작업은 제출한 API 프로세스 안에서만 실행되므로, 그 프로세스가 종료된 뒤
+    queued/running으로 남은 작업은 다시 진행되지 않습니다. 여러 워커나 순차 재시작 중
+    다른 프로세스가 실행 중인 작업은 건드리지 않으며, celery 작업은 브로커가 보관하므로 제외합니다.
+    """
+    db = SessionLocal()
+    try:
+        jobs = db.query(WBSGenerationJob).filter(
+            WBSGenerationJob.backend == "inprocess",
+            WBSGenerationJob.status.in_(("queued", "running"))
+        ).all()
+        now = datetime.utcnow()
+        interrupted = [job for job in jobs if not _owner_alive(job.owner)]
+        for job in interrupted:
+            stages = dict(job.stages or _initial_stages())
+            for stage, info in stages.items():
+                if info.get("status") == "running":
+                    stages[stage] = {**info, "status": "failed", "finished_at": now.isoformat()}
+            job.stages = stages
+            job.status = "failed"
+            job.error = "서버 재시작으로 작업이 중단되었습니다"
+            job.finished_at = now
+        db.commit()
+        return len(interrupted)
+    finally:
+        db.close()
+
+def _persist_result(project_id: int, wbs_data: Dict[str, Any], replace: bool) -> Dict[str, Any]:
+    """생성된 WBS를 WBS 아이템으로 저장 (하나의 트랜잭션)"""
+    from app.services.wbs_persistence import save_generated_wbs
+
+    db = SessionLocal()
+    try:
+        summary = save_generated_wbs(db, project_id, wbs_data, replace)
+        db.commit()
+        return summary
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+async def run_job(job_id: str):
+    """작업 실행 (워커에서 호출)"""
+    from app.services.enhanced_wbs_service import EnhancedWBSService
+
+    job = await asyncio.to_thread(get_job, job_id)
+    if not job:
+        return
+
+    payload = job.request_payload or {}
+    await asyncio.to_thread(
+        _update_job, job_id, status="running", started_at=datetime.utcnow()
+    )
+
+    async def on_progress(stage: str, status: str):
+        await asyncio.to_thread(_update_job, job_id, stage, status)
+
+    try:
+        service = EnhancedWBSService()
+        result = await service.generate_enhanced_wbs(
+            project_id=payload.get("project_id"),
+            proposal_content=payload.get("proposal_content", ""),
+            rfp_content=payload.get("rfp_content", ""),
+            project_goals=payload.get("project_goals", ""),
+            team_members=payload.get("team_members", []),
+            additional_files=payload.get("additional_files"),
+            progress=on_progress,
+            assignment_mode=payload.get("assignment_mode", "llm")
+        )
+        failed = result.get("status") == "failed"
+        # 잘린 응답에서 일부만 복구한 결과(partial)는 저장하지 않음
+        if payload.get("persist") and result.get("status") == "success":
+            result["persisted_items"] = await asyncio.to_thread(
+                _persist_result,
+                payload.get("project_id"),
+                result["wbs_data"],
+                payload.get("replace_existing", False)
+            )
+        await asyncio.to_thread(
+            _update_job,
+            job_id,
+            status="failed" if failed else "completed",
+            result=result,
+            error=result.get("error") if failed else None,
+            finished_at=datetime.utcnow()
+        )
+    except Exception as e:
+        await asyncio.to_thread(
+            _update_job,
+            job_id,
+            status="failed",
+            error=str(e),
+            finished_at=datetime.utcnow()
+        )
+
+class InProcessJobRunner:
+    """단일 노드용 프로세스 내 작업 실행기
+
+    HTTP 요청 처리와 별도로 동시 실행 작업 수를 세마포어로 제한합니다.
+    """
+
+    def __init__(self, max_concurrency: int):
+        self.max_concurrency = max_concurrency
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._tasks: Set[asyncio.Task] = set()
+
+    def submit(self, job_id: str):
+        """작업 제출 (즉시 반환)"""
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        task = asyncio.create_task(self._run(job_id))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, job_id: str):
+        async with self._semaphore:
+            await run_job(job_id)
+
+    @property
+    def active_jobs(self) -> int:
+        """대기 중이거나 실행 중인 작업 수"""
+        return len(self._tasks)
+
+# 전역 프로세스 내 실행기
+inprocess_runner = InProcessJobRunner(settings.wbs_job_max_concurrency)
+
+def submit_job(job_id: str):
+    """설정된 백엔드(inprocess/celery)로 작업 제출"""
+    if settings.wbs_job_backend == "celery":
+        from app.core.celery_app import run_wbs_generation_job
+        run_wbs_generation_job.delay(job_id)
+    else:
+        inprocess_runner.submit(job_id)
+
+def serialize_job(job: WBSGenerationJob, include_result: bool = False) -> Dict[str, Any]:
+    """작업 상태 응답 변환"""
+    data = {
+        "job_id": job.id,
+        "project_id": job.project_id,
+        "status": job.status,
+        "backend": job.backend,
+        "stages": job.stages or {},
+        "error": job.error,
+        "created_at": job.created_at.isoformat() if job.created_at else None,
+        "started_at": job.started_at.isoformat() if job.started_at else None,
+        "finished_at": job.finished_at.isoformat() if job.finished_at else None
+    }
+    if include_result:
+        data["result"] = job.result
+    return data
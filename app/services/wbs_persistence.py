@@ -0,0 +1,249 @@
+"""
+WBS 일괄 저장 서비스
+생성된 WBS(project_phases/tasks)와 일괄 생성/수정 요청을 wbs_items 테이블에 저장하는 모듈
+
+새 아이템은 트리 깊이별로 한 번씩 INSERT ... RETURNING(executemany)으로 저장하고,
+요청 안에서 참조하는 부모(parent_client_id)의 ID와 경로는 프로세스 안에서 해결합니다.
+커밋은 호출자가 하므로 전체 저장이 하나의 트랜잭션으로 처리됩니다.
+동기 Session 기준 함수이며, 비동기 엔드포인트에서는 AsyncSession.run_sync로 호출합니다.
+"""
+import json
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import delete, insert, select, update
+from sqlalchemy.orm import Session
+
+from app.models.project import Project, WBSItem
+from app.services.wbs_tree import ROOT_PATH, WBSTreeError, join_path, path_level
+
+# 생성/수정 요청에서 그대로 저장하는 필드
+ITEM_FIELDS = ("title", "description", "order", "estimated_hours", "assigned_to", "skill_level_required", "status")
+ID_CHUNK_SIZE = 5000
+# 수정 요청에서 null로 바꿀 수 없는 필드 (NOT NULL 컬럼과 상태값)
+REQUIRED_FIELDS = ("title", "status")
+
+
+def _load_items(session: Session, ids: Iterable[int]) -> Dict[int, Tuple[int, str, int]]:
+    """ID별 (project_id, path, level)"""
+    ids = list(ids)
+    found: Dict[int, Tuple[int, str, int]] = {}
+    for start in range(0, len(ids), ID_CHUNK_SIZE):
+        rows = session.execute(
+            select(WBSItem.id, WBSItem.project_id, WBSItem.path, WBSItem.level)
+            .where(WBSItem.id.in_(ids[start:start + ID_CHUNK_SIZE]))
+        ).all()
+        found.update({row.id: (row.project_id, row.path, row.level) for row in rows})
+    return found
+
+
+def _check_projects(session: Session, project_ids: Iterable[int]) -> None:
+    """요청한 프로젝트가 모두 존재하는지 확인 (없으면 WBSTreeError)"""
+    project_ids = set(project_ids)
+    if not project_ids:
+        return
+    found = set(session.execute(select(Project.id).where(Project.id.in_(project_ids))).scalars())
+    missing = sorted(project_ids - found)
+    if missing:
+        raise WBSTreeError(f"프로젝트를 찾을 수 없습니다: {missing[:10]}")
+
+
+def _insert_returning_ids(session: Session, rows: List[Dict[str, Any]]) -> List[int]:
+    """행을 배치 INSERT하고 입력 순서대로 생성된 ID 반환"""
+    table = WBSItem.__table__
+    if session.get_bind().dialect.name == "sqlite":
+        # SQLite는 sort_by_parameter_order 지정 시 행마다 INSERT를 실행하므로 배치로 실행하고,
+        # 트랜잭션 안에서 INTEGER PRIMARY KEY가 VALUES 순서대로 증가하는 점을 이용해 ID를 정렬
+        return sorted(session.execute(insert(table).returning(table.c.id), rows).scalars())
+    return session.execute(
+        insert(table).returning(table.c.id, sort_by_parameter_order=True), rows
+    ).scalars().all()
+
+
+def _client_depths(items: List[Dict[str, Any]]) -> Tuple[List[int], Dict[str, int]]:
+    """요청 안의 부모 참조(parent_client_id) 기준 깊이와 client_id별 위치"""
+    index_by_client: Dict[str, int] = {}
+    for index, item in enumerate(items):
+        client_id = item.get("client_id")
+        if client_id is None:
+            continue
+        if client_id in index_by_client:
+            raise WBSTreeError(f"중복된 client_id입니다: {client_id}")
+        index_by_client[client_id] = index
+
+    depths: List[Optional[int]] = [None] * len(items)
+    for index in range(len(items)):
+        chain: List[int] = []
+        visiting = set()
+        current = index
+        while depths[current] is None:
+            if current in visiting:
+                raise WBSTreeError("parent_client_id 참조에 순환이 있습니다")
+            visiting.add(current)
+            chain.append(current)
+            parent_client_id = items[current].get("parent_client_id")
+            if parent_client_id is None:
+                depths[chain.pop()] = 0
+                break
+            if parent_client_id not in index_by_client:
+                raise WBSTreeError(f"요청에 없는 parent_client_id입니다: {parent_client_id}")
+            current = index_by_client[parent_client_id]
+        depth = depths[current]
+        for node in reversed(chain):
+            depth += 1
+            depths[node] = depth
+    return depths, index_by_client
+
+
+def bulk_create_items(session: Session, items: List[Dict[str, Any]]) -> List[int]:
+    """WBS 아이템 일괄 생성 (입력 순서대로 생성된 ID 반환)
+
+    각 아이템의 부모는 기존 아이템 ID(parent_id) 또는 같은 요청 안의 client_id(parent_client_id)로 지정합니다.
+    경로는 부모로부터, 레벨은 경로로부터 계산하며(요청의 level은 무시)
+    트리 깊이마다 INSERT 문 하나(배치)를 실행합니다.
+    """
+    if not items:
+        return []
+    depths, index_by_client = _client_depths(items)
+    _check_projects(session, {item["project_id"] for item in items if item.get("project_id") is not None})
+    existing = _load_items(
+        session, {item["parent_id"] for item in items if item.get("parent_id") is not None}
+    )
+
+    layers: List[List[int]] = [[] for _ in range(max(depths) + 1)]
+    for index, depth in enumerate(depths):
+        layers[depth].append(index)
+
+    ids: List[Optional[int]] = [None] * len(items)
+    placed: Dict[int, Tuple[int, str, int]] = {}
+    for layer in layers:
+        rows = []
+        for index in layer:
+            item = items[index]
+            parent_id = item.get("parent_id")
+            parent = None
+            if item.get("parent_client_id") is not None:
+                if parent_id is not None:
+                    raise WBSTreeError("parent_id와 parent_client_id는 함께 지정할 수 없습니다")
+                parent_index = index_by_client[item["parent_client_id"]]
+                parent_id = ids[parent_index]
+                parent = placed[parent_index]
+            elif parent_id is not None:
+                parent = existing.get(parent_id)
+                if parent is None:
+                    raise WBSTreeError(f"상위 WBS 아이템을 찾을 수 없습니다: {parent_id}")
+
+            project_id = item.get("project_id") or (parent[0] if parent else None)
+            if project_id is None:
+                raise WBSTreeError("project_id가 필요합니다")
+            if parent is not None and parent[0] != project_id:
+                raise WBSTreeError("상위 WBS 아이템이 다른 프로젝트에 속해 있습니다")
+            if not item.get("title"):
+                raise WBSTreeError("title이 필요합니다")
+
+            row = {field: item.get(field) for field in ITEM_FIELDS}
+            row["order"] = row["order"] or 0
+            row["status"] = row["status"] or "pending"
+            path = join_path(parent[1], parent_id) if parent else ROOT_PATH
+            # 레벨은 요청 값과 무관하게 경로에서 계산
+            row.update(project_id=project_id, parent_id=parent_id, path=path, level=path_level(path))
+            rows.append(row)
+
+        new_ids = _insert_returning_ids(session, rows)
+        for index, new_id, row in zip(layer, new_ids, rows):
+            ids[index] = new_id
+            placed[index] = (row["project_id"], row["path"], row["level"])
+    return ids
+
+
+def bulk_update_items(session: Session, items: List[Dict[str, Any]]) -> int:
+    """WBS 아이템 일괄 수정 (기본 키 기준 배치 UPDATE, 트리 이동은 move_subtree 사용)"""
+    if not items:
+        return 0
+    found = _load_items(session, {item["id"] for item in items})
+    missing = sorted({item["id"] for item in items} - found.keys())
+    if missing:
+        raise WBSTreeError(f"WBS 아이템을 찾을 수 없습니다: {missing[:10]}")
+
+    rows = []
+    for item in items:
+        for field in REQUIRED_FIELDS:
+            if field in item and not item[field]:
+                raise WBSTreeError(f"{field} 값은 비워둘 수 없습니다 (id={item['id']})")
+        values = {field: item[field] for field in ITEM_FIELDS if field in item}
+        if values:
+            rows.append({"id": item["id"], **values})
+    if rows:
+        session.execute(update(WBSItem), rows)
+    return len(items)
+
+
+def _to_hours(value: Any) -> Optional[int]:
+    try:
+        return int(round(float(value)))
+    except (TypeError, ValueError):
+        return None
+
+
+def _text(value: Any) -> Optional[str]:
+    """LLM이 생성한 값을 텍스트로 변환 (객체/배열은 JSON 문자열)"""
+    if value is None or value == "":
+        return None
+    if isinstance(value, (dict, list)):
+        return json.dumps(value, ensure_ascii=False)
+    return str(value)
+
+
+def _truncate(value: Any, length: int) -> Optional[str]:
+    text = _text(value)
+    return text[:length] if text else None
+
+
+def items_from_generated_wbs(project_id: int, wbs_data: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """생성된 WBS의 단계를 레벨 1 아이템으로, Task를 그 하위 아이템으로 변환 (순서 유지)"""
+    items: List[Dict[str, Any]] = []
+    for phase_index, phase in enumerate(wbs_data.get("project_phases") or []):
+        phase_client_id = f"phase-{phase_index}"
+        items.append({
+            "client_id": phase_client_id,
+            "project_id": project_id,
+            "title": _truncate(phase.get("phase_name"), 255) or f"단계 {phase_index + 1}",
+            "description": _text(phase.get("description")),
+            "order": phase_index,
+        })
+        for task_index, task in enumerate(phase.get("tasks") or []):
+            skill_level = _truncate(task.get("skill_level_required"), 50)
+            items.append({
+                "parent_client_id": phase_client_id,
+                "project_id": project_id,
+                "title": _truncate(task.get("task_name"), 255) or f"작업 {task_index + 1}",
+                "description": _text(task.get("description")),
+                "order": task_index,
+                "estimated_hours": _to_hours(task.get("estimated_hours")),
+                "assigned_to": _truncate(task.get("assigned_to"), 100),
+                "skill_level_required": skill_level.lower() if skill_level else None,
+            })
+    return items
+
+
+def save_generated_wbs(
+    session: Session,
+    project_id: int,
+    wbs_data: Dict[str, Any],
+    replace: bool = False
+) -> Dict[str, Any]:
+    """생성된 WBS를 wbs_items에 저장 (replace이면 프로젝트의 기존 아이템을 먼저 삭제, 커밋은 호출자)"""
+    deleted = 0
+    if replace:
+        deleted = session.execute(
+            delete(WBSItem).where(WBSItem.project_id == project_id)
+        ).rowcount
+    items = items_from_generated_wbs(project_id, wbs_data)
+    ids = bulk_create_items(session, items)
+    phase_ids = [item_id for item, item_id in zip(items, ids) if item.get("client_id")]
+    return {
+        "project_id": project_id,
+        "phase_item_ids": phase_ids,
+        "phase_count": len(phase_ids),
+        "task_count": len(ids) - len(phase_ids),
+        "deleted": deleted,
+    }
@@ -0,0 +1,177 @@
+"""
+WBS 트리 서비스
+WBSItem.path(조상 ID 경로, 마이그레이션 0006)를 이용해 하위 트리, 조상, 집계를
+깊이와 무관하게 쿼리 한 번으로 조회하고 이동/삭제 시 경로를 함께 갱신하는 모듈
+
+경로는 자기 자신을 제외한 조상 ID를 "/"로 이어 붙인 문자열입니다 (루트는 "/", 예: "/1/5/").
+아이템 X의 자손은 path가 X.path + "X/"로 시작하는 행이며, LIKE 대신 바이너리 비교 범위
+[접두, 접두의 마지막 "/"를 "0"으로 바꾼 값)로 조회해 path 인덱스를 그대로 사용합니다.
+"""
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import and_, delete, func, literal, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.project import WBSItem
+
+ROOT_PATH = "/"
+MAX_PATH_LENGTH = 500
+
+# 하위 트리 조회 컬럼 (수만 건을 ORM 객체로 만드는 비용을 피하기 위해 컬럼만 조회)
+TREE_COLUMNS = (
+    WBSItem.id, WBSItem.project_id, WBSItem.parent_id, WBSItem.path, WBSItem.title,
+    WBSItem.description, WBSItem.level, WBSItem.order, WBSItem.estimated_hours,
+    WBSItem.assigned_to, WBSItem.skill_level_required, WBSItem.status,
+)
+
+
+class WBSTreeError(Exception):
+    """잘못된 트리 조작 (순환 이동, 다른 프로젝트로 이동 등)"""
+    pass
+
+
+def join_path(parent_path: str, parent_id: int) -> str:
+    """부모 경로와 부모 ID로 자식 경로 생성"""
+    path = f"{parent_path}{parent_id}/"
+    if len(path) > MAX_PATH_LENGTH:
+        raise WBSTreeError("WBS 트리 깊이가 허용 범위를 초과했습니다")
+    return path
+
+
+def child_path(parent: Optional[WBSItem]) -> str:
+    """parent 아래에 추가될 아이템의 경로"""
+    if parent is None:
+        return ROOT_PATH
+    return join_path(parent.path, parent.id)
+
+
+def path_level(path: str) -> int:
+    """경로로 정해지는 레벨 (루트 1, 조상 수 + 1)"""
+    return path.count("/")
+
+
+def ancestor_ids(path: str) -> List[int]:
+    """경로의 조상 ID 목록 (루트부터)"""
+    return [int(part) for part in path.strip("/").split("/") if part]
+
+
+def descendants_condition(item: WBSItem):
+    """item의 자손(자기 자신 제외) 조건"""
+    prefix = child_path(item)
+    # "/"(0x2F) 다음 문자는 "0"(0x30)이므로 접두로 시작하는 모든 경로가 이 범위에 포함됨
+    return and_(WBSItem.path >= prefix, WBSItem.path < prefix[:-1] + "0")
+
+
+def subtree_condition(item: WBSItem):
+    """item과 그 자손 조건"""
+    return or_(WBSItem.id == item.id, descendants_condition(item))
+
+
+async def get_subtree(
+    db: AsyncSession,
+    item: WBSItem,
+    max_depth: Optional[int] = None
+) -> List[Dict[str, Any]]:
+    """item을 루트로 하는 하위 트리 행 목록 (경로, 순서 기준 정렬, max_depth는 item 기준 상대 깊이)"""
+    query = select(*TREE_COLUMNS).where(subtree_condition(item))
+    if max_depth is not None:
+        query = query.where(WBSItem.level <= item.level + max_depth)
+    query = query.order_by(WBSItem.path, WBSItem.order, WBSItem.id)
+    return [dict(row) for row in (await db.execute(query)).mappings()]
+
+
+async def get_ancestors(db: AsyncSession, item: WBSItem) -> List[WBSItem]:
+    """item의 조상 목록 (루트부터 부모까지)"""
+    ids = ancestor_ids(item.path)
+    if not ids:
+        return []
+    rows = (await db.execute(select(WBSItem).where(WBSItem.id.in_(ids)))).scalars().all()
+    by_id = {row.id: row for row in rows}
+    return [by_id[i] for i in ids if i in by_id]
+
+
+async def get_rollup(db: AsyncSession, project_id: int, item: Optional[WBSItem] = None) -> Dict[str, Any]:
+    """하위 트리(item이 없으면 프로젝트 전체)의 아이템 수, 예상 공수 합계, 상태별 집계"""
+    query = (
+        select(
+            WBSItem.status,
+            func.count(WBSItem.id),
+            func.coalesce(func.sum(WBSItem.estimated_hours), 0),
+        )
+        .group_by(WBSItem.status)
+    )
+    # 하위 트리 집계는 project_id 인덱스 대신 path 범위 인덱스를 타도록 조건을 하나만 사용
+    if item is not None:
+        query = query.where(subtree_condition(item))
+    else:
+        query = query.where(WBSItem.project_id == project_id)
+
+    status_counts: Dict[str, int] = {}
+    status_hours: Dict[str, int] = {}
+    total_items = total_hours = 0
+    for status, count, hours in (await db.execute(query)).all():
+        key = status or "unknown"
+        status_counts[key] = status_counts.get(key, 0) + count
+        status_hours[key] = status_hours.get(key, 0) + int(hours)
+        total_items += count
+        total_hours += int(hours)
+
+    completed_hours = status_hours.get("completed", 0)
+    return {
+        "project_id": project_id,
+        "item_id": item.id if item is not None else None,
+        "item_count": total_items,
+        "estimated_hours": total_hours,
+        "completed_hours": completed_hours,
+        "progress": round(completed_hours / total_hours, 4) if total_hours else 0.0,
+        "status_counts": status_counts,
+        "status_hours": status_hours,
+    }
+
+
+async def move_subtree(
+    db: AsyncSession,
+    item: WBSItem,
+    new_parent: Optional[WBSItem],
+    order: Optional[int] = None
+) -> WBSItem:
+    """item과 자손을 new_parent 아래로 이동 (new_parent가 없으면 루트로, 커밋은 호출자)"""
+    if new_parent is not None:
+        if new_parent.project_id != item.project_id:
+            raise WBSTreeError("다른 프로젝트의 WBS 아이템 아래로 이동할 수 없습니다")
+        if new_parent.id == item.id or item.id in ancestor_ids(new_parent.path):
+            raise WBSTreeError("자기 자신 또는 하위 아이템 아래로 이동할 수 없습니다")
+
+    old_prefix = child_path(item)
+    new_path = child_path(new_parent)
+    new_level = path_level(new_path)
+    level_delta = new_level - item.level
+
+    if new_path != item.path or level_delta:
+        new_prefix = f"{new_path}{item.id}/"
+        # 자손 경로의 앞부분만 교체 (쿼리 한 번, 자손 수와 무관)
+        await db.execute(
+            update(WBSItem)
+            .where(descendants_condition(item))
+            .values(
+                path=literal(new_prefix) + func.substr(WBSItem.path, len(old_prefix) + 1),
+                level=WBSItem.level + level_delta,
+            )
+            .execution_options(synchronize_session=False)
+        )
+
+    item.parent_id = new_parent.id if new_parent is not None else None
+    item.path = new_path
+    item.level = new_level
+    if order is not None:
+        item.order = order
+    await db.flush()
+    return item
+
+
+async def delete_subtree(db: AsyncSession, item: WBSItem) -> int:
+    """item과 모든 자손 삭제 (삭제된 행 수 반환, 커밋은 호출자)"""
+    result = await db.execute(
+        delete(WBSItem).where(subtree_condition(item)).execution_options(synchronize_session=False)
+    )
+    return result.rowcount
@@ -0,0 +1,117 @@
+"""
+팀 작업량 집계 모듈
+WBS 작업 목록을 한 번만 순회하여 팀원별 작업 시간, 작업 수, 작업 목록,
+미할당 작업 수와 활용률을 계산하는 모듈
+"""
+from dataclasses import dataclass, field
+from typing import Dict, List, Any, Optional
+
+
+@dataclass
+class MemberWorkload:
+    """팀원별 작업량"""
+    name: str
+    role: str = ""
+    task_count: int = 0
+    total_hours: float = 0
+    tasks: List[Dict[str, Any]] = field(default_factory=list)
+
+
+@dataclass
+class WorkloadSummary:
+    """작업량 집계 결과"""
+    members: Dict[str, MemberWorkload]  # 첫 할당 순서 유지
+    total_tasks: int = 0
+    unassigned_tasks: int = 0
+    total_hours: float = 0
+
+    def get(self, name: str) -> Optional[MemberWorkload]:
+        """팀원 작업량 조회 (할당된 작업이 없으면 None)"""
+        return self.members.get(name)
+
+    def to_assignments(self, include_hours: bool = True) -> List[Dict[str, Any]]:
+        """팀 할당 정보 응답 형식으로 변환"""
+        assignments = []
+        for workload in self.members.values():
+            assignment = {
+                "name": workload.name,
+                "role": workload.role,
+                "task_count": workload.task_count
+            }
+            if include_hours:
+                assignment["total_hours"] = workload.total_hours
+                assignment["tasks"] = workload.tasks
+            else:
+                assignment["tasks"] = [
+                    {"name": task["name"], "priority": task["priority"]}
+                    for task in workload.tasks
+                ]
+            assignments.append(assignment)
+        return assignments
+
+
+def _task_hours(task: Dict[str, Any]) -> float:
+    """작업 예상 시간 (숫자가 아니면 0)"""
+    hours = task.get("estimated_hours", 0) or 0
+    if isinstance(hours, (int, float)):
+        return hours
+    try:
+        return float(hours)
+    except (TypeError, ValueError):
+        return 0
+
+
+def aggregate_workload(
+    wbs_data: Dict[str, Any],
+    group_key: str = "project_phases",
+    role_key: str = "skill_level_required"
+) -> WorkloadSummary:
+    """WBS 작업을 한 번 순회하여 팀원별 작업량 집계
+
+    group_key는 작업을 담은 상위 목록(project_phases 또는 deliverables),
+    role_key는 팀원의 첫 작업에서 역할로 사용할 필드입니다.
+    """
+    summary = WorkloadSummary(members={})
+    members = summary.members
+
+    for group in wbs_data.get(group_key, []) or []:
+        for task in group.get("tasks", []) or []:
+            hours = _task_hours(task)
+            summary.total_tasks += 1
+            summary.total_hours += hours
+
+            assigned_to = task.get("assigned_to", "")
+            if not assigned_to:
+                summary.unassigned_tasks += 1
+                continue
+
+            workload = members.get(assigned_to)
+            if workload is None:
+                workload = MemberWorkload(name=assigned_to, role=task.get(role_key, ""))
+                members[assigned_to] = workload
+
+            workload.task_count += 1
+            workload.total_hours += hours
+            workload.tasks.append({
+                "name": task.get("task_name", ""),
+                "priority": task.get("priority", "Medium"),
+                "hours": hours
+            })
+
+    return summary
+
+
+def utilization_rate(
+    total_hours: float,
+    duration_weeks: float,
+    allocation_percentage: float = 100,
+    availability: bool = True,
+    hours_per_week: float = 40
+) -> str:
+    """프로젝트 기간 중 할당 비율 기준 가용 시간 대비 활용률 문자열"""
+    if total_hours <= 0:
+        return "0%"
+    available_hours = duration_weeks * hours_per_week * allocation_percentage / 100
+    if not availability or available_hours <= 0:
+        return "N/A"
+    return f"{total_hours / available_hours * 100:.1f}%"
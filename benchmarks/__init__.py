@@ -0,0 +1,3 @@
+"""
+Tasktory 부하 테스트 / 벤치마크 도구
+"""
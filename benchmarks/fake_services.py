@@ -0,0 +1,224 @@
+"""
+벤치마크용 가짜 외부 서비스
+OpenAI ChatCompletion API와 n8n 워크플로우 실행 API를 흉내 내는 로컬 HTTP 서버를
+같은 프로세스의 백그라운드 스레드에서 실행합니다.
+응답 지연 시간과 응답 크기(단계/작업 수, 패딩 바이트)를 설정할 수 있습니다.
+"""
+import asyncio
+import json
+import socket
+import threading
+import time
+import uuid
+from dataclasses import dataclass
+from typing import Any, Dict, List
+
+import uvicorn
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, StreamingResponse
+
+
+@dataclass
+class FakeOpenAIConfig:
+    """가짜 OpenAI 응답 설정"""
+    latency_ms: float = 200.0  # 첫 응답(스트리밍은 첫 청크)까지 지연
+    stream_chunks: int = 20  # 스트리밍 응답 청크 수
+    stream_chunk_delay_ms: float = 5.0
+    requirements: int = 8  # 요구사항 분석 응답의 요구사항 수 (종류별)
+    phases: int = 4  # Task 분배 응답의 단계 수
+    tasks_per_phase: int = 6
+    padding_bytes: int = 0  # 작업 설명에 덧붙일 패딩 크기
+
+
+@dataclass
+class FakeN8nConfig:
+    """가짜 n8n 응답 설정"""
+    latency_ms: float = 50.0
+    payload_bytes: int = 1024
+
+
+def requirement_analysis_payload(config: FakeOpenAIConfig) -> Dict[str, Any]:
+    """요구사항 분석 응답 JSON"""
+    count = config.requirements
+    return {
+        "project_overview": "벤치마크 프로젝트",
+        "business_requirements": [
+            {"requirement": f"비즈니스 요구사항 {i}", "priority": "High", "complexity": "Medium"}
+            for i in range(count)
+        ],
+        "technical_requirements": [
+            {
+                "requirement": f"기술 요구사항 {i}",
+                "category": "Backend",
+                "complexity": "Medium",
+                "estimated_effort": "M"
+            }
+            for i in range(count)
+        ],
+        "functional_requirements": [
+            {"feature": f"기능 {i}", "description": "설명", "priority": "Medium", "dependencies": []}
+            for i in range(count)
+        ],
+        "non_functional_requirements": [],
+        "technical_stack_suggestions": [],
+        "project_complexity": "Medium",
+        "estimated_duration_weeks": 12,
+        "risk_factors": []
+    }
+
+
+def task_allocation_payload(config: FakeOpenAIConfig) -> Dict[str, Any]:
+    """Task 분배 응답 JSON"""
+    padding = "x" * config.padding_bytes
+    phases = []
+    for p in range(config.phases):
+        tasks = [
+            {
+                "task_name": f"작업 {p}-{t}",
+                "description": f"작업 설명 {p}-{t} {padding}",
+                "required_skills": ["python"],
+                "skill_level_required": "Mid",
+                "estimated_hours": 40,
+                "priority": "Medium",
+                "assigned_to": f"팀원{t % 3}",
+                "assignment_reason": "기술 일치",
+                "dependencies": [f"작업 {p}-{t - 1}"] if t else [],
+                "deliverables": ["코드"],
+                "start_week": p * 2 + 1,
+                "end_week": p * 2 + 2
+            }
+            for t in range(config.tasks_per_phase)
+        ]
+        phases.append({
+            "phase_name": f"단계 {p}",
+            "description": "단계 설명",
+            "duration_weeks": 2,
+            "tasks": tasks
+        })
+    return {"project_phases": phases, "team_workload": [], "project_timeline": {"milestones": []}}
+
+
+def create_fake_openai_app(config: FakeOpenAIConfig) -> FastAPI:
+    """POST /v1/chat/completions (일반/스트리밍) 가짜 서버"""
+    app = FastAPI()
+    app.state.requests = 0
+
+    @app.post("/v1/chat/completions")
+    async def chat_completions(request: Request):
+        body = await request.json()
+        app.state.requests += 1
+        prompt = body["messages"][-1]["content"]
+        if "project_phases" in prompt:
+            payload = task_allocation_payload(config)
+        else:
+            payload = requirement_analysis_payload(config)
+        content = json.dumps(payload, ensure_ascii=False)
+        completion_id = f"chatcmpl-{uuid.uuid4().hex[:12]}"
+        created = int(time.time())
+        model = body.get("model", "gpt-4")
+
+        await asyncio.sleep(config.latency_ms / 1000)
+
+        if not body.get("stream"):
+            return JSONResponse({
+                "id": completion_id,
+                "object": "chat.completion",
+                "created": created,
+                "model": model,
+                "choices": [{
+                    "index": 0,
+                    "message": {"role": "assistant", "content": content},
+                    "finish_reason": "stop"
+                }],
+                "usage": {
+                    "prompt_tokens": len(prompt) // 4,
+                    "completion_tokens": len(content) // 4,
+                    "total_tokens": (len(prompt) + len(content)) // 4
+                }
+            })
+
+        async def events():
+            size = max(1, -(-len(content) // max(config.stream_chunks, 1)))
+            for start in range(0, len(content), size):
+                chunk = {
+                    "id": completion_id,
+                    "object": "chat.completion.chunk",
+                    "created": created,
+                    "model": model,
+                    "choices": [{"index": 0, "delta": {"content": content[start:start + size]}, "finish_reason": None}]
+                }
+                yield f"data: {json.dumps(chunk, ensure_ascii=False)}\n\n"
+                if config.stream_chunk_delay_ms:
+                    await asyncio.sleep(config.stream_chunk_delay_ms / 1000)
+            yield "data: [DONE]\n\n"
+
+        return StreamingResponse(events(), media_type="text/event-stream")
+
+    return app
+
+
+def create_fake_n8n_app(config: FakeN8nConfig) -> FastAPI:
+    """POST /api/v1/workflows/{workflow_id}/execute 가짜 서버"""
+    app = FastAPI()
+    app.state.requests = 0
+
+    @app.post("/api/v1/workflows/{workflow_id}/execute")
+    async def execute_workflow(workflow_id: str, request: Request):
+        await request.body()
+        app.state.requests += 1
+        await asyncio.sleep(config.latency_ms / 1000)
+        return {
+            "status": "success",
+            "workflow_id": workflow_id,
+            "execution_id": uuid.uuid4().hex,
+            "data": "x" * config.payload_bytes
+        }
+
+    return app
+
+
+def _free_port() -> int:
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+class FakeServer:
+    """백그라운드 스레드에서 실행되는 uvicorn 서버"""
+
+    def __init__(self, app: FastAPI):
+        self.app = app
+        self.port = _free_port()
+        self._server = uvicorn.Server(uvicorn.Config(
+            app, host="127.0.0.1", port=self.port, log_level="warning", access_log=False
+        ))
+        self._thread = threading.Thread(target=self._server.run, daemon=True)
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.port}"
+
+    @property
+    def requests(self) -> int:
+        return self.app.state.requests
+
+    def start(self, timeout: float = 10.0) -> "FakeServer":
+        self._thread.start()
+        deadline = time.monotonic() + timeout
+        while not self._server.started:
+            if time.monotonic() > deadline or not self._thread.is_alive():
+                raise RuntimeError(f"가짜 서버 시작 실패 (port {self.port})")
+            time.sleep(0.01)
+        return self
+
+    def stop(self):
+        self._server.should_exit = True
+        self._thread.join(timeout=5)
+
+
+def start_fake_services(openai_config: FakeOpenAIConfig, n8n_config: FakeN8nConfig) -> List[FakeServer]:
+    """가짜 OpenAI, n8n 서버 시작 ([openai, n8n])"""
+    return [
+        FakeServer(create_fake_openai_app(openai_config)).start(),
+        FakeServer(create_fake_n8n_app(n8n_config)).start(),
+    ]
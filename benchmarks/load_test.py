@@ -0,0 +1,436 @@
+#!/usr/bin/env python3
+"""
+Tasktory API 부하 테스트 / 벤치마크
+가짜 OpenAI, n8n 서버를 같은 프로세스에서 띄우고 임시 SQLite 데이터베이스로 FastAPI 앱을
+동시 요청 부하로 호출해 엔드포인트별 p50/p95/p99 지연 시간, 처리량, 요청당 SQL 문 수,
+최대 RSS를 측정합니다. 저장된 기준값(baselines.json)보다 허용 범위 이상 느려지면 실패(종료 코드 1)합니다.
+
+실행:
+    python benchmarks/load_test.py
+    python benchmarks/load_test.py --scenarios projects_list,search --concurrency 32
+    python benchmarks/load_test.py --update-baseline   # 현재 결과를 기준값으로 저장
+
+측정값은 실행 환경에 따라 달라지므로 기준값은 같은 환경(CI 러너 등)에서 갱신해야 합니다.
+요청당 SQL 문 수는 환경과 무관하므로 기준값보다 늘어나면 항상 실패합니다.
+기준값 파일에는 실행 설정(요청 수, 동시성, 데이터 크기, 가짜 서버 지연 등)도 함께 저장되며,
+설정이 다르면 수치를 비교하지 않습니다 (다른 설정의 기준값은 --baseline으로 별도 파일에 저장).
+"""
+import argparse
+import asyncio
+import json
+import os
+import resource
+import sys
+import tempfile
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+ROOT_DIR = Path(__file__).resolve().parent.parent
+sys.path.append(str(ROOT_DIR))
+
+from benchmarks.fake_services import FakeN8nConfig, FakeOpenAIConfig, start_fake_services
+
+DEFAULT_BASELINE_PATH = Path(__file__).resolve().parent / "baselines.json"
+# 측정값에 영향을 주므로 기준값과 같아야 비교하는 실행 설정 (argparse 속성명)
+RUN_CONFIG_KEYS = (
+    "requests", "concurrency", "warmup", "projects", "members", "wbs_items", "documents",
+    "openai_latency_ms", "openai_phases", "openai_tasks_per_phase", "openai_padding_bytes",
+    "n8n_latency_ms", "n8n_payload_bytes",
+)
+SEARCH_TERM = "데이터베이스"
+
+
+@dataclass
+class Scenario:
+    """벤치마크 시나리오 (엔드포인트 하나)"""
+    name: str
+    method: str
+    path: str
+    body: Optional[Callable[[Dict[str, int]], Dict[str, Any]]] = None
+    requests_scale: float = 1.0  # 외부 API를 호출하는 느린 시나리오는 요청 수를 줄임
+
+
+@dataclass
+class ScenarioResult:
+    """시나리오 측정 결과"""
+    name: str
+    requests: int
+    errors: int
+    throughput_rps: float
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+    queries_per_request: float
+    peak_rss_mb: float
+
+
+def _team_members() -> List[Dict[str, Any]]:
+    return [
+        {"name": f"팀원{i}", "skills": ["python", "react"], "experience_years": 3 + i, "skill_level": "Mid"}
+        for i in range(3)
+    ]
+
+
+def _enhanced_wbs_body(ids: Dict[str, int]) -> Dict[str, Any]:
+    return {
+        "project_id": ids["project_id"],
+        "proposal_content": "벤치마크 제안서 " * 50,
+        "rfp_content": "벤치마크 RFP " * 50,
+        "project_goals": "벤치마크 목표",
+        "team_members": _team_members()
+    }
+
+
+SCENARIOS: Dict[str, Scenario] = {
+    scenario.name: scenario
+    for scenario in (
+        Scenario("projects_list", "GET", "/api/v1/projects/?limit=50"),
+        Scenario("project_detail", "GET", "/api/v1/projects/{project_id}"),
+        Scenario("project_team_members", "GET", "/api/v1/projects/{project_id}/team-members"),
+        Scenario("wbs_items", "GET", "/api/v1/wbs/items?project_id={project_id}&limit=100"),
+        Scenario("documents_list", "GET", "/api/v1/documents/?limit=50"),
+        Scenario("search", "GET", f"/api/v1/search/?q={SEARCH_TERM}"),
+        Scenario("enhanced_wbs", "POST", "/api/v1/projects/generate-enhanced-wbs",
+                 body=_enhanced_wbs_body, requests_scale=0.25),
+        Scenario("enhanced_wbs_stream", "POST", "/api/v1/projects/generate-enhanced-wbs/stream",
+                 body=_enhanced_wbs_body, requests_scale=0.25),
+    )
+}
+
+
+def current_rss_bytes() -> int:
+    """현재 RSS (Linux /proc, 그 외에는 프로세스 최대 RSS)"""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError):
+        maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return maxrss if sys.platform == "darwin" else maxrss * 1024
+
+
+async def sample_peak_rss(peak: List[int], interval: float = 0.01):
+    """취소될 때까지 RSS를 주기적으로 측정해 최대값 기록"""
+    while True:
+        peak[0] = max(peak[0], current_rss_bytes())
+        await asyncio.sleep(interval)
+
+
+def percentile(sorted_values: List[float], q: float) -> float:
+    """정렬된 값의 q 분위수 (선형 보간)"""
+    if not sorted_values:
+        return 0.0
+    position = (len(sorted_values) - 1) * q
+    lower = int(position)
+    upper = min(lower + 1, len(sorted_values) - 1)
+    return sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * (position - lower)
+
+
+def seed_database(projects: int, members: int, wbs_items: int, documents: int) -> Dict[str, int]:
+    """벤치마크 데이터 생성 (첫 프로젝트에 팀원/WBS/문서 집중)"""
+    from app.core.database import SessionLocal
+    from app.models.project import Document, Project, WBSItem
+    from app.models.team import ProjectMember, TeamMember
+
+    db = SessionLocal()
+    try:
+        project_rows = [Project(name=f"벤치마크 프로젝트 {i}", description="benchmark") for i in range(projects)]
+        db.add_all(project_rows)
+        db.flush()
+        target = project_rows[0]
+
+        member_rows = [
+            TeamMember(name=f"팀원{i}", email=f"bench{i}@example.com", position="개발자", skills=json.dumps(["python"]))
+            for i in range(members)
+        ]
+        db.add_all(member_rows)
+        db.flush()
+        db.add_all(
+            ProjectMember(project_id=target.id, team_member_id=member.id, role="개발", allocation_percentage=50)
+            for member in member_rows
+        )
+        db.add_all(
+            WBSItem(
+                project_id=target.id,
+                title=f"작업 {i}",
+                description=f"{SEARCH_TERM} 스키마 설계 작업 {i}",
+                level=1 + i % 3,
+                estimated_hours=8
+            )
+            for i in range(wbs_items)
+        )
+        db.add_all(
+            Document(
+                project_id=target.id,
+                title=f"문서 {i}",
+                document_type="design",
+                content=f"{SEARCH_TERM} 설계 문서 본문 {i} " * 20,
+                status="completed"
+            )
+            for i in range(documents)
+        )
+        db.commit()
+        return {"project_id": target.id}
+    finally:
+        db.close()
+
+
+def _is_error(response) -> bool:
+    """HTTP 오류 또는 WBS 생성 실패 결과(status=failed, n8n 실행 실패, SSE error 이벤트)"""
+    if response.status_code >= 400:
+        return True
+    if response.headers.get("content-type", "").startswith("text/event-stream"):
+        return b"event: error" in response.content or b'"status": "failed"' in response.content
+    if response.content.startswith(b"{"):
+        data = response.json()
+        if not isinstance(data, dict):
+            return False
+        n8n_execution = data.get("n8n_execution") or {}
+        return data.get("status") == "failed" or n8n_execution.get("status") == "failed"
+    return False
+
+
+async def run_scenario(client, scenario: Scenario, ids: Dict[str, int], requests: int, concurrency: int) -> ScenarioResult:
+    """시나리오 하나를 동시 요청 부하로 실행"""
+    from sqlalchemy import event
+    from app.core.database import async_engine
+
+    path = scenario.path.format(**ids)
+    body = scenario.body(ids) if scenario.body else None
+    latencies: List[float] = []
+    errors = 0
+    queries = [0]
+    remaining = [requests]
+
+    def count_query(*args):
+        queries[0] += 1
+
+    async def worker():
+        nonlocal errors
+        while remaining[0] > 0:
+            remaining[0] -= 1
+            started = time.perf_counter()
+            response = await client.request(scenario.method, path, json=body)
+            latencies.append(time.perf_counter() - started)
+            if _is_error(response):
+                errors += 1
+
+    peak = [current_rss_bytes()]
+    sampler = asyncio.create_task(sample_peak_rss(peak))
+    event.listen(async_engine.sync_engine, "before_cursor_execute", count_query)
+    started = time.perf_counter()
+    try:
+        await asyncio.gather(*(worker() for _ in range(min(concurrency, requests))))
+    finally:
+        elapsed = time.perf_counter() - started
+        event.remove(async_engine.sync_engine, "before_cursor_execute", count_query)
+        sampler.cancel()
+    peak[0] = max(peak[0], current_rss_bytes())
+
+    latencies.sort()
+    return ScenarioResult(
+        name=scenario.name,
+        requests=len(latencies),
+        errors=errors,
+        throughput_rps=round(len(latencies) / elapsed, 1) if elapsed else 0.0,
+        p50_ms=round(percentile(latencies, 0.50) * 1000, 2),
+        p95_ms=round(percentile(latencies, 0.95) * 1000, 2),
+        p99_ms=round(percentile(latencies, 0.99) * 1000, 2),
+        queries_per_request=round(queries[0] / len(latencies), 2) if latencies else 0.0,
+        peak_rss_mb=round(peak[0] / (1024 * 1024), 1)
+    )
+
+
+def run_config(args) -> Dict[str, Any]:
+    """기준값과 함께 저장하는 실행 설정"""
+    return {key: getattr(args, key) for key in RUN_CONFIG_KEYS}
+
+
+def config_differences(current: Dict[str, Any], recorded: Optional[Dict[str, Any]]) -> List[str]:
+    """기준값 실행 설정과 현재 설정의 차이 목록 (설정이 기록되지 않은 기준값은 전체가 차이)"""
+    if not recorded:
+        return ["기준값에 실행 설정이 없습니다"]
+    return [
+        f"{key}: 현재 {current.get(key)} / 기준 {recorded.get(key)}"
+        for key in RUN_CONFIG_KEYS
+        if current.get(key) != recorded.get(key)
+    ]
+
+
+def compare_with_baseline(
+    results: List[ScenarioResult],
+    baselines: Dict[str, Dict[str, float]],
+    tolerance: float,
+    rss_tolerance: float
+) -> List[str]:
+    """기준값 대비 성능 저하 목록"""
+    regressions = []
+    for result in results:
+        baseline = baselines.get(result.name)
+        if not baseline:
+            continue
+        if result.errors:
+            regressions.append(f"{result.name}: 오류 응답 {result.errors}건")
+        if result.p95_ms > baseline["p95_ms"] * (1 + tolerance):
+            regressions.append(f"{result.name}: p95 {result.p95_ms}ms > 기준 {baseline['p95_ms']}ms")
+        if result.throughput_rps < baseline["throughput_rps"] * (1 - tolerance):
+            regressions.append(
+                f"{result.name}: 처리량 {result.throughput_rps} req/s < 기준 {baseline['throughput_rps']} req/s"
+            )
+        if result.queries_per_request > baseline["queries_per_request"] + 0.01:
+            regressions.append(
+                f"{result.name}: 요청당 SQL {result.queries_per_request}회 > 기준 {baseline['queries_per_request']}회"
+            )
+        if result.peak_rss_mb > baseline["peak_rss_mb"] * (1 + rss_tolerance):
+            regressions.append(f"{result.name}: 최대 RSS {result.peak_rss_mb}MB > 기준 {baseline['peak_rss_mb']}MB")
+    return regressions
+
+
+def print_results(results: List[ScenarioResult]):
+    print(
+        f"{'시나리오':<22}{'요청':>6}{'오류':>6}{'req/s':>9}{'p50ms':>9}{'p95ms':>9}{'p99ms':>9}"
+        f"{'SQL/req':>9}{'RSS MB':>9}"
+    )
+    for r in results:
+        print(
+            f"{r.name:<24}{r.requests:>6}{r.errors:>6}{r.throughput_rps:>9.1f}{r.p50_ms:>9.1f}"
+            f"{r.p95_ms:>9.1f}{r.p99_ms:>9.1f}{r.queries_per_request:>9.2f}{r.peak_rss_mb:>9.1f}"
+        )
+
+
+async def run_benchmarks(args) -> List[ScenarioResult]:
+    """앱 수명 주기 안에서 데이터 생성 후 시나리오 실행"""
+    import httpx
+    from app.main import app
+
+    names = [name.strip() for name in args.scenarios.split(",") if name.strip()]
+    unknown = [name for name in names if name not in SCENARIOS]
+    if unknown:
+        raise SystemExit(f"❌ 알 수 없는 시나리오: {', '.join(unknown)} (사용 가능: {', '.join(SCENARIOS)})")
+
+    async with app.router.lifespan_context(app):
+        ids = await asyncio.to_thread(
+            seed_database, args.projects, args.members, args.wbs_items, args.documents
+        )
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://benchmark", timeout=120) as client:
+            results = []
+            for name in names:
+                scenario = SCENARIOS[name]
+                requests = max(1, int(args.requests * scenario.requests_scale))
+                # 연결/캐시 준비용 워밍업 (측정 제외)
+                await run_scenario(client, scenario, ids, min(args.warmup, requests), args.concurrency)
+                result = await run_scenario(client, scenario, ids, requests, args.concurrency)
+                results.append(result)
+                print(f"📊 {name}: {result.throughput_rps} req/s, p95 {result.p95_ms}ms")
+    return results
+
+
+def configure_environment(openai_url: str, n8n_url: str) -> str:
+    """앱 모듈 임포트 전에 임시 데이터베이스와 가짜 서버 주소 설정"""
+    work_dir = tempfile.mkdtemp(prefix="tasktory-loadtest-")
+    os.environ.update({
+        "DATABASE_URL": f"sqlite:///{os.path.join(work_dir, 'tasktory.db')}",
+        "LLM_CACHE_PATH": os.path.join(work_dir, "llm_cache.db"),
+        "LLM_CACHE_ENABLED": "false",  # 매 요청이 가짜 OpenAI까지 가도록 캐시 비활성화
+        "UPLOAD_DIR": os.path.join(work_dir, "uploads"),
+        "OPENAI_API_KEY": "benchmark",
+        "OPENAI_BASE_URL": f"{openai_url}/v1",
+        "N8N_MCP_SERVER_URL": n8n_url,
+        "N8N_MCP_API_KEY": "benchmark",
+    })
+    return work_dir
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Tasktory API 부하 테스트 / 벤치마크")
+    parser.add_argument("--scenarios", default=",".join(SCENARIOS), help="실행할 시나리오 (쉼표 구분)")
+    parser.add_argument("--requests", type=int, default=400, help="시나리오별 요청 수")
+    parser.add_argument("--concurrency", type=int, default=16, help="동시 요청 수")
+    parser.add_argument("--warmup", type=int, default=20, help="시나리오별 워밍업 요청 수")
+    parser.add_argument("--projects", type=int, default=200)
+    parser.add_argument("--members", type=int, default=30)
+    parser.add_argument("--wbs-items", type=int, default=500)
+    parser.add_argument("--documents", type=int, default=200)
+    parser.add_argument("--openai-latency-ms", type=float, default=200.0)
+    parser.add_argument("--openai-phases", type=int, default=4)
+    parser.add_argument("--openai-tasks-per-phase", type=int, default=6)
+    parser.add_argument("--openai-padding-bytes", type=int, default=0)
+    parser.add_argument("--n8n-latency-ms", type=float, default=50.0)
+    parser.add_argument("--n8n-payload-bytes", type=int, default=1024)
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE_PATH, help="기준값 파일")
+    parser.add_argument("--update-baseline", action="store_true", help="현재 결과를 기준값으로 저장")
+    parser.add_argument("--tolerance", type=float, default=0.3, help="p95/처리량 허용 오차 비율")
+    parser.add_argument("--rss-tolerance", type=float, default=0.2, help="최대 RSS 허용 오차 비율")
+    parser.add_argument("--output", type=Path, help="결과 JSON 저장 경로")
+    args = parser.parse_args()
+
+    openai_server, n8n_server = start_fake_services(
+        FakeOpenAIConfig(
+            latency_ms=args.openai_latency_ms,
+            phases=args.openai_phases,
+            tasks_per_phase=args.openai_tasks_per_phase,
+            padding_bytes=args.openai_padding_bytes
+        ),
+        FakeN8nConfig(latency_ms=args.n8n_latency_ms, payload_bytes=args.n8n_payload_bytes)
+    )
+    work_dir = configure_environment(openai_server.url, n8n_server.url)
+    print(f"🚀 가짜 OpenAI {openai_server.url}, 가짜 n8n {n8n_server.url}, 작업 디렉토리 {work_dir}")
+
+    try:
+        results = asyncio.run(run_benchmarks(args))
+    finally:
+        openai_server.stop()
+        n8n_server.stop()
+
+    print("=" * 88)
+    print_results(results)
+    print(f"🔌 가짜 OpenAI 요청 {openai_server.requests}회, 가짜 n8n 요청 {n8n_server.requests}회")
+
+    if args.output:
+        args.output.write_text(
+            json.dumps([asdict(r) for r in results], ensure_ascii=False, indent=2), encoding="utf-8"
+        )
+
+    stored = json.loads(args.baseline.read_text(encoding="utf-8")) if args.baseline.exists() else {}
+    config = run_config(args)
+    differences = config_differences(config, stored.get("config")) if stored else []
+    # 실행 설정이 다른 기준값과 섞이지 않도록 설정이 바뀌면 시나리오 기준값을 새로 시작
+    baselines = {} if differences else stored.get("scenarios", {})
+    if args.update_baseline:
+        baselines.update({
+            r.name: {
+                "p95_ms": r.p95_ms,
+                "throughput_rps": r.throughput_rps,
+                "queries_per_request": r.queries_per_request,
+                "peak_rss_mb": r.peak_rss_mb
+            }
+            for r in results
+        })
+        args.baseline.write_text(
+            json.dumps({"config": config, "scenarios": baselines}, ensure_ascii=False, indent=2) + "\n",
+            encoding="utf-8"
+        )
+        print(f"💾 기준값 저장: {args.baseline}")
+        return
+
+    if differences:
+        print("⚠️ 실행 설정이 기준값과 달라 비교하지 않습니다:")
+        for difference in differences:
+            print(f"   - {difference}")
+        print("   이 설정의 기준값은 --baseline 다른파일.json --update-baseline으로 저장하세요")
+        return
+
+    regressions = compare_with_baseline(results, baselines, args.tolerance, args.rss_tolerance)
+    if regressions:
+        print("❌ 성능 저하 감지:")
+        for regression in regressions:
+            print(f"   - {regression}")
+        sys.exit(1)
+    print("✅ 기준값 대비 성능 저하 없음" if baselines else "⚠️ 기준값이 없습니다 (--update-baseline으로 저장)")
+
+
+if __name__ == "__main__":
+    main()
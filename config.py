@@ -11,18 +11,82 @@ class Settings(BaseSettings):
     
     # OpenAI API 설정
     openai_api_key: str = ""
-    
+    openai_base_url: Optional[str] = None  # OpenAI 호환 API 주소 (미설정 시 기본 OpenAI API, 벤치마크는 가짜 서버 사용)
+
+    # LLM 응답 캐시 설정
+    llm_cache_enabled: bool = True
+    llm_cache_path: str = "./llm_cache.db"
+    llm_cache_ttl_seconds: int = 7 * 24 * 3600
+    llm_cache_max_entries: int = 1000
+
+    # 요구사항 분석 설정 (대용량 문서는 청크 단위 map-reduce 분석)
+    requirement_analysis_mode: str = "auto"  # single, mapreduce, auto
+    requirement_chunk_tokens: int = 5000
+    requirement_map_concurrency: int = 4
+    requirement_map_max_tokens: int = 2000
+    requirement_map_max_failure_ratio: float = 0.25  # 실패한 청크 비율이 이를 넘으면 분석 실패
+
     # n8n MCP Server 설정
     n8n_mcp_server_url: str = "http://localhost:5678"
     n8n_mcp_api_key: str = ""
     n8n_mcp_workflow_id: str = "n8n-mcp-llm-workflow"
     
+    # n8n HTTP 커넥션 풀 설정
+    n8n_max_connections: int = 100
+    n8n_max_keepalive_connections: int = 20
+    n8n_keepalive_expiry: float = 30.0
+    n8n_http2: bool = False
+    n8n_connect_timeout: float = 5.0
+    n8n_timeout_execute: float = 30.0
+    n8n_timeout_status: float = 10.0
+    n8n_timeout_webhook: float = 10.0
+    n8n_timeout_create: float = 30.0
+    n8n_timeout_list: float = 10.0
+    
     # 데이터베이스 설정
     database_url: str = "sqlite:///./tasktory.db"
+    async_database_url: Optional[str] = None  # 미지정 시 database_url의 비동기 드라이버 URL 사용
+    database_profile: str = "auto"  # auto(URL 기준), sqlite, postgresql, default
+    # 커넥션 풀 설정 (미지정 시 프로필 기본값 사용)
+    database_pool_size: Optional[int] = None
+    database_max_overflow: Optional[int] = None
+    database_pool_timeout: Optional[float] = None
+    database_pool_recycle: Optional[int] = None
+    database_pool_pre_ping: Optional[bool] = None
+    database_echo: bool = False
+    
+    # 목록 API 페이지네이션 설정
+    pagination_default_limit: int = 50
+    pagination_max_limit: int = 200
+    search_max_results: int = 1000  # 검색 결과 페이지네이션 최대 범위
+    
+    # SQLite 커넥션별 PRAGMA 설정 (sqlite 프로필)
+    sqlite_journal_mode: str = "WAL"
+    sqlite_synchronous: str = "NORMAL"
+    sqlite_mmap_size: int = 256 * 1024 * 1024  # 바이트
+    sqlite_cache_size: int = -64000  # 음수는 KiB 단위 (약 64MB)
+    sqlite_busy_timeout_ms: int = 5000
+    
+    # 파일 업로드 설정
+    upload_dir: str = "uploads"
+    upload_chunk_size: int = 1024 * 1024  # 스트리밍 저장 청크 크기 (바이트)
+    document_max_upload_bytes: int = 10 * 1024 * 1024
+    meeting_audio_max_upload_bytes: int = 1024 * 1024 * 1024
+    blob_gc_grace_seconds: int = 24 * 3600  # 참조되지 않은 업로드 파일 보관 시간
+    # nginx 내부 location 경로 (설정 시 다운로드 본문을 X-Accel-Redirect로 nginx sendfile에 위임)
+    download_accel_redirect_prefix: Optional[str] = None
+    
+    # 문서 텍스트 추출 설정 (PDF는 pypdf 설치 시 지원)
+    text_extraction_workers: int = 2
+    text_extraction_max_chars: int = 2_000_000
     
     # Redis 설정 (Celery용)
     redis_url: str = "redis://localhost:6379/0"
     
+    # WBS 생성 작업 큐 설정
+    wbs_job_backend: str = "inprocess"  # inprocess, celery
+    wbs_job_max_concurrency: int = 2
+    
     # Jira 설정
     jira_url: str = ""
     jira_username: str = ""
@@ -48,6 +112,9 @@ class Settings(BaseSettings):
     app_version: str = "1.0.0"
     debug: bool = False
     
+    # Prometheus 메트릭 (/metrics)
+    metrics_enabled: bool = True
+    
     class Config:
         env_file = ".env"
         case_sensitive = False
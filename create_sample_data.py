@@ -12,7 +12,7 @@ from pathlib import Path
 # 프로젝트 루트 디렉토리를 Python 경로에 추가
 sys.path.append(str(Path(__file__).parent))
 
-from app.core.database import engine, Base, get_db
+from app.core.database import engine, Base, get_db, run_migrations
 from app.models.project import Project, WBSItem, Meeting, Document
 from app.models.team import TeamMember, ProjectMember, ProjectTemplate
 from sqlalchemy.orm import sessionmaker
@@ -20,7 +20,8 @@ from sqlalchemy.orm import sessionmaker
 async def create_tables():
     """데이터베이스 테이블 생성"""
     print("📊 데이터베이스 테이블 생성 중...")
-    Base.metadata.create_all(bind=engine)
+    with engine.begin() as connection:
+        run_migrations(connection)
     print("✅ 데이터베이스 테이블 생성 완료")
 
 async def create_sample_data():
@@ -128,7 +128,7 @@ const Dashboard = () => {
 
   const fetchProjects = async () => {
     try {
-      const response = await projectAPI.getProjects();
+      const response = await projectAPI.getAllProjects();
       setProjects(response.data);
     } catch (error) {
       console.error('프로젝트 목록 조회 실패:', error);
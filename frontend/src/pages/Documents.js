@@ -156,6 +156,7 @@ const Documents = () => {
       
       // 파일 업로드가 있는 경우
       let filePath = null;
+      let fileName = null;
       if (attachedFile) {
         console.log('Uploading file:', attachedFile.name);
         const formData = new FormData();
@@ -163,6 +164,7 @@ const Documents = () => {
         
         const uploadResponse = await documentAPI.uploadFile(formData);
         filePath = uploadResponse.data.file_path;
+        fileName = uploadResponse.data.file_name;
         console.log('File uploaded successfully:', filePath);
       }
 
@@ -174,6 +176,7 @@ const Documents = () => {
         project_id: newDocument.use_custom_project ? null : (newDocument.project_id || null),
         project_name: newDocument.use_custom_project ? newDocument.custom_project : null,
         file_path: filePath,
+        file_name: fileName,
       };
 
       console.log('Creating document with data:', documentData);
@@ -380,7 +383,7 @@ const Documents = () => {
       // DOM 요소 생성
       const downloadLink = window.document.createElement('a');
       downloadLink.href = url;
-      downloadLink.download = doc.file_path.split('/').pop();
+      downloadLink.download = doc.file_name || doc.file_path.split('/').pop();
       downloadLink.style.display = 'none';
       
       // DOM에 추가하고 클릭
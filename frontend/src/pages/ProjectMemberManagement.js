@@ -74,7 +74,7 @@ const ProjectMemberManagement = () => {
 
   const fetchProjects = async () => {
     try {
-      const response = await projectAPI.getProjects();
+      const response = await projectAPI.getAllProjects();
       setProjects(response.data);
     } catch (error) {
       console.error('프로젝트 목록 조회 실패:', error);
@@ -84,7 +84,7 @@ const ProjectMemberManagement = () => {
 
   const fetchTeamMembers = async () => {
     try {
-      const response = await teamAPI.getTeamMembers();
+      const response = await teamAPI.getAllTeamMembers();
       setTeamMembers(response.data);
     } catch (error) {
       console.error('팀원 목록 조회 실패:', error);
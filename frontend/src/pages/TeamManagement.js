@@ -82,7 +82,7 @@ const TeamManagement = () => {
   const fetchTeamMembers = async () => {
     try {
       setLoading(true);
-      const response = await teamAPI.getTeamMembers();
+      const response = await teamAPI.getAllTeamMembers();
       setTeamMembers(response.data);
     } catch (error) {
       console.error('팀원 목록 조회 실패:', error);
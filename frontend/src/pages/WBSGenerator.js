@@ -114,7 +114,7 @@ const WBSGenerator = () => {
   const fetchProjects = async () => {
     try {
       console.log('프로젝트 목록 조회 시작...');
-      const response = await projectAPI.getProjects();
+      const response = await projectAPI.getAllProjects();
       console.log('프로젝트 목록 응답:', response);
       setProjects(response.data);
       console.log('프로젝트 목록 설정 완료:', response.data);
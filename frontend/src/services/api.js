@@ -53,10 +53,29 @@ api.interceptors.response.use(
   }
 );
 
+// 목록 API 전체 조회 시 한 번에 요청할 페이지 크기 (서버 최대값 200)
+const PAGE_FETCH_LIMIT = 200;
+
+// 키셋 페이지네이션 목록을 X-Next-Cursor 헤더를 따라 끝까지 조회 (data에 전체 항목)
+export const fetchAllPages = async (fetchPage, params = {}) => {
+  const items = [];
+  let cursor = null;
+  let response;
+  do {
+    response = await fetchPage({ ...params, limit: PAGE_FETCH_LIMIT, ...(cursor ? { cursor } : {}) });
+    items.push(...response.data);
+    cursor = response.headers['x-next-cursor'];
+  } while (cursor);
+  return { ...response, data: items };
+};
+
 // 프로젝트 관련 API
 export const projectAPI = {
   // 프로젝트 목록 조회
-  getProjects: () => api.get('/api/v1/projects/'),
+  getProjects: (params) => api.get('/api/v1/projects/', { params }),
+  
+  // 프로젝트 전체 목록 조회 (모든 페이지)
+  getAllProjects: (params) => fetchAllPages(projectAPI.getProjects, params),
   
   // 프로젝트 생성
   createProject: (data) => api.post('/api/v1/projects/', data),
@@ -99,7 +118,7 @@ export const projectAPI = {
 // 회의 관련 API
 export const meetingAPI = {
   // 회의 목록 조회
-  getMeetings: () => api.get('/api/v1/meetings/'),
+  getMeetings: (params) => api.get('/api/v1/meetings/', { params }),
   
   // 회의 생성
   createMeeting: (data) => api.post('/api/v1/meetings/', data),
@@ -131,7 +150,7 @@ export const meetingAPI = {
 // 문서 관련 API
 export const documentAPI = {
   // 문서 목록 조회
-  getDocuments: () => api.get('/api/v1/documents/'),
+  getDocuments: (params) => api.get('/api/v1/documents/', { params }),
   
   // 문서 생성
   createDocument: (data) => api.post('/api/v1/documents/', data),
@@ -167,7 +186,7 @@ export const documentAPI = {
 // WBS 관련 API
 export const wbsAPI = {
   // WBS 아이템 목록 조회
-  getWBSItems: () => api.get('/api/v1/wbs/items'),
+  getWBSItems: (params) => api.get('/api/v1/wbs/items', { params }),
   
   // WBS 아이템 생성
   createWBSItem: (data) => api.post('/api/v1/wbs/items', data),
@@ -188,6 +207,9 @@ export const teamAPI = {
   // 팀원 목록 조회
   getTeamMembers: (params) => api.get('/api/v1/team/team-members', { params }),
   
+  // 팀원 전체 목록 조회 (모든 페이지)
+  getAllTeamMembers: (params) => fetchAllPages(teamAPI.getTeamMembers, params),
+  
   // 팀원 생성
   createTeamMember: (data) => api.post('/api/v1/team/team-members', data),
   
@@ -252,6 +274,12 @@ export const settingsAPI = {
   testConnection: (service) => api.post('/api/v1/settings/test-connection', { service }),
 };
 
+// 검색 관련 API
+export const searchAPI = {
+  // 문서/회의/WBS 전문 검색 (params: q, types, project_id, limit, cursor)
+  search: (params) => api.get('/api/v1/search/', { params }),
+};
+
 // 파일 업로드 유틸리티
 export const uploadFile = async (file, endpoint, onProgress) => {
   const formData = new FormData();
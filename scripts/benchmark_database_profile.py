@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+SQLite 데이터베이스 프로필 벤치마크
+기본 설정(rollback journal, synchronous=FULL)과 sqlite 프로필(WAL, synchronous=NORMAL,
+mmap, cache_size, busy_timeout)을 동시 요청 부하에서 비교합니다.
+
+실행:
+    python scripts/benchmark_database_profile.py --workers 16 --iterations 100
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+
+from sqlalchemy import event, func, select
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from app.core.database import Base, DATABASE_PROFILES, _apply_sqlite_pragmas
+from app.models.project import Project, WBSItem, Meeting, Document
+from app.models.team import TeamMember, ProjectMember, ProjectTemplate
+from app.models.job import WBSGenerationJob
+
+
+def create_engine_for(profile: str, path: str):
+    """프로필별 비동기 엔진 생성 (baseline은 기존처럼 옵션 없이 생성)"""
+    url = f"sqlite+aiosqlite:///{path}"
+    if profile == "baseline":
+        return create_async_engine(url)
+    engine = create_async_engine(url, **DATABASE_PROFILES["sqlite"])
+    event.listen(engine.sync_engine, "connect", _apply_sqlite_pragmas)
+    return engine
+
+
+async def worker(session_factory, worker_id: int, iterations: int, reads: int, latencies, errors):
+    """요청 1건 = 쓰기 트랜잭션 1회 + 읽기 reads회"""
+    for i in range(iterations):
+        started = time.perf_counter()
+        try:
+            async with session_factory() as db:
+                project = Project(name=f"bench-{worker_id}-{i}", description="benchmark")
+                db.add(project)
+                await db.flush()
+                db.add(WBSItem(project_id=project.id, title="task", level=1))
+                await db.commit()
+
+            async with session_factory() as db:
+                for _ in range(reads):
+                    await db.scalar(select(func.count()).select_from(Project))
+                    await db.execute(
+                        select(WBSItem).where(WBSItem.project_id == project.id)
+                    )
+        except OperationalError as e:
+            errors.append(str(e.orig))
+        latencies.append(time.perf_counter() - started)
+
+
+async def run_profile(profile: str, workers: int, iterations: int, reads: int):
+    """프로필 하나에 대한 부하 실행"""
+    directory = tempfile.mkdtemp(prefix="tasktory-bench-")
+    path = os.path.join(directory, "bench.db")
+    engine = create_engine_for(profile, path)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    session_factory = async_sessionmaker(engine, expire_on_commit=False)
+
+    latencies, errors = [], []
+    started = time.perf_counter()
+    await asyncio.gather(*(
+        worker(session_factory, worker_id, iterations, reads, latencies, errors)
+        for worker_id in range(workers)
+    ))
+    elapsed = time.perf_counter() - started
+
+    async with engine.connect() as conn:
+        journal_mode = (await conn.exec_driver_sql("PRAGMA journal_mode")).scalar()
+        synchronous = (await conn.exec_driver_sql("PRAGMA synchronous")).scalar()
+    await engine.dispose()
+
+    latencies.sort()
+    return {
+        "profile": profile,
+        "journal_mode": journal_mode,
+        "synchronous": synchronous,
+        "requests": len(latencies),
+        "elapsed": elapsed,
+        "throughput": len(latencies) / elapsed if elapsed else 0.0,
+        "p50_ms": statistics.median(latencies) * 1000,
+        "p95_ms": latencies[int(len(latencies) * 0.95) - 1] * 1000,
+        "errors": len(errors),
+    }
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="SQLite 데이터베이스 프로필 벤치마크")
+    parser.add_argument("--workers", type=int, default=16, help="동시 요청 수")
+    parser.add_argument("--iterations", type=int, default=100, help="작업자별 요청 수")
+    parser.add_argument("--reads", type=int, default=4, help="요청당 읽기 쿼리 수")
+    args = parser.parse_args()
+
+    print(f"🚀 동시 요청 {args.workers}개 x {args.iterations}회 (요청당 쓰기 1 + 읽기 {args.reads * 2})")
+    results = []
+    for profile in ("baseline", "sqlite"):
+        result = await run_profile(profile, args.workers, args.iterations, args.reads)
+        results.append(result)
+        print(
+            f"📊 {result['profile']:<8} journal={result['journal_mode']:<6} sync={result['synchronous']} "
+            f"{result['throughput']:8.1f} req/s  p50={result['p50_ms']:7.1f}ms  "
+            f"p95={result['p95_ms']:7.1f}ms  errors={result['errors']}"
+        )
+
+    baseline, tuned = results
+    if baseline["throughput"]:
+        print(f"✅ 처리량 {tuned['throughput'] / baseline['throughput']:.2f}배")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,34 @@
+#!/usr/bin/env python3
+"""
+참조되지 않은 업로드 파일 정리
+문서/회의에서 참조하지 않는 상태로 유예 시간(BLOB_GC_GRACE_SECONDS)이 지난
+내용 주소 기반 저장소 파일을 삭제합니다. (cron 등으로 주기 실행)
+
+실행:
+    python scripts/collect_unreferenced_blobs.py --grace-seconds 86400
+"""
+import argparse
+import asyncio
+import sys
+from pathlib import Path
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+
+from app.core.database import AsyncSessionLocal, close_db
+from app.services.blob_service import collect_unreferenced_blobs
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="참조되지 않은 업로드 파일 정리")
+    parser.add_argument("--grace-seconds", type=int, default=None, help="참조 해제 후 보관 시간 (기본: 설정값)")
+    args = parser.parse_args()
+
+    async with AsyncSessionLocal() as db:
+        removed = await collect_unreferenced_blobs(db, args.grace_seconds)
+    await close_db()
+    print(f"🧹 참조되지 않은 파일 {removed}개 삭제")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
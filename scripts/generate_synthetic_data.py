@@ -0,0 +1,409 @@
+#!/usr/bin/env python3
+"""
+성능 테스트용 합성 데이터 생성
+스케일 팩터에 비례하는 프로젝트, 다단계 WBS 트리, 기술 분포를 갖는 팀원, 프로젝트 멤버십,
+회의, 문서를 SQLAlchemy Core 배치 INSERT(executemany)로 추가합니다.
+같은 시드로 실행하면 같은 데이터가 생성되며, 기존 데이터는 삭제하지 않습니다 (id는 기존 최대값 이후부터 사용).
+id를 직접 지정해 넣으므로 PostgreSQL에서는 적재 후 각 테이블의 시퀀스를 최대 id로 맞춥니다.
+
+스케일 팩터 1 기준 (대략, 약 4.5만 행):
+    팀원 1,000 / 프로젝트 100 / 멤버십 1,500 / WBS 아이템 38,000 / 회의 2,500 / 문서 1,300
+
+실행:
+    python scripts/generate_synthetic_data.py --scale 1 --seed 42
+    DATABASE_URL=sqlite:///./perf.db python scripts/generate_synthetic_data.py --scale 25   # 약 110만 행
+
+처리량은 SQLite 로컬 디스크 기준 초당 약 1.6만~2만 행입니다 (스케일 1이 약 3초, 스케일 25의 110만 행은 1분 이상).
+"""
+import argparse
+import json
+import random
+import re
+import sys
+import time
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from itertools import accumulate
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Tuple
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+
+from sqlalchemy import func, select
+from sqlalchemy.engine import Connection
+
+from app.core.database import engine, run_migrations
+from app.models.project import Document, Meeting, Project, WBSItem
+from app.models.team import ProjectMember, TeamMember
+
+MEMBERS_PER_SCALE = 1000
+PROJECTS_PER_SCALE = 100
+MEMBERS_PER_PROJECT = (5, 25)
+MEETINGS_PER_PROJECT = (10, 40)
+DOCUMENTS_PER_PROJECT = (5, 20)
+
+# WBS 트리: 프로젝트별 최대 깊이와 단계별 자식 수 범위
+WBS_DEPTH = (3, 6)
+WBS_BRANCHING = [(3, 6), (2, 6), (2, 5), (1, 4), (0, 3), (0, 2)]
+
+# 기술 스택 (기술, 가중치) - 일부 기술에 수요가 몰린 분포
+SKILLS: List[Tuple[str, int]] = [
+    ("Python", 40), ("JavaScript", 45), ("TypeScript", 30), ("React", 35), ("Vue.js", 12),
+    ("Java", 25), ("Spring", 20), ("Kotlin", 8), ("Go", 10), ("Node.js", 25),
+    ("FastAPI", 15), ("Django", 12), ("PostgreSQL", 30), ("MySQL", 20), ("MongoDB", 12),
+    ("Redis", 15), ("Docker", 30), ("Kubernetes", 15), ("AWS", 25), ("Terraform", 8),
+    ("Figma", 10), ("Swift", 6), ("Flutter", 6), ("TensorFlow", 6), ("PyTorch", 8),
+]
+SKILL_LEVELS = [("Junior", 40), ("Mid", 35), ("Senior", 20), ("Expert", 5)]
+EXPERIENCE_YEARS = {"Junior": (0, 3), "Mid": (3, 7), "Senior": (7, 15), "Expert": (12, 25)}
+HOURLY_RATE = {"Junior": (30000, 45000), "Mid": (45000, 65000), "Senior": (65000, 90000), "Expert": (90000, 130000)}
+POSITIONS = ["백엔드 개발자", "프론트엔드 개발자", "풀스택 개발자", "DevOps 엔지니어", "데이터 엔지니어",
+             "UI/UX 디자이너", "QA 엔지니어", "프로젝트 매니저", "모바일 개발자", "ML 엔지니어"]
+DEPARTMENTS = ["개발팀", "플랫폼팀", "데이터팀", "디자인팀", "품질팀", "PMO"]
+PROJECT_STATUSES = [("planning", 15), ("active", 45), ("completed", 35), ("cancelled", 5)]
+PROJECT_ROLES = ["PM", "백엔드", "프론트엔드", "인프라", "디자인", "QA", "데이터"]
+DOCUMENT_TYPES = [("proposal", 15), ("rfp", 10), ("design", 30), ("manual", 15), ("report", 20), ("minutes", 10)]
+SURNAMES = "김이박최정강조윤장임한오서신권황안송류홍"
+GIVEN_NAMES = ["민준", "서연", "도윤", "지우", "하준", "서윤", "시우", "지민", "주원", "하은",
+               "지호", "수아", "준서", "예은", "현우", "다은", "건우", "채원", "우진", "지유"]
+WORDS = ["사용자", "인증", "결제", "데이터베이스", "검색", "알림", "대시보드", "API", "배포", "모니터링",
+         "보안", "성능", "캐시", "스키마", "마이그레이션", "테스트", "리팩토링", "연동", "설계", "분석",
+         "요구사항", "일정", "리소스", "권한", "로그", "백업", "배치", "화면", "모바일", "관리자"]
+VERBS = ["구현", "설계", "검토", "개선", "구축", "정의", "분석", "최적화", "테스트", "문서화"]
+
+SENTENCE_POOL_SIZE = 4096
+ROWS_TOTAL_KEYS = ("team_members", "projects", "project_members", "wbs_items", "meetings", "documents")
+EPOCH = datetime(2023, 1, 1)
+
+
+class Generator:
+    """시드 기반 합성 데이터 생성기"""
+
+    def __init__(self, scale: float, seed: int):
+        self.scale = scale
+        self.rng = random.Random(seed)
+        self._skill_names = [name for name, _ in SKILLS]
+        self._skill_weights = list(accumulate(weight for _, weight in SKILLS))
+        self._cum_weights: Dict[int, Tuple[List[str], List[int]]] = {}
+        # 행마다 문장을 조합하지 않도록 시드로 만든 문장/제목 풀에서 선택
+        self._sentences = [self._make_sentence(self.rng.randint(3, 12)) for _ in range(SENTENCE_POOL_SIZE)]
+        self._titles = [f"{word} {verb}" for word in WORDS for verb in VERBS]
+
+    def _weighted(self, choices: List[Tuple[str, int]]) -> str:
+        cached = self._cum_weights.get(id(choices))
+        if cached is None:
+            names = [c for c, _ in choices]
+            cached = self._cum_weights[id(choices)] = (names, list(accumulate(w for _, w in choices)))
+        return self.rng.choices(cached[0], cum_weights=cached[1])[0]
+
+    def _make_sentence(self, words: int) -> str:
+        return " ".join(self.rng.choices(WORDS, k=words)) + " " + self.rng.choice(VERBS)
+
+    def _sentence(self) -> str:
+        return self._sentences[int(self.rng.random() * SENTENCE_POOL_SIZE)]
+
+    def _paragraph(self, sentences: int) -> str:
+        return ". ".join(self.rng.choices(self._sentences, k=sentences)) + "."
+
+    def team_members(self, first_id: int) -> Iterator[Dict[str, Any]]:
+        """기술 수준/기술 스택 분포를 갖는 팀원"""
+        rng = self.rng
+        for i in range(int(MEMBERS_PER_SCALE * self.scale)):
+            member_id = first_id + i
+            level = self._weighted(SKILL_LEVELS)
+            skill_count = rng.randint(2, 6)
+            skills = list(dict.fromkeys(rng.choices(self._skill_names, cum_weights=self._skill_weights, k=skill_count)))
+            created_at = EPOCH + timedelta(days=rng.randint(0, 900))
+            yield {
+                "id": member_id,
+                "name": rng.choice(SURNAMES) + rng.choice(GIVEN_NAMES),
+                "email": f"member{member_id}@synthetic.example.com",
+                "position": rng.choice(POSITIONS),
+                "department": rng.choice(DEPARTMENTS),
+                "experience_years": rng.randint(*EXPERIENCE_YEARS[level]),
+                "skills": json.dumps(skills, ensure_ascii=False),
+                "skill_level": level,
+                "availability": rng.random() < 0.85,
+                "hourly_rate": rng.randrange(*HOURLY_RATE[level], 1000),
+                "notes": None,
+                "created_at": created_at,
+                "updated_at": created_at,
+            }
+
+    def projects(self, first_id: int) -> Iterator[Dict[str, Any]]:
+        rng = self.rng
+        for i in range(int(PROJECTS_PER_SCALE * self.scale)):
+            start = EPOCH + timedelta(days=rng.randint(0, 1000))
+            created_at = start - timedelta(days=rng.randint(7, 60))
+            yield {
+                "id": first_id + i,
+                "name": f"{rng.choice(WORDS)} {rng.choice(WORDS)} 시스템 구축 #{first_id + i}",
+                "description": self._paragraph(rng.randint(2, 5)),
+                "status": self._weighted(PROJECT_STATUSES),
+                "start_date": start,
+                "end_date": start + timedelta(weeks=rng.randint(8, 52)),
+                "created_at": created_at,
+                "updated_at": created_at,
+            }
+
+    def project_members(
+        self,
+        first_id: int,
+        projects: List[Dict[str, Any]],
+        member_ids: List[int],
+        member_names: Dict[int, str]
+    ) -> Tuple[List[Dict[str, Any]], Dict[int, List[str]]]:
+        """프로젝트별 멤버십 (같은 프로젝트에 같은 팀원 중복 없음)과 프로젝트별 팀원 이름"""
+        rng = self.rng
+        rows, names_by_project = [], {}
+        next_id = first_id
+        for project in projects:
+            count = min(rng.randint(*MEMBERS_PER_PROJECT), len(member_ids))
+            chosen = rng.sample(member_ids, count)
+            names_by_project[project["id"]] = [member_names[m] for m in chosen]
+            for member_id in chosen:
+                rows.append({
+                    "id": next_id,
+                    "project_id": project["id"],
+                    "team_member_id": member_id,
+                    "role": rng.choice(PROJECT_ROLES),
+                    "responsibility": self._sentence(),
+                    "allocation_percentage": rng.choice((20, 30, 50, 50, 80, 100, 100)),
+                    "start_date": project["start_date"],
+                    "end_date": project["end_date"],
+                    "is_active": project["status"] in ("planning", "active"),
+                    "created_at": project["created_at"],
+                    "updated_at": project["created_at"],
+                })
+                next_id += 1
+        return rows, names_by_project
+
+    def wbs_items(
+        self,
+        first_id: int,
+        projects: List[Dict[str, Any]],
+        names_by_project: Dict[int, List[str]]
+    ) -> Iterator[Dict[str, Any]]:
+        """프로젝트별 다단계 WBS 트리 (부모가 항상 자식보다 먼저 생성)"""
+        rng = self.rng
+        next_id = first_id
+        for project in projects:
+            depth = rng.randint(*WBS_DEPTH)
+            assignees = names_by_project.get(project["id"]) or [None]
+            done_ratio = {"completed": 1.0, "cancelled": 0.3, "active": 0.4, "planning": 0.0}[project["status"]]
+            # (부모 id, 레벨, 자식 경로) 스택으로 깊이 우선 생성
+            stack = [(None, 1, "/")]
+            while stack:
+                parent_id, level, path = stack.pop()
+                low, high = WBS_BRANCHING[level - 1]
+                children = rng.randint(low, high) if parent_id is not None else rng.randint(max(low, 1), high)
+                for order in range(children):
+                    item_id = next_id
+                    next_id += 1
+                    is_leaf = level >= depth
+                    roll = rng.random()
+                    status = "completed" if roll < done_ratio else ("in_progress" if roll < done_ratio + 0.2 else "pending")
+                    yield {
+                        "id": item_id,
+                        "project_id": project["id"],
+                        "parent_id": parent_id,
+                        "path": path,
+                        "title": rng.choice(self._titles),
+                        "description": self._sentence(),
+                        "level": level,
+                        "order": order,
+                        "estimated_hours": int(rng.lognormvariate(3, 0.6)) + 1 if is_leaf else None,
+                        "assigned_to": rng.choice(assignees) if is_leaf else None,
+                        "skill_level_required": self._weighted(SKILL_LEVELS).lower(),
+                        "status": status,
+                        "created_at": project["created_at"],
+                    }
+                    if not is_leaf:
+                        stack.append((item_id, level + 1, f"{path}{item_id}/"))
+
+    def meetings(
+        self,
+        first_id: int,
+        projects: List[Dict[str, Any]],
+        names_by_project: Dict[int, List[str]]
+    ) -> Iterator[Dict[str, Any]]:
+        rng = self.rng
+        next_id = first_id
+        for project in projects:
+            names = names_by_project.get(project["id"]) or []
+            span_days = max((project["end_date"] - project["start_date"]).days, 1)
+            for _ in range(rng.randint(*MEETINGS_PER_PROJECT)):
+                meeting_date = project["start_date"] + timedelta(days=rng.randint(0, span_days), hours=rng.randint(9, 17))
+                has_minutes = rng.random() < 0.7
+                yield {
+                    "id": next_id,
+                    "project_id": project["id"],
+                    "title": f"{rng.choice(WORDS)} {rng.choice(('주간', '정기', '킥오프', '리뷰', '회고'))} 회의",
+                    "description": self._sentence(),
+                    "meeting_date": meeting_date,
+                    "participants": rng.sample(names, min(len(names), rng.randint(2, 8))),
+                    "audio_file_path": None,
+                    "audio_content_hash": None,
+                    "transcript": self._paragraph(rng.randint(5, 15)) if has_minutes else None,
+                    "summary": self._paragraph(2) if has_minutes else None,
+                    "action_items": [self._sentence() for _ in range(rng.randint(0, 4))],
+                    "created_at": meeting_date,
+                }
+                next_id += 1
+
+    def documents(self, first_id: int, projects: List[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+        rng = self.rng
+        next_id = first_id
+        for project in projects:
+            for _ in range(rng.randint(*DOCUMENTS_PER_PROJECT)):
+                document_type = self._weighted(DOCUMENT_TYPES)
+                created_at = project["created_at"] + timedelta(days=rng.randint(0, 120))
+                yield {
+                    "id": next_id,
+                    "project_id": project["id"],
+                    "project_name": project["name"],
+                    "title": f"{project['name']} {document_type} 문서",
+                    "document_type": document_type,
+                    "description": self._sentence(),
+                    "content": self._paragraph(rng.randint(10, 40)),
+                    "status": rng.choice(("draft", "review", "approved", "completed")),
+                    "created_at": created_at,
+                    "updated_at": created_at,
+                }
+                next_id += 1
+
+
+def next_id(conn: Connection, model) -> int:
+    """테이블의 다음 id (기존 데이터 뒤에 추가)"""
+    return (conn.execute(select(func.coalesce(func.max(model.id), 0))).scalar() or 0) + 1
+
+
+# 전문 검색 INSERT 트리거 본문 (마이그레이션 0005)
+_SEARCH_TRIGGER_INSERT = re.compile(
+    r"BEGIN\s+INSERT INTO (search_index\s*\([^)]*\))\s*VALUES\s*\((.*)\);\s*END\s*$", re.S | re.I
+)
+
+
+@contextmanager
+def deferred_search_index(conn: Connection, table: str, first_id: int) -> Iterator[None]:
+    """SQLite: 적재 중에는 행별 전문 검색 INSERT 트리거를 끄고, 적재 후 새 행을 한 번에 색인
+
+    FTS5 색인은 행별 트리거보다 INSERT ... SELECT 한 번이 훨씬 빠릅니다.
+    트리거 삭제/재생성은 적재와 같은 트랜잭션이므로 실패하면 함께 롤백됩니다.
+    """
+    trigger = f"search_{table}_ai"
+    sql = None
+    if conn.dialect.name == "sqlite":
+        sql = conn.exec_driver_sql(
+            "SELECT sql FROM sqlite_master WHERE type = 'trigger' AND name = ?", (trigger,)
+        ).scalar()
+    match = _SEARCH_TRIGGER_INSERT.search(sql) if sql else None
+    if match is None:
+        yield
+        return
+
+    conn.exec_driver_sql(f"DROP TRIGGER {trigger}")
+    yield
+    started = time.perf_counter()
+    target, values = match.groups()
+    conn.exec_driver_sql(
+        f"INSERT INTO {target} SELECT {values.replace('NEW.', f'{table}.')} "
+        f"FROM {table} WHERE {table}.id >= ?",
+        (first_id,)
+    )
+    conn.exec_driver_sql(sql)
+    print(f"   🔎 {table} 전문 검색 색인 {time.perf_counter() - started:.1f}초")
+
+
+def sync_sequence(conn: Connection, model) -> None:
+    """PostgreSQL: id를 직접 지정해 넣은 테이블의 시퀀스를 최대 id로 맞춤 (이후 일반 INSERT의 id 충돌 방지)"""
+    if conn.dialect.name != "postgresql":
+        return
+    table = model.__tablename__
+    conn.exec_driver_sql(
+        f"SELECT setval(pg_get_serial_sequence('{table}', 'id'), "
+        f"COALESCE((SELECT MAX(id) FROM {table}), 0) + 1, false)"
+    )
+
+
+def insert_batches(conn: Connection, model, rows: Iterable[Dict[str, Any]], batch_size: int) -> int:
+    """행을 batch_size개씩 Core executemany INSERT"""
+    statement = model.__table__.insert()
+    batch, total = [], 0
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= batch_size:
+            conn.execute(statement, batch)
+            total += len(batch)
+            batch = []
+    if batch:
+        conn.execute(statement, batch)
+        total += len(batch)
+    return total
+
+
+def generate(scale: float, seed: int, batch_size: int) -> Dict[str, int]:
+    """합성 데이터 생성 (한 트랜잭션)"""
+    generator = Generator(scale, seed)
+    counts: Dict[str, int] = {}
+    with engine.begin() as conn:
+        run_migrations(conn)
+
+        first_member = next_id(conn, TeamMember)
+        members = list(generator.team_members(first_member))
+        counts["team_members"] = insert_batches(conn, TeamMember, members, batch_size)
+        member_ids = [m["id"] for m in members]
+        member_names = {m["id"]: m["name"] for m in members}
+        del members
+
+        projects = list(generator.projects(next_id(conn, Project)))
+        counts["projects"] = insert_batches(conn, Project, projects, batch_size)
+
+        memberships, names_by_project = generator.project_members(
+            next_id(conn, ProjectMember), projects, member_ids, member_names
+        )
+        counts["project_members"] = insert_batches(conn, ProjectMember, memberships, batch_size)
+        del memberships
+
+        first_id = next_id(conn, WBSItem)
+        with deferred_search_index(conn, "wbs_items", first_id):
+            counts["wbs_items"] = insert_batches(
+                conn, WBSItem, generator.wbs_items(first_id, projects, names_by_project), batch_size
+            )
+        first_id = next_id(conn, Meeting)
+        with deferred_search_index(conn, "meetings", first_id):
+            counts["meetings"] = insert_batches(
+                conn, Meeting, generator.meetings(first_id, projects, names_by_project), batch_size
+            )
+        first_id = next_id(conn, Document)
+        with deferred_search_index(conn, "documents", first_id):
+            counts["documents"] = insert_batches(
+                conn, Document, generator.documents(first_id, projects), batch_size
+            )
+
+        for model in (TeamMember, Project, ProjectMember, WBSItem, Meeting, Document):
+            sync_sequence(conn, model)
+    return counts
+
+
+def main():
+    parser = argparse.ArgumentParser(description="성능 테스트용 합성 데이터 생성")
+    parser.add_argument("--scale", type=float, default=1.0, help="스케일 팩터 (1 = 약 4.5만 행)")
+    parser.add_argument("--seed", type=int, default=42, help="난수 시드 (같은 시드는 같은 데이터)")
+    parser.add_argument("--batch-size", type=int, default=5000, help="INSERT 배치 크기")
+    args = parser.parse_args()
+
+    print(f"🚀 합성 데이터 생성 (scale={args.scale}, seed={args.seed}, DB={engine.url.render_as_string()})")
+    started = time.perf_counter()
+    counts = generate(args.scale, args.seed, args.batch_size)
+    elapsed = time.perf_counter() - started
+
+    total = sum(counts.values())
+    for key in ROWS_TOTAL_KEYS:
+        print(f"   {key:<16} {counts.get(key, 0):>10,}")
+    print(f"✅ 총 {total:,}행 {elapsed:.1f}초 ({total / elapsed:,.0f}행/초)")
+
+
+if __name__ == "__main__":
+    main()
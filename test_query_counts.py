@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+Tasktory 쿼리 수 테스트 스크립트
+프로젝트 팀원 조회 API가 팀원 수와 관계없이 일정한 수의 SQL 문으로 처리되는지 확인하는 스크립트
+(임시 SQLite 데이터베이스를 사용하므로 서버 실행이 필요 없습니다)
+
+직접 실행(python test_query_counts.py)하거나 pytest로 실행(pytest test_query_counts.py)할 수 있습니다.
+"""
+import os
+import sys
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, List
+
+# 임시 데이터베이스 사용 (앱 모듈 임포트 전에 설정)
+_temp_dir = tempfile.mkdtemp(prefix="tasktory-query-count-")
+os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(_temp_dir, 'tasktory.db')}"
+os.environ["LLM_CACHE_PATH"] = os.path.join(_temp_dir, "llm_cache.db")
+
+sys.path.append(str(Path(__file__).parent))
+
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+
+from app.main import app
+from app.core.database import SessionLocal, async_engine
+from app.models.project import Project
+from app.models.team import TeamMember, ProjectMember
+
+try:
+    import pytest
+except ImportError:  # 스크립트로 직접 실행할 때는 pytest가 없어도 됨
+    pytest = None
+
+TEAM_SIZES = (1, 5, 50)
+
+ENDPOINTS = (
+    "/api/v1/projects/{project_id}/team-members",
+    "/api/v1/team/projects/{project_id}/members",
+)
+
+@contextmanager
+def count_queries():
+    """블록 안에서 실행된 SQL 문 수 집계"""
+    statements: List[str] = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(async_engine.sync_engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(async_engine.sync_engine, "before_cursor_execute", before_cursor_execute)
+
+def create_project_with_team(team_size: int) -> int:
+    """팀원 team_size명이 투입된 프로젝트 생성"""
+    db = SessionLocal()
+    try:
+        project = Project(name=f"쿼리 수 테스트 ({team_size}명)", description="test")
+        db.add(project)
+        db.flush()
+        for i in range(team_size):
+            member = TeamMember(
+                name=f"팀원{i}",
+                email=f"member{project.id}-{i}@example.com",
+                position="개발자",
+                skills='["Python", "FastAPI"]'
+            )
+            db.add(member)
+            db.flush()
+            db.add(ProjectMember(
+                project_id=project.id,
+                team_member_id=member.id,
+                role="개발",
+                allocation_percentage=100
+            ))
+        db.commit()
+        return project.id
+    finally:
+        db.close()
+
+def measure_query_counts(client: TestClient, endpoint: str) -> Dict[int, int]:
+    """팀원 수별 SQL 문 수 (응답 오류나 팀원 수 불일치는 AssertionError)"""
+    counts: Dict[int, int] = {}
+    for team_size in TEAM_SIZES:
+        project_id = create_project_with_team(team_size)
+        url = endpoint.format(project_id=project_id)
+        with count_queries() as statements:
+            response = client.get(url)
+        assert response.status_code == 200, f"{endpoint}: 상태 코드 {response.status_code}"
+        body = response.json()
+        members = body["team_members"] if isinstance(body, dict) else body
+        assert len(members) == team_size, f"{endpoint}: 팀원 {team_size}명 중 {len(members)}명 조회"
+        counts[team_size] = len(statements)
+    return counts
+
+if pytest is not None:
+    @pytest.fixture(scope="module")
+    def client():
+        """임시 데이터베이스를 사용하는 테스트 클라이언트"""
+        with TestClient(app) as test_client:
+            yield test_client
+
+    @pytest.fixture(params=ENDPOINTS)
+    def endpoint(request) -> str:
+        return request.param
+
+def test_constant_query_count(client: TestClient, endpoint: str):
+    """팀원 수별 SQL 문 수가 동일한지 확인"""
+    counts = measure_query_counts(client, endpoint)
+    expected = counts[TEAM_SIZES[0]]
+    assert counts == {team_size: expected for team_size in TEAM_SIZES}, (
+        f"{endpoint}: 팀원 수에 따라 SQL 수 증가 {counts}"
+    )
+    print(f"✅ {endpoint}: 팀원 수와 관계없이 SQL {expected}회 {counts}")
+
+def main():
+    """메인 테스트 함수"""
+    print("🧪 Tasktory 쿼리 수 테스트 시작")
+    print("=" * 50)
+
+    results = []
+    with TestClient(app) as client:
+        for endpoint in ENDPOINTS:
+            try:
+                test_constant_query_count(client, endpoint)
+                results.append(True)
+            except AssertionError as e:
+                print(f"❌ {e}")
+                results.append(False)
+
+    print("=" * 50)
+    if all(results):
+        print("🎉 모든 쿼리 수 테스트 통과")
+        sys.exit(0)
+    print("⚠️ 일부 쿼리 수 테스트 실패")
+    sys.exit(1)
+
+if __name__ == "__main__":
+    main()